@@ -30,12 +30,79 @@ except Exception as e:
 # AI 의사결정 테스트
 print("\n\n🔬 AI 의사결정 엔진 테스트 실행...")
 try:
-    from tests.test_decision_engine import test_decision_engine
+    from tests.test_decision_engine import (
+        test_decision_engine, test_batch_game_states, test_spatial_queries,
+        test_incremental_engine, test_rule_table,
+        test_objective_scheduler
+    )
     test_decision_engine()
+    test_batch_game_states()
+    test_spatial_queries()
+    test_incremental_engine()
+    test_rule_table()
+    test_objective_scheduler()
     print("✓ AI 의사결정 엔진 테스트 통과")
 except Exception as e:
     print(f"✗ AI 의사결정 엔진 테스트 실패: {e}")
 
+# Riot API 클라이언트 테스트
+print("\n\n🔬 Riot API 클라이언트 테스트 실행...")
+try:
+    from tests.test_riot_client import (
+        test_rate_limiter, test_async_client, test_connection_pooling,
+        test_match_store, test_response_cache, test_retry_policy,
+        test_request_coalescing, test_timeline_streaming
+    )
+    test_rate_limiter()
+    test_async_client()
+    test_connection_pooling()
+    test_match_store()
+    test_response_cache()
+    test_retry_policy()
+    test_request_coalescing()
+    test_timeline_streaming()
+    print("✓ Riot API 클라이언트 테스트 통과")
+except Exception as e:
+    print(f"✗ Riot API 클라이언트 테스트 실패: {e}")
+
+# 리플레이 분석 엔진 테스트
+print("\n\n🔬 리플레이 분석 엔진 테스트 실행...")
+try:
+    from tests.test_replay_analyzer import (
+        test_streaming_analysis, test_timeline_columns, test_roaming_detection,
+        test_positioning, test_zone_grid, test_batch_analysis, test_incremental_analysis,
+        test_pattern_store, test_registered_accumulator, test_participant_index,
+        test_event_index, test_roaming_event_table
+    )
+    test_streaming_analysis()
+    test_timeline_columns()
+    test_roaming_detection()
+    test_positioning()
+    test_zone_grid()
+    test_batch_analysis()
+    test_incremental_analysis()
+    test_pattern_store()
+    test_registered_accumulator()
+    test_participant_index()
+    test_event_index()
+    test_roaming_event_table()
+    print("✓ 리플레이 분석 엔진 테스트 통과")
+except Exception as e:
+    print(f"✗ 리플레이 분석 엔진 테스트 실패: {e}")
+
+# 챌린저 크롤러 테스트
+print("\n\n🔬 챌린저 크롤러 테스트 실행...")
+try:
+    from tests.test_crawler import (
+        test_crawler, test_crawler_truncated_timeline, test_crawler_retry_limit
+    )
+    test_crawler()
+    test_crawler_truncated_timeline()
+    test_crawler_retry_limit()
+    print("✓ 챌린저 크롤러 테스트 통과")
+except Exception as e:
+    print(f"✗ 챌린저 크롤러 테스트 실패: {e}")
+
 print("""
 ╔══════════════════════════════════════════════════════════════╗
 ║                                                              ║
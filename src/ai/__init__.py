@@ -1,3 +1,8 @@
 from .decision_engine import DecisionEngine, GamePhase, Action
+from .game_states import GameStateColumns
+from .incremental import IncrementalDecisionEngine
+from .objectives import ObjectiveScheduler
+from .rules import CompiledRules
 
-__all__ = ['DecisionEngine', 'GamePhase', 'Action']
+__all__ = ['DecisionEngine', 'GamePhase', 'Action', 'GameStateColumns',
+           'IncrementalDecisionEngine', 'CompiledRules', 'ObjectiveScheduler']
@@ -5,9 +5,14 @@ AI 의사결정 엔진
 """
 
 import numpy as np
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterable, List, Tuple, Optional
 from enum import Enum
 
+from .game_states import GameStateColumns
+from .objectives import ObjectiveScheduler
+from .rules import CompiledRules, encode_features, feature_vector
+from .spatial import count_within
+
 
 class GamePhase(Enum):
     """게임 페이즈"""
@@ -33,9 +38,31 @@ class Action(Enum):
 class DecisionEngine:
     """AI 의사결정 엔진"""
 
-    def __init__(self):
-        """의사결정 엔진 초기화"""
+    # 오브젝트 -> (우선순위, 타이밍, 추천), 순서는 next_objective를 고르는 순서
+    OBJECTIVES = {
+        'dragon': (8, 'now', '드래곤 타이밍입니다! 바텀으로 모이세요'),
+        'herald': (6, 'soon', '전령을 확보하여 타워를 밀 수 있습니다'),
+        'baron': (10, 'available', '바론을 노릴 수 있습니다. 시야를 확보하세요')
+    }
+
+    # 주변 아군으로 세는 거리
+    NEARBY_RANGE = 3000
+
+    def __init__(self, rules: Optional[CompiledRules] = None,
+                 objective_scheduler: Optional[ObjectiveScheduler] = None):
+        """
+        의사결정 엔진 초기화
+
+        Args:
+            rules: 추천 행동/문장 규칙 테이블 (없으면 rules.DEFAULT_RULES)
+            objective_scheduler: 오브젝트 등장 일정표 (없으면 처치 기록 없는 기본 일정)
+        """
         self.action_weights = self._initialize_weights()
+        self.rules = rules or CompiledRules.default()
+        self.objective_scheduler = objective_scheduler or ObjectiveScheduler()
+        # priorities 목록 순서 (우선순위 높은 순)
+        self._objective_order = sorted(self.OBJECTIVES, key=lambda name: self.OBJECTIVES[name][0],
+                                       reverse=True)
 
     def _initialize_weights(self) -> Dict:
         """행동별 가중치 초기화"""
@@ -107,6 +134,119 @@ class DecisionEngine:
             'vision_score': vision_analysis
         }
 
+    def analyze_game_states(self, states: GameStateColumns,
+                            objective_scheduler: Optional[ObjectiveScheduler] = None
+                            ) -> Dict[str, np.ndarray]:
+        """
+        여러 게임 상태를 한 번에 분석합니다.
+        상태마다 analyze_game_state와 같은 값을 계산하되, 추천 문장 대신 배열로 반환합니다.
+
+        Args:
+            states: 컬럼형 게임 상태 (GameStateColumns.from_game_states 등으로 생성)
+            objective_scheduler: 이 게임의 오브젝트 일정표 (없으면 self.objective_scheduler)
+
+        Returns:
+            필드 이름 -> (상태 수,) 배열. 추천 행동은
+            'actions' (상태 수, 3) 규칙 번호 (self.rules.rules의 인덱스, 없으면 -1)와
+            'action_priorities' (상태 수, 3)이며, action_list(result, i)로 풀어볼 수 있습니다.
+            'upcoming_objective'는 가장 먼저 등장하는 오브젝트 (OBJECTIVES 인덱스, 없으면 -1),
+            'time_to_spawn'은 그때까지 남은 시간 (초, 이미 등장해 있으면 0)입니다.
+        """
+        scheduler = objective_scheduler or self.objective_scheduler
+        timestamps = states.timestamps
+        minutes = timestamps // 60
+
+        phase = np.where(timestamps < 900, GamePhase.EARLY.value,
+                         np.where(timestamps < 1800, GamePhase.MID.value, GamePhase.LATE.value))
+
+        # 웨이브
+        cs_deficit = minutes * 10 - states.cs
+
+        # 맵 포지션
+        nearby_allies = count_within(states.x, states.y, states.ally_x, states.ally_y,
+                                     self.NEARBY_RANGE)
+        danger_level = states.visible_enemies - nearby_allies
+
+        # 파워 레벨
+        level_diff = states.level - states.enemy_level
+        item_advantage = states.items - states.enemy_items
+        health_advantage = (states.health / states.max_health -
+                            states.enemy_health / states.enemy_max_health)
+        power_score = (level_diff * 2) + item_advantage + (health_advantage * 5)
+
+        # 오브젝트 (OBJECTIVES 순서로 처음 해당하는 것이 다음 오브젝트)
+        alive = {'dragon': states.dragon_alive, 'herald': states.herald_alive,
+                 'baron': states.baron_alive}
+        available = np.stack([alive[name] & scheduler.is_up_many(name, timestamps)
+                              for name in self.OBJECTIVES], axis=1)
+        objective_priorities = np.array([priority for priority, _, _ in self.OBJECTIVES.values()])
+        next_objective = np.where(available.any(axis=1), available.argmax(axis=1), -1)
+        next_priority = np.where(next_objective >= 0, objective_priorities[next_objective], 0)
+
+        # 다음 등장 (동시에 등장하면 OBJECTIVES 순서가 앞선 것)
+        spawn_times = np.stack([scheduler.time_to_spawn_many(name, timestamps)
+                                for name in self.OBJECTIVES], axis=1)
+        time_to_spawn = spawn_times.min(axis=1)
+        upcoming_objective = np.where(np.isfinite(time_to_spawn), spawn_times.argmin(axis=1), -1)
+
+        # 시야
+        vision_deficit = minutes * 1.5 - states.vision_score
+
+        result = {
+            'phase': phase,
+            'cs_deficit': cs_deficit,
+            'should_push': cs_deficit < -10,
+            'should_freeze': cs_deficit > 10,
+            'visible_enemies': states.visible_enemies,
+            'nearby_allies': nearby_allies,
+            'danger_level': danger_level,
+            'is_safe': danger_level < 0,
+            'level_diff': level_diff,
+            'item_advantage': item_advantage,
+            'health_advantage': health_advantage,
+            'power_score': power_score,
+            'can_trade': power_score > 1,
+            'can_all_in': power_score > 3,
+            'next_objective': next_objective,
+            'objective_priority': next_priority,
+            'upcoming_objective': upcoming_objective,
+            'time_to_spawn': time_to_spawn,
+            'vision_deficit': vision_deficit,
+            'needs_more_wards': vision_deficit > 5
+        }
+        result['actions'], result['action_priorities'] = self._decide_actions(result)
+        return result
+
+    def _decide_actions(self, analysis: Dict[str, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        """_decide_action의 배열 버전: 상태별 상위 추천 규칙 번호와 우선순위"""
+        return self.rules.evaluate(encode_features(analysis))
+
+    def action_list(self, analysis: Dict[str, np.ndarray], i: int) -> List[Dict]:
+        """
+        analyze_game_states 결과에서 상태 하나의 추천 행동을
+        analyze_game_state의 recommended_actions 형식으로 꺼냅니다.
+        """
+        next_objective = analysis['next_objective'][i]
+        objective_reason = (self.OBJECTIVES[list(self.OBJECTIVES)[next_objective]][2]
+                            if next_objective >= 0 else None)
+        ranked = [(rule_id, priority) for rule_id, priority
+                  in zip(analysis['actions'][i], analysis['action_priorities'][i]) if rule_id >= 0]
+        return self._rule_actions(ranked, objective_reason)
+
+    def _rule_actions(self, ranked: List[Tuple[int, float]],
+                      objective_reason: Optional[str]) -> List[Dict]:
+        """(규칙 번호, 우선순위) 목록을 추천 행동 딕셔너리 목록으로 바꿉니다."""
+        actions = []
+        for rule_id, priority in ranked:
+            rule = self.rules.rules[rule_id]
+            priority = float(priority)
+            actions.append({
+                'action': rule['action'],
+                'priority': int(priority) if priority.is_integer() else priority,
+                'reason': rule['reason'] if rule['reason'] is not None else objective_reason
+            })
+        return actions
+
     def _get_game_phase(self, timestamp: int) -> GamePhase:
         """게임 페이즈 반환"""
         if timestamp < 900:  # 15분
@@ -140,14 +280,7 @@ class DecisionEngine:
 
     def _get_wave_recommendation(self, cs_deficit: float) -> str:
         """웨이브 관리 추천"""
-        if cs_deficit > 15:
-            return "CS가 부족합니다! 파밍에 집중하세요"
-        elif cs_deficit > 10:
-            return "웨이브를 프리즈하여 안전하게 CS를 확보하세요"
-        elif cs_deficit < -10:
-            return "CS가 앞서고 있습니다. 푸시 후 로밍을 고려하세요"
-        else:
-            return "웨이브 관리가 양호합니다"
+        return self.rules.recommendation('wave', cs_deficit)
 
     def _analyze_map_position(self, game_state: Dict) -> Dict:
         """맵 포지션 분석 (맵 인식)"""
@@ -162,7 +295,7 @@ class DecisionEngine:
 
         # 주변 아군의 수
         nearby_allies = self._count_nearby_units(
-            player_pos, [a.get('position', {}) for a in allies], 3000
+            player_pos, (a.get('position', {}) for a in allies), self.NEARBY_RANGE
         )
 
         # 위험도 계산
@@ -176,31 +309,29 @@ class DecisionEngine:
             'recommendation': self._get_position_recommendation(danger_level)
         }
 
-    def _count_nearby_units(self, pos: Dict, other_positions: List[Dict],
+    def _count_nearby_units(self, pos: Dict, other_positions: Iterable[Dict],
                             range_: int) -> int:
-        """주변 유닛 수 계산"""
-        count = 0
-        px, py = pos.get('x', 0), pos.get('y', 0)
+        """
+        주변 유닛 수 계산
 
+        상태 하나의 아군은 4명뿐이라, 위치를 NumPy 배열로 옮기는 비용이 거리 계산보다
+        큽니다 (spatial.count_within을 거치면 약 6배 느림). 그래서 단일 상태는 제곱 거리를
+        직접 비교하고, 여러 상태를 한꺼번에 분석하는 analyze_game_states만
+        spatial.count_within을 사용합니다.
+        """
+        px, py = pos.get('x', 0), pos.get('y', 0)
+        range_sq = range_ * range_
+        count = 0
         for other_pos in other_positions:
-            ox, oy = other_pos.get('x', 0), other_pos.get('y', 0)
-            distance = np.sqrt((px - ox) ** 2 + (py - oy) ** 2)
-
-            if distance <= range_:
+            dx = px - other_pos.get('x', 0)
+            dy = py - other_pos.get('y', 0)
+            if dx * dx + dy * dy <= range_sq:
                 count += 1
-
         return count
 
     def _get_position_recommendation(self, danger_level: int) -> str:
         """포지셔닝 추천"""
-        if danger_level >= 2:
-            return "⚠️ 위험! 적이 많습니다. 후퇴하세요"
-        elif danger_level == 1:
-            return "⚠️ 주의! 아군 지원 없이 싸우지 마세요"
-        elif danger_level == 0:
-            return "적정 상황입니다"
-        else:
-            return "✓ 안전합니다. 공격적인 플레이 가능"
+        return self.rules.recommendation('position', danger_level)
 
     def _analyze_power_level(self, game_state: Dict) -> Dict:
         """파워 레벨 분석"""
@@ -236,58 +367,47 @@ class DecisionEngine:
 
     def _get_power_recommendation(self, power_score: float) -> str:
         """파워 레벨 기반 추천"""
-        if power_score > 3:
-            return "✓ 올인 가능! 적극적으로 킬을 노리세요"
-        elif power_score > 1:
-            return "✓ 딜교환 유리. 스킬을 활용하여 견제하세요"
-        elif power_score > -1:
-            return "균형 상태. 신중하게 플레이하세요"
-        elif power_score > -3:
-            return "⚠️ 불리한 상황. 안전하게 플레이하세요"
-        else:
-            return "⚠️ 매우 불리! 타워 밑에서 CS만 먹으세요"
+        return self.rules.recommendation('power', power_score)
 
     def _analyze_objective_timing(self, game_state: Dict) -> Dict:
-        """오브젝트 타이밍 분석"""
-        timestamp = game_state.get('timestamp', 0)
-        objectives = game_state.get('objectives', {})
+        """오브젝트 타이밍 분석 (등장 구간은 objective_scheduler 기준)"""
+        available = dict(zip(self.OBJECTIVES, self._objective_window_key(game_state)))
+        # next_objective는 OBJECTIVES 순서로 처음 등장해 있는 오브젝트
+        next_objective = next((name for name in self.OBJECTIVES if available[name]), None)
 
-        dragon_alive = objectives.get('dragon_alive', True)
-        baron_alive = objectives.get('baron_alive', True)
-        herald_alive = objectives.get('herald_alive', True)
-
-        priorities = []
+        return {
+            'priorities': [self._objective_priority(name)
+                           for name in self._objective_order if available[name]],
+            'next_objective': self._objective_priority(next_objective) if next_objective else None
+        }
 
-        # 드래곤 타이밍 (5분마다)
-        if dragon_alive and timestamp >= 300 and timestamp % 300 < 60:
-            priorities.append({
-                'type': 'dragon',
-                'priority': 8,
-                'timing': 'now',
-                'recommendation': '드래곤 타이밍입니다! 바텀으로 모이세요'
-            })
+    def _objective_window_key(self, game_state: Dict) -> Tuple:
+        """
+        _analyze_objective_timing의 결과를 결정하는 값 (OBJECTIVES 순서로 등장해 있는지)
+        타임스탬프는 오브젝트 구간 경계를 넘을 때만 바뀝니다.
+        """
+        timestamp = game_state.get('timestamp', 0)
+        objectives = game_state.get('objectives', {})
+        is_up = self.objective_scheduler.is_up
+        return tuple(objectives.get(f'{name}_alive', True) and is_up(name, timestamp)
+                     for name in self.OBJECTIVES)
 
-        # 전령 타이밍 (6-14분)
-        if herald_alive and 360 <= timestamp <= 840:
-            priorities.append({
-                'type': 'herald',
-                'priority': 6,
-                'timing': 'soon',
-                'recommendation': '전령을 확보하여 타워를 밀 수 있습니다'
-            })
+    def next_objective_spawn(self, timestamp: float) -> Optional[Tuple[str, float]]:
+        """
+        가장 먼저 등장하는 오브젝트와 남은 시간 (초, 이미 등장해 있으면 0)
 
-        # 바론 타이밍 (20분 이후)
-        if baron_alive and timestamp >= 1200:
-            priorities.append({
-                'type': 'baron',
-                'priority': 10,
-                'timing': 'available',
-                'recommendation': '바론을 노릴 수 있습니다. 시야를 확보하세요'
-            })
+        Returns:
+            (오브젝트 이름, 남은 시간) - 더 등장할 오브젝트가 없으면 None
+        """
+        return self.objective_scheduler.next_spawn(timestamp)
 
+    def _objective_priority(self, objective_type: str) -> Dict:
+        priority, timing, recommendation = self.OBJECTIVES[objective_type]
         return {
-            'priorities': sorted(priorities, key=lambda x: x['priority'], reverse=True),
-            'next_objective': priorities[0] if priorities else None
+            'type': objective_type,
+            'priority': priority,
+            'timing': timing,
+            'recommendation': recommendation
         }
 
     def _analyze_vision(self, game_state: Dict) -> Dict:
@@ -308,97 +428,19 @@ class DecisionEngine:
 
     def _get_vision_recommendation(self, vision_deficit: float) -> str:
         """시야 점수 기반 추천"""
-        if vision_deficit > 10:
-            return "⚠️ 시야가 매우 부족합니다! 와드를 더 설치하세요"
-        elif vision_deficit > 5:
-            return "시야 점수가 낮습니다. 와드를 설치하세요"
-        elif vision_deficit < -5:
-            return "✓ 훌륭한 시야 관리입니다!"
-        else:
-            return "적정한 시야 점수입니다"
+        return self.rules.recommendation('vision', vision_deficit)
 
     def _decide_action(self, phase: GamePhase, wave: Dict, position: Dict,
                        power: Dict, objective: Dict, vision: Dict) -> List[Dict]:
-        """최적의 행동 결정"""
-        actions = []
-
-        # 1. 위험도 확인
-        if position['danger_level'] >= 2:
-            actions.append({
-                'action': Action.RECALL.value,
-                'priority': 10,
-                'reason': '위험한 상황 - 후퇴 필요'
-            })
-            return actions
-
-        # 2. 오브젝트 우선순위
-        if objective['next_objective']:
-            obj = objective['next_objective']
-            if obj['priority'] >= 8:
-                actions.append({
-                    'action': Action.OBJECTIVE.value,
-                    'priority': obj['priority'],
-                    'reason': obj['recommendation']
-                })
-
-        # 3. 파워 레벨 기반 행동
-        if power['can_all_in']:
-            actions.append({
-                'action': Action.TRADE.value,
-                'priority': 8,
-                'reason': '올인 가능한 상황'
-            })
-        elif power['can_trade']:
-            actions.append({
-                'action': Action.TRADE.value,
-                'priority': 6,
-                'reason': '딜교환 유리'
-            })
-
-        # 4. 웨이브 상태 기반
-        if wave['should_push']:
-            actions.append({
-                'action': Action.PUSH.value,
-                'priority': 5,
-                'reason': '웨이브 푸시 후 로밍'
-            })
-        elif wave['should_freeze']:
-            actions.append({
-                'action': Action.FREEZE.value,
-                'priority': 7,
-                'reason': 'CS 부족 - 프리즈로 안전 파밍'
-            })
-
-        # 5. 페이즈별 행동
-        if phase == GamePhase.EARLY:
-            if wave['cs_deficit'] > 10:
-                actions.append({
-                    'action': Action.FARM.value,
-                    'priority': 9,
-                    'reason': '초반 CS 확보 중요'
-                })
-        elif phase == GamePhase.MID:
-            actions.append({
-                'action': Action.ROAM.value,
-                'priority': 7,
-                'reason': '중반 로밍으로 영향력 확대'
-            })
-        elif phase == GamePhase.LATE:
-            actions.append({
-                'action': Action.TEAMFIGHT.value,
-                'priority': 9,
-                'reason': '후반 한타 중요'
-            })
-
-        # 6. 시야 부족 시
-        if vision['needs_more_wards']:
-            actions.append({
-                'action': 'ward',
-                'priority': 6,
-                'reason': '시야 확보 필요'
-            })
-
-        # 우선순위 정렬
-        actions.sort(key=lambda x: x['priority'], reverse=True)
-
-        return actions[:3]  # 상위 3개 행동 반환
+        """최적의 행동 결정 (규칙 테이블로 상위 3개 행동 선택)"""
+        next_objective = objective['next_objective']
+        features = feature_vector({
+            'phase': phase.value,
+            'cs_deficit': wave['cs_deficit'],
+            'danger_level': position['danger_level'],
+            'power_score': power['power_score'],
+            'objective_priority': next_objective['priority'] if next_objective else 0,
+            'vision_deficit': vision['vision_deficit']
+        })
+        return self._rule_actions(self.rules.evaluate_one(features),
+                                  next_objective['recommendation'] if next_objective else None)
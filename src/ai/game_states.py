@@ -0,0 +1,140 @@
+"""
+컬럼형 게임 상태
+여러 게임 상태를 필드별 NumPy 배열로 모읍니다.
+DecisionEngine.analyze_game_states가 딕셔너리 대신 이 배열을 한 번에 처리합니다.
+"""
+
+import numpy as np
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional
+
+
+@dataclass
+class GameStateColumns:
+    """
+    컬럼형 게임 상태
+
+    상태별 값은 모두 (상태 수,) 배열이고, 아군 위치는 (상태 수, 최대 아군 수) 배열이며
+    아군이 없는 칸은 NaN입니다. 각 필드의 의미와 기본값은 analyze_game_state의
+    game_state 딕셔너리와 같습니다.
+    """
+    timestamps: np.ndarray  # 게임 시간 (초)
+    cs: np.ndarray
+    level: np.ndarray
+    items: np.ndarray  # 아이템 개수
+    health: np.ndarray
+    max_health: np.ndarray
+    vision_score: np.ndarray
+    x: np.ndarray
+    y: np.ndarray
+    ally_x: np.ndarray
+    ally_y: np.ndarray
+    visible_enemies: np.ndarray  # 보이는 적 수
+    enemy_level: np.ndarray
+    enemy_items: np.ndarray
+    enemy_health: np.ndarray
+    enemy_max_health: np.ndarray
+    dragon_alive: np.ndarray
+    baron_alive: np.ndarray
+    herald_alive: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @classmethod
+    def from_arrays(cls, timestamps, ally_x: Optional[np.ndarray] = None,
+                    ally_y: Optional[np.ndarray] = None, **fields) -> 'GameStateColumns':
+        """
+        필드별 배열에서 만듭니다. 빠진 필드는 analyze_game_state의 기본값으로 채웁니다.
+
+        Args:
+            timestamps: 게임 시간 (초)
+            ally_x, ally_y: (상태 수, 아군 수) 아군 위치 (없으면 아군 없음)
+            fields: 나머지 필드 (스칼라를 넘기면 모든 상태에 같은 값)
+        """
+        timestamps = np.asarray(timestamps)
+        n = len(timestamps)
+        defaults = {
+            'cs': 0, 'level': 1, 'items': 0, 'health': 100, 'max_health': 100,
+            'vision_score': 0, 'x': 0, 'y': 0, 'visible_enemies': 0,
+            'enemy_level': 1, 'enemy_items': 0, 'enemy_health': 100, 'enemy_max_health': 100,
+            'dragon_alive': True, 'baron_alive': True, 'herald_alive': True
+        }
+        unknown = set(fields) - set(defaults)
+        if unknown:
+            raise ValueError(f"알 수 없는 필드: {', '.join(sorted(unknown))}")
+
+        values = {
+            name: np.broadcast_to(np.asarray(fields.get(name, default)), (n,)).copy()
+            for name, default in defaults.items()
+        }
+        empty = np.zeros((n, 0))
+        return cls(
+            timestamps=timestamps,
+            ally_x=np.asarray(ally_x, dtype=float) if ally_x is not None else empty,
+            ally_y=np.asarray(ally_y, dtype=float) if ally_y is not None else empty,
+            **values
+        )
+
+    @classmethod
+    def from_game_states(cls, game_states: Iterable[Dict]) -> 'GameStateColumns':
+        """analyze_game_state 형식의 게임 상태 딕셔너리들에서 만듭니다."""
+        rows = []
+        ally_positions = []
+        for game_state in game_states:
+            player = game_state.get('player', {})
+            lane_enemy = game_state.get('lane_enemy', {})
+            objectives = game_state.get('objectives', {})
+            position = player.get('position', {'x': 0, 'y': 0})
+            rows.append((
+                game_state.get('timestamp', 0),
+                player.get('cs', 0),
+                player.get('level', 1),
+                len(player.get('items', [])),
+                player.get('health', 100),
+                player.get('max_health', 100),
+                player.get('vision_score', 0),
+                position.get('x', 0),
+                position.get('y', 0),
+                sum(1 for enemy in game_state.get('enemies', []) if enemy.get('visible', False)),
+                lane_enemy.get('level', 1),
+                len(lane_enemy.get('items', [])),
+                lane_enemy.get('health', 100),
+                lane_enemy.get('max_health', 100),
+                objectives.get('dragon_alive', True),
+                objectives.get('baron_alive', True),
+                objectives.get('herald_alive', True)
+            ))
+            ally_positions.append([
+                (ally.get('position', {}).get('x', 0), ally.get('position', {}).get('y', 0))
+                for ally in game_state.get('allies', [])
+            ])
+
+        n_allies = max((len(positions) for positions in ally_positions), default=0)
+        allies = np.full((len(rows), n_allies, 2), np.nan)
+        for i, positions in enumerate(ally_positions):
+            if positions:
+                allies[i, :len(positions)] = positions
+
+        columns = list(zip(*rows)) if rows else [()] * 17
+        return cls(
+            timestamps=np.asarray(columns[0]),
+            cs=np.asarray(columns[1]),
+            level=np.asarray(columns[2]),
+            items=np.asarray(columns[3], dtype=np.int64),
+            health=np.asarray(columns[4], dtype=float),
+            max_health=np.asarray(columns[5], dtype=float),
+            vision_score=np.asarray(columns[6]),
+            x=np.asarray(columns[7], dtype=float),
+            y=np.asarray(columns[8], dtype=float),
+            ally_x=allies[:, :, 0],
+            ally_y=allies[:, :, 1],
+            visible_enemies=np.asarray(columns[9], dtype=np.int64),
+            enemy_level=np.asarray(columns[10]),
+            enemy_items=np.asarray(columns[11], dtype=np.int64),
+            enemy_health=np.asarray(columns[12], dtype=float),
+            enemy_max_health=np.asarray(columns[13], dtype=float),
+            dragon_alive=np.asarray(columns[14], dtype=bool),
+            baron_alive=np.asarray(columns[15], dtype=bool),
+            herald_alive=np.asarray(columns[16], dtype=bool)
+        )
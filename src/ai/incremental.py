@@ -0,0 +1,124 @@
+"""
+증분 의사결정 엔진
+실시간 게임 상태는 매 틱마다 조금씩만 바뀌므로, 바뀐 값에 의존하는 분석만 다시 계산하고
+바뀐 결과만 내보냅니다. 게임 클라이언트 옆에서 높은 틱 속도로 돌리기 위한 엔진입니다.
+"""
+
+import copy
+from typing import Dict, Hashable, Optional, Tuple
+
+from .decision_engine import DecisionEngine
+from .objectives import ObjectiveScheduler
+
+
+def _merge(state: Dict, delta: Dict):
+    """
+    delta를 state에 덮어씁니다. 딕셔너리는 재귀적으로 합치고 그 외 값(목록 등)은 바꿉니다.
+    호출한 쪽이 나중에 값을 고쳐도 캐시가 어긋나지 않도록 복사해서 넣습니다.
+    """
+    for key, value in delta.items():
+        if isinstance(value, dict) and isinstance(state.get(key), dict):
+            _merge(state[key], value)
+        else:
+            state[key] = copy.deepcopy(value)
+
+
+def _position(position: Dict) -> tuple:
+    return position.get('x', 0), position.get('y', 0)
+
+
+class IncrementalDecisionEngine(DecisionEngine):
+    """
+    update(delta)로 상태 변화를 받는 상태형 의사결정 엔진
+
+    세부 분석마다 결과를 결정하는 입력 키를 두고, 키가 바뀐 분석만 다시 계산합니다.
+    현재 전체 분석 결과는 analysis 속성에 있으며 analyze_game_state(state)와 같습니다.
+    """
+
+    # 세부 분석 -> (분석 메서드, 입력 키 메서드)
+    ANALYSES = {
+        'wave_state': ('_analyze_wave_state', '_wave_key'),
+        'map_position': ('_analyze_map_position', '_position_key'),
+        'power_level': ('_analyze_power_level', '_power_key'),
+        'objective_priority': ('_analyze_objective_timing', '_objective_window_key'),
+        'vision_score': ('_analyze_vision', '_vision_key')
+    }
+
+    def __init__(self, game_state: Optional[Dict] = None,
+                 objective_scheduler: Optional[ObjectiveScheduler] = None):
+        """
+        Args:
+            game_state: 처음 게임 상태 (없으면 빈 상태)
+            objective_scheduler: 오브젝트 등장 일정표 (record_kill로 추가한 처치는 다음 update부터 반영)
+        """
+        super().__init__(objective_scheduler=objective_scheduler)
+        self.reset(game_state)
+
+    def reset(self, game_state: Optional[Dict] = None):
+        """상태와 캐시를 모두 지웁니다."""
+        self.state: Dict = {}
+        self.analysis: Dict = {}
+        self._keys: Dict[str, Hashable] = {}
+        self.recompute_counts = dict.fromkeys(self.ANALYSES, 0)
+        self.update(game_state or {})
+
+    def update(self, delta: Dict) -> Dict:
+        """
+        게임 상태 변화를 반영합니다.
+
+        Args:
+            delta: 바뀐 값만 담은 게임 상태 (analyze_game_state 형식, 중첩 딕셔너리는 합쳐짐)
+
+        Returns:
+            이전 결과와 달라진 항목만 담은 analyze_game_state 형식의 딕셔너리
+        """
+        _merge(self.state, delta)
+        changes = {}
+
+        phase = self._get_game_phase(self.state.get('timestamp', 0))
+        if self.analysis.get('phase') != phase.value:
+            changes['phase'] = phase.value
+
+        for name, (method, key_method) in self.ANALYSES.items():
+            key = getattr(self, key_method)(self.state)
+            if name in self.analysis and self._keys[name] == key:
+                continue
+            self._keys[name] = key
+            self.recompute_counts[name] += 1
+            result = getattr(self, method)(self.state)
+            if self.analysis.get(name) != result:
+                changes[name] = result
+
+        if changes:
+            self.analysis.update(changes)
+            actions = self._decide_action(
+                phase, self.analysis['wave_state'], self.analysis['map_position'],
+                self.analysis['power_level'], self.analysis['objective_priority'],
+                self.analysis['vision_score']
+            )
+            if self.analysis.get('recommended_actions') != actions:
+                changes['recommended_actions'] = self.analysis['recommended_actions'] = actions
+
+        return changes
+
+    def _wave_key(self, game_state: Dict) -> Tuple:
+        return (game_state.get('timestamp', 0) // 60,
+                game_state.get('player', {}).get('cs', 0))
+
+    def _position_key(self, game_state: Dict) -> Tuple:
+        return (
+            _position(game_state.get('player', {}).get('position', {'x': 0, 'y': 0})),
+            tuple(_position(ally.get('position', {})) for ally in game_state.get('allies', [])),
+            sum(1 for enemy in game_state.get('enemies', []) if enemy.get('visible', False))
+        )
+
+    def _power_key(self, game_state: Dict) -> Tuple:
+        return tuple(
+            (unit.get('level', 1), len(unit.get('items', [])),
+             unit.get('health', 100), unit.get('max_health', 100))
+            for unit in (game_state.get('player', {}), game_state.get('lane_enemy', {}))
+        )
+
+    def _vision_key(self, game_state: Dict) -> Tuple:
+        return (game_state.get('timestamp', 0) // 60,
+                game_state.get('player', {}).get('vision_score', 0))
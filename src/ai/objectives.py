@@ -0,0 +1,158 @@
+"""
+오브젝트 일정표
+드래곤/전령/바론이 등장해 있는 구간을 처치 기록으로부터 미리 계산해 두고,
+임의의 시각에 대해 "지금 등장해 있는지", "다음 오브젝트와 등장까지 남은 시간"을
+이진 탐색으로 답합니다. 실시간 조언(시각 하나)과 타임라인 전체 백테스트(시각 배열)에
+같은 일정표를 씁니다.
+"""
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class SpawnRule:
+    """오브젝트 하나의 등장 규칙 (초)"""
+    first_spawn: float
+    duration: float  # 등장 후 추천 구간 길이 (처치되면 그 전에 끝남)
+    period: Optional[float]  # 처치 기록이 없을 때 다시 등장한다고 보는 간격 (None이면 계속 등장해 있음)
+    respawn: float  # 처치 후 다시 등장하기까지의 시간
+    despawn: float = np.inf  # 이 시각 이후로는 등장하지 않음 (구간 끝은 이 시각 미만)
+
+
+# 처치 기록이 없으면 DecisionEngine의 기존 구간과 같습니다
+# (드래곤 5분부터 5분마다 1분, 전령 6~14분, 바론 20분 이후)
+SPAWN_RULES: Dict[str, SpawnRule] = {
+    'dragon': SpawnRule(first_spawn=300, duration=60, period=300, respawn=300),
+    # 14분(840초) 정각까지 포함하도록 끝을 840 바로 다음 실수로 둡니다
+    'herald': SpawnRule(first_spawn=360, duration=np.inf, period=None, respawn=360,
+                        despawn=float(np.nextafter(840, np.inf))),
+    'baron': SpawnRule(first_spawn=1200, duration=np.inf, period=None, respawn=360)
+}
+
+# Riot 타임라인 ELITE_MONSTER_KILL의 monsterType -> 오브젝트 이름
+MONSTER_TYPES = {
+    'DRAGON': 'dragon',
+    'RIFTHERALD': 'herald',
+    'BARON_NASHOR': 'baron'
+}
+
+
+class ObjectiveScheduler:
+    """
+    오브젝트별 등장 구간 [start, end) 일정표
+
+    구간은 시작 시각순으로 정렬된 배열이며, 처치 기록을 추가하면 그 오브젝트의 구간만
+    다시 계산합니다. 일정은 horizon초까지만 만듭니다.
+    """
+
+    def __init__(self, kills: Iterable[Tuple[str, float]] = (),
+                 rules: Optional[Dict[str, SpawnRule]] = None, horizon: float = 3 * 3600):
+        """
+        Args:
+            kills: (오브젝트 이름, 처치 시각(초)) 목록
+            rules: 오브젝트별 등장 규칙 (없으면 SPAWN_RULES)
+            horizon: 일정을 만들 마지막 시각 (초)
+        """
+        self.rules = dict(rules or SPAWN_RULES)
+        self.horizon = horizon
+        self.kills: Dict[str, List[float]] = {name: [] for name in self.rules}
+        for name, timestamp in kills:
+            self.kills[name].append(timestamp)
+
+        self.starts: Dict[str, List[float]] = {}
+        self.ends: Dict[str, List[float]] = {}
+        for name in self.rules:
+            self._build(name)
+
+    @classmethod
+    def from_timeline_events(cls, events: Iterable[Dict], **kwargs) -> 'ObjectiveScheduler':
+        """Riot 타임라인 이벤트(ELITE_MONSTER_KILL, 밀리초)에서 처치 기록을 읽어 만듭니다."""
+        kills = [
+            (MONSTER_TYPES[event['monsterType']], event.get('timestamp', 0) / 1000)
+            for event in events
+            if event.get('type') == 'ELITE_MONSTER_KILL' and event.get('monsterType') in MONSTER_TYPES
+        ]
+        return cls(kills, **kwargs)
+
+    def record_kill(self, objective: str, timestamp: float):
+        """처치 기록을 추가하고 그 오브젝트의 일정을 다시 계산합니다."""
+        self.kills[objective].append(timestamp)
+        self._build(objective)
+
+    def _build(self, name: str):
+        rule = self.rules[name]
+        kills = sorted(self.kills[name])
+        starts, ends = [], []
+
+        spawn, k = rule.first_spawn, 0
+        while spawn < min(self.horizon, rule.despawn):
+            # 등장 전의 처치 기록은 이 등장과 관계없음
+            while k < len(kills) and kills[k] < spawn:
+                k += 1
+            end = min(spawn + rule.duration, rule.despawn)
+            next_nominal = spawn + rule.period if rule.period is not None else np.inf
+
+            if k < len(kills) and kills[k] < next_nominal:
+                end = min(end, kills[k])
+                next_spawn = kills[k] + rule.respawn
+                k += 1
+            else:
+                next_spawn = next_nominal
+
+            if end > spawn:
+                starts.append(spawn)
+                ends.append(end)
+            spawn = next_spawn
+
+        self.starts[name] = starts
+        self.ends[name] = ends
+
+    def is_up(self, objective: str, timestamp: float) -> bool:
+        """timestamp에 오브젝트가 등장 구간 안에 있는지"""
+        starts = self.starts[objective]
+        i = bisect_right(starts, timestamp) - 1
+        return i >= 0 and timestamp < self.ends[objective][i]
+
+    def time_to_spawn(self, objective: str, timestamp: float) -> Optional[float]:
+        """다음 등장까지 남은 시간 (초, 등장해 있으면 0, 더 이상 등장하지 않으면 None)"""
+        if self.is_up(objective, timestamp):
+            return 0.0
+        starts = self.starts[objective]
+        i = bisect_right(starts, timestamp)
+        return starts[i] - timestamp if i < len(starts) else None
+
+    def next_spawn(self, timestamp: float) -> Optional[Tuple[str, float]]:
+        """
+        가장 먼저 등장하는(또는 이미 등장해 있는) 오브젝트와 남은 시간
+
+        Returns:
+            (오브젝트 이름, 남은 시간(초)) - 남은 오브젝트가 없으면 None
+            동시에 등장하면 rules 순서가 앞선 오브젝트
+        """
+        best = None
+        for name in self.rules:
+            remaining = self.time_to_spawn(name, timestamp)
+            if remaining is not None and (best is None or remaining < best[1]):
+                best = (name, remaining)
+        return best
+
+    def is_up_many(self, objective: str, timestamps) -> np.ndarray:
+        """is_up의 배열 버전"""
+        timestamps = np.asarray(timestamps)
+        starts = np.asarray(self.starts[objective])
+        ends = np.asarray(self.ends[objective])
+        if not len(starts):
+            return np.zeros(timestamps.shape, dtype=bool)
+        i = np.searchsorted(starts, timestamps, side='right') - 1
+        return (i >= 0) & (timestamps < ends[np.maximum(i, 0)])
+
+    def time_to_spawn_many(self, objective: str, timestamps) -> np.ndarray:
+        """time_to_spawn의 배열 버전 (더 이상 등장하지 않으면 inf)"""
+        timestamps = np.asarray(timestamps, dtype=float)
+        starts = np.append(np.asarray(self.starts[objective], dtype=float), np.inf)
+        i = np.searchsorted(starts, timestamps, side='right')
+        return np.where(self.is_up_many(objective, timestamps), 0.0, starts[i] - timestamps)
@@ -0,0 +1,347 @@
+"""
+규칙 테이블
+추천 행동과 추천 문장을 코드의 if/elif 대신 데이터(딕셔너리 목록)로 정의하고,
+한 번 컴파일해 임계값 배열과 우선순위 행렬로 만들어 둡니다.
+상태 하나든 여러 개든 같은 배열 연산으로 평가하며,
+규칙은 JSON 파일 등에서 불러와 코드 수정 없이 바꾸거나 조정할 수 있습니다.
+
+규칙 형식:
+    {'action': 'farm', 'priority': 9, 'reason': '초반 CS 확보 중요',
+     'when': {'phase': ('==', 'early'), 'cs_deficit': ('>', 10)}}
+
+    - when: 특징 -> (연산자, 값) 또는 그 목록, 모두 만족해야 발동 (없으면 항상 발동)
+    - priority: 숫자, 또는 우선순위로 쓸 특징 이름
+    - reason: 문장 (None이면 다음 오브젝트의 추천 문장)
+    - exclusive: True면 발동할 때 이 규칙만 추천 (예: 위험하면 귀환만)
+
+추천 문장 형식: 이름 -> {'feature': 특징, 'cases': [(연산자, 값, 문장), ...], 'default': 문장}
+    (위에서부터 처음 만족하는 문장 사용)
+"""
+
+import json
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+# 규칙에서 쓸 수 있는 특징 (analyze_game_state 결과에서 계산)
+FEATURES = ('phase', 'cs_deficit', 'danger_level', 'power_score', 'objective_priority',
+            'vision_deficit')
+
+# 범주형 특징의 값 -> 코드
+CATEGORIES = {
+    'phase': ('early', 'mid', 'late')
+}
+
+OPERATORS = ('==', '>', '>=', '<', '<=')
+
+Condition = Tuple[str, Union[int, float, str]]
+
+DEFAULT_RULES: List[Dict] = [
+    {'action': 'recall', 'priority': 10, 'reason': '위험한 상황 - 후퇴 필요',
+     'when': {'danger_level': ('>=', 2)}, 'exclusive': True},
+    {'action': 'objective', 'priority': 'objective_priority', 'reason': None,
+     'when': {'objective_priority': ('>=', 8)}},
+    {'action': 'trade', 'priority': 8, 'reason': '올인 가능한 상황',
+     'when': {'power_score': ('>', 3)}},
+    {'action': 'trade', 'priority': 6, 'reason': '딜교환 유리',
+     'when': {'power_score': [('>', 1), ('<=', 3)]}},
+    {'action': 'push', 'priority': 5, 'reason': '웨이브 푸시 후 로밍',
+     'when': {'cs_deficit': ('<', -10)}},
+    {'action': 'freeze', 'priority': 7, 'reason': 'CS 부족 - 프리즈로 안전 파밍',
+     'when': {'cs_deficit': ('>', 10)}},
+    {'action': 'farm', 'priority': 9, 'reason': '초반 CS 확보 중요',
+     'when': {'phase': ('==', 'early'), 'cs_deficit': ('>', 10)}},
+    {'action': 'roam', 'priority': 7, 'reason': '중반 로밍으로 영향력 확대',
+     'when': {'phase': ('==', 'mid')}},
+    {'action': 'teamfight', 'priority': 9, 'reason': '후반 한타 중요',
+     'when': {'phase': ('==', 'late')}},
+    {'action': 'ward', 'priority': 6, 'reason': '시야 확보 필요',
+     'when': {'vision_deficit': ('>', 5)}}
+]
+
+DEFAULT_RECOMMENDATIONS: Dict[str, Dict] = {
+    'wave': {
+        'feature': 'cs_deficit',
+        'cases': [
+            ('>', 15, "CS가 부족합니다! 파밍에 집중하세요"),
+            ('>', 10, "웨이브를 프리즈하여 안전하게 CS를 확보하세요"),
+            ('<', -10, "CS가 앞서고 있습니다. 푸시 후 로밍을 고려하세요")
+        ],
+        'default': "웨이브 관리가 양호합니다"
+    },
+    'position': {
+        'feature': 'danger_level',
+        'cases': [
+            ('>=', 2, "⚠️ 위험! 적이 많습니다. 후퇴하세요"),
+            ('==', 1, "⚠️ 주의! 아군 지원 없이 싸우지 마세요"),
+            ('==', 0, "적정 상황입니다")
+        ],
+        'default': "✓ 안전합니다. 공격적인 플레이 가능"
+    },
+    'power': {
+        'feature': 'power_score',
+        'cases': [
+            ('>', 3, "✓ 올인 가능! 적극적으로 킬을 노리세요"),
+            ('>', 1, "✓ 딜교환 유리. 스킬을 활용하여 견제하세요"),
+            ('>', -1, "균형 상태. 신중하게 플레이하세요"),
+            ('>', -3, "⚠️ 불리한 상황. 안전하게 플레이하세요")
+        ],
+        'default': "⚠️ 매우 불리! 타워 밑에서 CS만 먹으세요"
+    },
+    'vision': {
+        'feature': 'vision_deficit',
+        'cases': [
+            ('>', 10, "⚠️ 시야가 매우 부족합니다! 와드를 더 설치하세요"),
+            ('>', 5, "시야 점수가 낮습니다. 와드를 설치하세요"),
+            ('<', -5, "✓ 훌륭한 시야 관리입니다!")
+        ],
+        'default': "적정한 시야 점수입니다"
+    }
+}
+
+
+def _unknown_category(feature: str, value) -> ValueError:
+    return ValueError(f"알 수 없는 {feature} 값: {value!r} (가능한 값: {CATEGORIES[feature]})")
+
+
+def _feature_index(feature: str) -> int:
+    if feature not in FEATURES:
+        raise ValueError(f"알 수 없는 특징: {feature!r} (가능한 특징: {FEATURES})")
+    return FEATURES.index(feature)
+
+
+def _encode(feature: str, value) -> float:
+    """특징 값을 숫자로 변환합니다 (범주형은 코드)."""
+    if feature in CATEGORIES:
+        if value not in CATEGORIES[feature]:
+            raise _unknown_category(feature, value)
+        return float(CATEGORIES[feature].index(value))
+    return float(value)
+
+
+def _conditions(spec) -> List[Condition]:
+    """(연산자, 값) 하나 또는 그 목록을 목록으로 맞춥니다 (JSON의 리스트도 허용)."""
+    if spec and isinstance(spec[0], str):
+        return [tuple(spec)]
+    return [tuple(condition) for condition in spec]
+
+
+def _bounds(conditions: Sequence[Tuple[str, float]]) -> Tuple[float, bool, float, bool]:
+    """
+    조건들을 모두 만족하는 구간으로 바꿉니다.
+
+    Returns:
+        (lower, lower_closed, upper, upper_closed)
+    """
+    lower, lower_closed, upper, upper_closed = -np.inf, True, np.inf, True
+    for op, value in conditions:
+        if op not in OPERATORS:
+            raise ValueError(f"알 수 없는 연산자: {op}")
+        if op in ('==', '>', '>='):
+            closed = op != '>'
+            if value > lower or (value == lower and not closed):
+                lower, lower_closed = value, closed
+        if op in ('==', '<', '<='):
+            closed = op != '<'
+            if value < upper or (value == upper and not closed):
+                upper, upper_closed = value, closed
+    return lower, lower_closed, upper, upper_closed
+
+
+def _in_bounds(x: np.ndarray, lower, lower_closed, upper, upper_closed) -> np.ndarray:
+    above = (x > lower) | (lower_closed & (x == lower))
+    below = (x < upper) | (upper_closed & (x == upper))
+    return above & below
+
+
+def feature_vector(values: Mapping[str, object]) -> List[float]:
+    """상태 하나의 특징 이름 -> 값을 FEATURES 순서의 숫자 목록으로 만듭니다."""
+    return [_encode(feature, values[feature]) for feature in FEATURES]
+
+
+def encode_features(values: Mapping[str, object]) -> np.ndarray:
+    """
+    특징 이름 -> 값(스칼라 또는 (상태 수,) 배열)을 (상태 수, 특징 수) 행렬로 만듭니다.
+    범주형 특징은 CATEGORIES 순서의 코드로 바꾸며, 목록에 없는 값이면 ValueError입니다.
+    """
+    columns = []
+    for feature in FEATURES:
+        value = np.atleast_1d(values[feature])
+        if feature in CATEGORIES:
+            categories = np.array(CATEGORIES[feature])
+            order = np.argsort(categories)
+            positions = np.minimum(np.searchsorted(categories[order], value), len(order) - 1)
+            codes = order[positions]
+            unknown = categories[codes] != value
+            if unknown.any():
+                raise _unknown_category(feature, value[unknown.argmax()])
+            value = codes
+        columns.append(value.astype(float))
+    return np.stack(columns, axis=1)
+
+
+class CompiledRules:
+    """
+    컴파일된 규칙 테이블
+
+    규칙의 조건은 특징별 구간 [lower, upper] (경계 포함 여부 별도)으로 바꿔
+    (규칙 수, 특징 수) 임계값 배열에 저장합니다.
+    """
+
+    def __init__(self, rules: Sequence[Dict],
+                 recommendations: Optional[Mapping[str, Dict]] = None, top_k: int = 3):
+        """
+        Args:
+            rules: 규칙 목록 (순서는 우선순위가 같을 때의 순서)
+            recommendations: 추천 문장 규칙
+            top_k: 추천할 최대 행동 수
+        """
+        self.rules = [dict(rule) for rule in rules]
+        self.top_k = top_k
+        n_rules, n_features = len(self.rules), len(FEATURES)
+
+        self.lower = np.full((n_rules, n_features), -np.inf)
+        self.upper = np.full((n_rules, n_features), np.inf)
+        self.lower_closed = np.ones((n_rules, n_features), dtype=bool)
+        self.upper_closed = np.ones((n_rules, n_features), dtype=bool)
+        self.priorities = np.zeros(n_rules)
+        self.priority_features = np.full(n_rules, -1)
+        self.exclusive = np.zeros(n_rules, dtype=bool)
+
+        for r, rule in enumerate(self.rules):
+            try:
+                self._compile_rule(r, rule)
+            except (KeyError, TypeError, ValueError) as e:
+                raise ValueError(f"규칙 {r} ({rule.get('action')}) 오류: {e}") from e
+
+        # 상태 하나를 평가할 때는 배열 대신 조건이 있는 특징의 구간만 차례로 확인합니다
+        self._rule_checks = [
+            [(int(f), float(self.lower[r, f]), bool(self.lower_closed[r, f]),
+              float(self.upper[r, f]), bool(self.upper_closed[r, f]))
+             for f in np.flatnonzero(np.isfinite(self.lower[r]) | np.isfinite(self.upper[r]))]
+            for r in range(n_rules)
+        ]
+        self._rule_priorities = [
+            (int(f), None) if f >= 0 else (None, float(p))
+            for f, p in zip(self.priority_features, self.priorities)
+        ]
+        self._exclusive = self.exclusive.tolist()
+
+        # 추천 문장 규칙: 이름 -> (경우별 구간 목록, 경우별 구간 배열 4개, 문장들)
+        self.recommendations = {}
+        for name, spec in (recommendations or {}).items():
+            feature = spec['feature']
+            bounds = [_bounds([(op, _encode(feature, value))]) for op, value, _ in spec['cases']]
+            self.recommendations[name] = (
+                bounds,
+                tuple(np.array(column) for column in zip(*bounds)),
+                [text for _, _, text in spec['cases']] + [spec['default']]
+            )
+
+    def _compile_rule(self, r: int, rule: Dict):
+        for feature, spec in rule.get('when', {}).items():
+            f = _feature_index(feature)
+            conditions = [(op, _encode(feature, value)) for op, value in _conditions(spec)]
+            (self.lower[r, f], self.lower_closed[r, f],
+             self.upper[r, f], self.upper_closed[r, f]) = _bounds(conditions)
+        priority = rule['priority']
+        if isinstance(priority, str):
+            self.priority_features[r] = _feature_index(priority)
+        else:
+            self.priorities[r] = priority
+        self.exclusive[r] = rule.get('exclusive', False)
+
+    @classmethod
+    def default(cls) -> 'CompiledRules':
+        return cls(DEFAULT_RULES, DEFAULT_RECOMMENDATIONS)
+
+    @classmethod
+    def load(cls, path: str) -> 'CompiledRules':
+        """{'rules': [...], 'recommendations': {...}} 형식의 JSON 파일에서 불러옵니다."""
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return cls(data['rules'], data.get('recommendations', DEFAULT_RECOMMENDATIONS),
+                   data.get('top_k', 3))
+
+    def matches(self, features: np.ndarray) -> np.ndarray:
+        """(상태 수, 특징 수) 특징 행렬에 대해 (상태 수, 규칙 수) 발동 여부"""
+        fired = _in_bounds(features[:, None, :], self.lower, self.lower_closed,
+                           self.upper, self.upper_closed).all(axis=2)
+
+        # 배타 규칙이 발동하면 처음 발동한 배타 규칙만 남김
+        exclusive = fired & self.exclusive
+        has_exclusive = exclusive.any(axis=1)
+        fired[has_exclusive] = False
+        fired[has_exclusive, exclusive[has_exclusive].argmax(axis=1)] = True
+        return fired
+
+    def evaluate(self, features: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        상태별 상위 top_k개 추천 규칙 번호와 우선순위를 구합니다.
+
+        Returns:
+            (rules, priorities) - 둘 다 (상태 수, top_k), 빈 칸의 규칙 번호는 -1
+        """
+        fired = self.matches(features)
+        priorities = np.broadcast_to(self.priorities, fired.shape).copy()
+        dynamic = self.priority_features >= 0
+        priorities[:, dynamic] = features[:, self.priority_features[dynamic]]
+        priorities[~fired] = -np.inf
+
+        # 안정 정렬이므로 우선순위가 같으면 규칙 순서를 따름 (list.sort와 동일)
+        top = np.argsort(-priorities, axis=1, kind='stable')[:, :self.top_k]
+        top_priorities = np.take_along_axis(priorities, top, axis=1)
+        empty = np.isneginf(top_priorities)
+        top[empty] = -1
+        top_priorities[empty] = 0
+        return top, top_priorities
+
+    def evaluate_one(self, features: Sequence[float]) -> List[Tuple[int, float]]:
+        """
+        상태 하나에 대한 evaluate. 배열을 만드는 비용을 피하려고 파이썬으로 평가합니다.
+
+        Args:
+            features: feature_vector로 만든 특징 값
+
+        Returns:
+            우선순위순 상위 top_k개 (규칙 번호, 우선순위)
+        """
+        fired = []
+        for r, checks in enumerate(self._rule_checks):
+            for f, lower, lower_closed, upper, upper_closed in checks:
+                x = features[f]
+                if x < lower or x > upper or (x == lower and not lower_closed) or \
+                        (x == upper and not upper_closed):
+                    break
+            else:
+                fired.append(r)
+        exclusive = next((r for r in fired if self._exclusive[r]), None)
+        if exclusive is not None:
+            fired = [exclusive]
+
+        ranked = []
+        for r in fired:
+            feature, priority = self._rule_priorities[r]
+            ranked.append((r, features[feature] if feature is not None else priority))
+        ranked.sort(key=lambda item: item[1], reverse=True)
+        return ranked[:self.top_k]
+
+    def recommend(self, name: str, values) -> np.ndarray:
+        """추천 문장 규칙 name을 값들에 적용해 문장 번호 배열을 반환합니다 (위에서부터 첫 일치)."""
+        _, bounds, texts = self.recommendations[name]
+        x = np.atleast_1d(np.asarray(values, dtype=float))[:, None]
+        hits = _in_bounds(x, *bounds)
+        return np.where(hits.any(axis=1), hits.argmax(axis=1), len(texts) - 1)
+
+    def recommendation(self, name: str, value) -> str:
+        """값 하나에 대한 추천 문장"""
+        cases, _, texts = self.recommendations[name]
+        for (lower, lower_closed, upper, upper_closed), text in zip(cases, texts):
+            if (value > lower or (lower_closed and value == lower)) and \
+                    (value < upper or (upper_closed and value == upper)):
+                return text
+        return texts[-1]
+
+    def recommendation_texts(self, name: str) -> List[str]:
+        """추천 문장 번호 -> 문장 (마지막은 기본 문장)"""
+        return self.recommendations[name][2]
@@ -0,0 +1,170 @@
+"""
+공간 질의
+"각 유닛 반경 R 안의 아군/적군 수" 같은 질의를 한 번의 호출로 처리합니다.
+거리는 제곱한 값끼리 비교해 제곱근을 구하지 않습니다.
+
+유닛이 적을 때(한 게임의 10명)는 모든 쌍의 거리를 배열 하나로 계산하고,
+수가 많을 때(여러 게임의 상태를 한꺼번에 넣는 배치 분석)는 균일 격자 인덱스로
+주변 칸의 유닛만 비교합니다.
+"""
+
+import numpy as np
+from typing import Optional, Tuple
+
+# 이 수보다 유닛이 많으면 neighbor_counts가 격자 인덱스를 사용
+GRID_THRESHOLD = 256
+
+
+def count_within(x, y, other_x, other_y, radius: float) -> np.ndarray:
+    """
+    위치마다 반경 안에 있는 다른 위치의 수를 셉니다.
+
+    Args:
+        x, y: (...) 기준 위치
+        other_x, other_y: (..., K) 다른 위치 (NaN은 없는 유닛으로 보고 세지 않음)
+        radius: 반경
+
+    Returns:
+        (...) 개수
+    """
+    dx = np.asarray(other_x, dtype=float) - np.asarray(x, dtype=float)[..., None]
+    dy = np.asarray(other_y, dtype=float) - np.asarray(y, dtype=float)[..., None]
+    return np.count_nonzero(dx * dx + dy * dy <= radius * radius, axis=-1)
+
+
+def neighbor_counts(x, y, teams, radius: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    유닛마다 반경 안의 아군/적군 수를 셉니다 (자기 자신 제외).
+
+    Args:
+        x, y: (..., U) 유닛 위치 (NaN이면 없는 유닛)
+        teams: (..., U) 또는 (U,) 팀 ID
+        radius: 반경
+
+    Returns:
+        (allies, enemies) - 둘 다 (..., U)
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    teams = np.broadcast_to(teams, x.shape)
+
+    if x.shape[-1] <= GRID_THRESHOLD:
+        dx = x[..., :, None] - x[..., None, :]
+        dy = y[..., :, None] - y[..., None, :]
+        near = dx * dx + dy * dy <= radius * radius
+        near &= ~np.eye(x.shape[-1], dtype=bool)
+        same_team = teams[..., :, None] == teams[..., None, :]
+        return (np.count_nonzero(near & same_team, axis=-1),
+                np.count_nonzero(near & ~same_team, axis=-1))
+
+    # 앞쪽 차원은 그룹 번호로 펼쳐서 같은 그룹 안에서만 비교합니다
+    n_units = x.shape[-1]
+    groups = np.repeat(np.arange(x.size // n_units), n_units)
+    flat_x, flat_y, flat_teams = x.reshape(-1), y.reshape(-1), teams.reshape(-1)
+
+    index = GridIndex(flat_x, flat_y, radius, groups)
+    queries, points = index.pairs_within(flat_x, flat_y, radius, groups)
+    others = queries != points
+    queries, points = queries[others], points[others]
+    same_team = flat_teams[queries] == flat_teams[points]
+
+    allies = np.bincount(queries[same_team], minlength=x.size)
+    enemies = np.bincount(queries[~same_team], minlength=x.size)
+    return allies.reshape(x.shape), enemies.reshape(x.shape)
+
+
+class GridIndex:
+    """
+    균일 격자 공간 인덱스
+
+    위치를 (그룹, 칸) 키로 정렬해 두고, 질의 위치 주변 칸의 위치만 거리를 비교합니다.
+    그룹을 주면 같은 그룹의 위치끼리만 비교합니다 (예: 게임 상태별).
+    """
+
+    def __init__(self, x, y, cell_size: float, groups: Optional[np.ndarray] = None):
+        """
+        Args:
+            x, y: (K,) 위치 (NaN이면 인덱스에 넣지 않음)
+            cell_size: 칸 크기 (보통 질의 반경)
+            groups: (K,) 그룹 번호 (없으면 모두 같은 그룹)
+        """
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        groups = np.zeros(len(x), dtype=np.int64) if groups is None else np.asarray(groups)
+
+        self.cell_size = float(cell_size)
+        valid = ~(np.isnan(x) | np.isnan(y))
+        self.points = np.flatnonzero(valid)
+        self.x, self.y = x[valid], y[valid]
+
+        cx, cy = self._cells(self.x, self.y)
+        self.origin = (cx.min(initial=0), cy.min(initial=0))
+        self.shape = (cx.max(initial=0) - self.origin[0] + 1,
+                      cy.max(initial=0) - self.origin[1] + 1)
+
+        keys = self._keys(groups[valid], cx, cy)
+        order = np.argsort(keys, kind='stable')
+        self.keys = keys[order]
+        self.points, self.x, self.y = self.points[order], self.x[order], self.y[order]
+
+    def _cells(self, x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        return (np.floor(x / self.cell_size).astype(np.int64),
+                np.floor(y / self.cell_size).astype(np.int64))
+
+    def _keys(self, groups: np.ndarray, cx: np.ndarray, cy: np.ndarray) -> np.ndarray:
+        width, height = self.shape
+        return (groups.astype(np.int64) * width + (cx - self.origin[0])) * height + \
+            (cy - self.origin[1])
+
+    def pairs_within(self, x, y, radius: float,
+                     groups: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        반경 안에 있는 (질의 번호, 위치 번호) 쌍을 모두 찾습니다.
+
+        Args:
+            x, y: (Q,) 질의 위치 (NaN이면 결과 없음)
+            radius: 반경
+            groups: (Q,) 질의 그룹 번호
+
+        Returns:
+            (queries, points) - 위치 번호는 인덱스를 만들 때의 순서
+        """
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        groups = np.zeros(len(x), dtype=np.int64) if groups is None else np.asarray(groups)
+
+        valid = ~(np.isnan(x) | np.isnan(y))
+        query_ids = np.flatnonzero(valid)
+        qx, qy, qgroups = x[valid], y[valid], groups[valid]
+        cx, cy = self._cells(qx, qy)
+
+        reach = int(np.ceil(radius / self.cell_size))
+        width, height = self.shape
+        query_parts, point_parts = [], []
+        for dx in range(-reach, reach + 1):
+            for dy in range(-reach, reach + 1):
+                nx, ny = cx + dx, cy + dy
+                inside = ((nx >= self.origin[0]) & (nx < self.origin[0] + width) &
+                          (ny >= self.origin[1]) & (ny < self.origin[1] + height))
+                keys = self._keys(qgroups[inside], nx[inside], ny[inside])
+                starts = np.searchsorted(self.keys, keys, side='left')
+                counts = np.searchsorted(self.keys, keys, side='right') - starts
+
+                # 질의마다 칸 안의 위치 범위를 펼칩니다
+                queries = np.repeat(np.flatnonzero(inside), counts)
+                offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+                query_parts.append(queries)
+                point_parts.append(np.repeat(starts, counts) + offsets)
+
+        queries = np.concatenate(query_parts) if query_parts else np.zeros(0, dtype=np.int64)
+        slots = np.concatenate(point_parts) if point_parts else np.zeros(0, dtype=np.int64)
+        ddx = self.x[slots] - qx[queries]
+        ddy = self.y[slots] - qy[queries]
+        near = ddx * ddx + ddy * ddy <= radius * radius
+        return query_ids[queries[near]], self.points[slots[near]]
+
+    def count_within(self, x, y, radius: float,
+                     groups: Optional[np.ndarray] = None) -> np.ndarray:
+        """질의 위치마다 반경 안에 있는 위치 수 (인자는 pairs_within과 같음)"""
+        queries, _ = self.pairs_within(x, y, radius, groups)
+        return np.bincount(queries, minlength=len(np.asarray(x)))
@@ -1,3 +1,15 @@
 from .replay_analyzer import ReplayAnalyzer, RoamingEvent, PositioningData
+from .streaming_analyzer import StreamingReplayAnalyzer
+from .accumulators import Accumulator, AnalysisContext
+from .event_index import EventIndex
+from .event_table import RoamingEventTable, StringPool
+from .map_zones import ZoneGrid
+from .participants import ParticipantIndex, ParticipantInfo
+from .pattern_store import PatternStore
+from .batch import BatchAnalyzer
+from .crawler import ChallengerCrawler
 
-__all__ = ['ReplayAnalyzer', 'RoamingEvent', 'PositioningData']
+__all__ = ['ReplayAnalyzer', 'StreamingReplayAnalyzer', 'RoamingEvent', 'PositioningData',
+           'Accumulator', 'AnalysisContext', 'EventIndex', 'RoamingEventTable', 'StringPool',
+           'ZoneGrid', 'ParticipantIndex', 'ParticipantInfo', 'PatternStore', 'BatchAnalyzer',
+           'ChallengerCrawler']
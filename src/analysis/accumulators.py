@@ -0,0 +1,275 @@
+"""
+분석 누적기
+타임라인은 TimelineColumns로 한 번만 읽고, 각 분석은 프레임 묶음을 받아 상태를
+갱신하는 누적기로 구현합니다. 존 코드, 안전도 점수 같은 공통 파생 배열은
+AnalysisContext에서 한 번만 계산해 모든 누적기가 공유합니다.
+
+같은 누적기가 게임 전체(ReplayAnalyzer)와 프레임 하나씩(StreamingReplayAnalyzer)
+모두에 쓰이므로, 새 분석은 누적기 하나만 등록하면 됩니다.
+"""
+
+from collections import deque
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .event_index import EventIndex
+from .participants import ParticipantIndex
+from .timeline_columns import TimelineColumns
+
+if TYPE_CHECKING:
+    from .replay_analyzer import ReplayAnalyzer, RoamingEvent
+
+
+class AnalysisContext:
+    """누적기에 넘기는 프레임 묶음과 공유 파생 배열"""
+
+    def __init__(self, analyzer: 'ReplayAnalyzer', columns: TimelineColumns,
+                 frame_offset: int = 0, participants: Optional[ParticipantIndex] = None,
+                 event_index: Optional[EventIndex] = None):
+        """
+        Args:
+            analyzer: 분석기 (존 분류, 안전도 계산 등에 사용)
+            columns: 프레임 묶음
+            frame_offset: 묶음 첫 프레임의 게임 전체 기준 번호
+            participants: 참가자 인덱스 (없으면 참가자 ID로 팀을 추정)
+            event_index: 게임 처음부터 이 묶음까지의 이벤트 인덱스 (없으면 묶음에서 만듦)
+        """
+        self.analyzer = analyzer
+        self.columns = columns
+        self.frame_offset = frame_offset
+        self.participants = (participants or
+                             ParticipantIndex.from_participant_ids(columns.participant_ids))
+        if event_index is not None:
+            self.event_index = event_index
+
+    @cached_property
+    def event_index(self) -> EventIndex:
+        """이벤트 인덱스"""
+        return EventIndex.from_columns(self.columns)
+
+    @cached_property
+    def frame_numbers(self) -> np.ndarray:
+        """게임 전체 기준 프레임 번호"""
+        return self.frame_offset + np.arange(self.columns.n_frames)
+
+    @cached_property
+    def minutes(self) -> np.ndarray:
+        return self.columns.timestamps // 60000
+
+    @cached_property
+    def phases(self) -> np.ndarray:
+        """프레임별 게임 페이즈 이름"""
+        return np.array([
+            self.analyzer._get_game_phase(int(timestamp) // 1000)
+            for timestamp in self.columns.timestamps
+        ], dtype=object)
+
+    @cached_property
+    def zones(self) -> np.ndarray:
+        """(프레임, 참가자) 존 코드"""
+        return self.analyzer._classify_zones(self.columns.x, self.columns.y)
+
+    @cached_property
+    def champions(self) -> List[str]:
+        """열 순서대로의 챔피언 이름"""
+        return self.participants.champions(self.columns.participant_ids)
+
+    @cached_property
+    def team_masks(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(참가자, 다른 참가자) 아군/적군 마스크"""
+        return self.participants.team_masks(self.columns.participant_ids)
+
+    @cached_property
+    def safety_scores(self) -> np.ndarray:
+        """(프레임, 참가자) 안전도 점수"""
+        return self.analyzer._positioning_scores(self.columns, *self.team_masks)
+
+
+class Accumulator:
+    """분석 하나의 누적기 (name이 결과 딕셔너리의 키)"""
+
+    name = ''
+
+    def __init__(self, analyzer: 'ReplayAnalyzer'):
+        self.analyzer = analyzer
+
+    def update(self, context: AnalysisContext):
+        """프레임 묶음을 반영합니다."""
+        raise NotImplementedError
+
+    def result(self) -> Any:
+        """지금까지의 결과를 반환합니다 (상태는 바꾸지 않음)."""
+        raise NotImplementedError
+
+
+class RoamingAccumulator(Accumulator):
+    """
+    로밍 이벤트를 감지합니다.
+
+    로밍 조건:
+    1. 라이너가 자신의 라인을 벗어남
+    2. 다른 라인이나 정글로 이동
+    3. 일정 시간(15초 이상) 체류
+
+    이전 ROAMING_WINDOW개 프레임(위치가 있는 프레임만)이 모두 같은 존이었다가
+    현재 프레임에서 다른 존으로 바뀐 경우를 찾습니다. 묶음 경계를 넘는 비교를 위해
+    참가자별로 직전 프레임의 존 코드만 링 버퍼에 보관합니다.
+
+    로밍 시각 ± ROAMING_SUCCESS_WINDOW 안에 킬이나 어시스트를 얻으면 성공입니다.
+    그 구간의 이벤트를 아직 받지 못한 로밍은 보류해 두었다가 다음 묶음에서 다시 확인합니다.
+    """
+
+    name = 'roaming'
+
+    def __init__(self, analyzer: 'ReplayAnalyzer'):
+        super().__init__(analyzer)
+        self.events: List['RoamingEvent'] = []
+        # 참가자 ID -> 직전 ROAMING_WINDOW개 프레임의 존 코드 (위치가 없으면 -1)
+        self.recent_zones: Dict[str, Deque[int]] = {}
+        # 성공 여부를 아직 확정하지 못한 (이벤트, 참가자 ID, 로밍 시각(밀리초))
+        self.pending: List[Tuple['RoamingEvent', str, int]] = []
+
+    def update(self, context: AnalysisContext):
+        columns = context.columns
+        window = self.analyzer.ROAMING_WINDOW
+
+        # 링 버퍼를 묶음 앞에 붙여 직전 프레임으로 사용합니다
+        prefix_zones = np.full((window, columns.n_participants), -1, dtype=np.int16)
+        for p, participant_id in enumerate(columns.participant_ids):
+            recent = self.recent_zones.get(participant_id, ())
+            if recent:
+                prefix_zones[window - len(recent):, p] = list(recent)
+        zones = np.concatenate((prefix_zones, context.zones.astype(np.int16)))
+        valid = np.concatenate((prefix_zones >= 0, columns.has_position))
+
+        roaming, from_zones = self.analyzer._find_zone_transitions(zones, valid, window)
+        roaming = roaming[window:] & columns.present
+        roaming &= (context.frame_numbers >= 6)[:, None]  # 최소 5분 후부터 분석
+
+        for i, p in zip(*np.nonzero(roaming)):
+            event = self.analyzer._make_roaming_event(
+                context, i, p, from_zones[window + i, p], zones[window + i, p]
+            )
+            self.events.append(event)
+            self.pending.append((event, columns.participant_ids[p], int(columns.timestamps[i])))
+        self._resolve_success(context)
+
+        tail = np.where(valid, zones, -1)[-window:]
+        for p, participant_id in enumerate(columns.participant_ids):
+            self.recent_zones[participant_id] = deque(tail[:, p].tolist(), maxlen=window)
+        # 이번 묶음에 없던 참가자도 프레임 수만큼 밀어 간격을 맞춥니다
+        present_ids = set(columns.participant_ids)
+        missing = [-1] * min(columns.n_frames, window)
+        for participant_id, recent in self.recent_zones.items():
+            if participant_id not in present_ids:
+                recent.extend(missing)
+
+    def _resolve_success(self, context: AnalysisContext):
+        """보류 중인 로밍의 성공 여부를 이벤트 인덱스에서 확인합니다."""
+        radius = self.analyzer.ROAMING_SUCCESS_WINDOW
+        seen_until = int(context.columns.timestamps[-1]) if context.columns.n_frames else -1
+
+        pending = []
+        for event, participant_id, timestamp in self.pending:
+            if participant_id.isdigit() and len(context.event_index.kills_involving(
+                    int(participant_id), timestamp, radius, roles=('killer', 'assist'))):
+                event.success = True
+            elif timestamp + radius > seen_until:
+                pending.append((event, participant_id, timestamp))
+        self.pending = pending
+
+    def result(self) -> List['RoamingEvent']:
+        return list(self.events)
+
+
+class PositioningAccumulator(Accumulator):
+    """게임 페이즈별 평균 안전도 점수"""
+
+    name = 'positioning'
+    PHASES = ('early_game', 'mid_game', 'late_game')
+
+    def __init__(self, analyzer: 'ReplayAnalyzer'):
+        super().__init__(analyzer)
+        self.sums = dict.fromkeys(self.PHASES, 0.0)
+        self.counts = dict.fromkeys(self.PHASES, 0)
+
+    def update(self, context: AnalysisContext):
+        present = context.columns.present
+        for phase in self.PHASES:
+            mask = (context.phases == phase)[:, None] & present
+            self.sums[phase] += float(context.safety_scores[mask].sum())
+            self.counts[phase] += int(mask.sum())
+
+    def result(self) -> Dict[str, float]:
+        return {
+            phase: self.sums[phase] / self.counts[phase] if self.counts[phase] else 0
+            for phase in self.PHASES
+        }
+
+
+class CSAccumulator(Accumulator):
+    """평균 분당 CS와 효율성"""
+
+    name = 'cs_patterns'
+
+    def __init__(self, analyzer: 'ReplayAnalyzer'):
+        super().__init__(analyzer)
+        self.cs_per_min_sum = 0.0
+        self.efficiency_sum = 0.0
+        self.count = 0
+
+    def update(self, context: AnalysisContext):
+        columns = context.columns
+
+        # 첫 프레임과 0분 프레임은 제외
+        counted = (context.frame_numbers > 0) & (context.minutes > 0)
+        valid = columns.present & counted[:, None]
+
+        total_cs = columns.minions_killed + columns.jungle_minions_killed
+        cs_per_min, efficiency = self.analyzer._cs_rates(
+            total_cs[valid], np.broadcast_to(context.minutes[:, None], valid.shape)[valid]
+        )
+        self.cs_per_min_sum += float(cs_per_min.sum())
+        self.efficiency_sum += float(efficiency.sum())
+        self.count += len(cs_per_min)
+
+    def result(self) -> Dict[str, float]:
+        if not self.count:
+            return {'avg_cs_per_min': 0, 'avg_efficiency': 0}
+        return {
+            'avg_cs_per_min': self.cs_per_min_sum / self.count,
+            'avg_efficiency': self.efficiency_sum / self.count
+        }
+
+
+class ObjectiveAccumulator(Accumulator):
+    """
+    오브젝트 처치 시간 (초)
+
+    이벤트 인덱스가 이미 종류별로 정렬해 두므로 묶음마다 이벤트를 훑지 않고,
+    결과를 요청할 때 게임 전체 인덱스에서 한 번에 꺼냅니다.
+    """
+
+    name = 'objectives'
+    OBJECTIVES = {
+        'dragons': ('ELITE_MONSTER_KILL', 'DRAGON'),
+        'barons': ('ELITE_MONSTER_KILL', 'BARON_NASHOR'),
+        'heralds': ('ELITE_MONSTER_KILL', 'RIFTHERALD'),
+        'towers': ('BUILDING_KILL', 'TOWER_BUILDING')
+    }
+
+    def __init__(self, analyzer: 'ReplayAnalyzer'):
+        super().__init__(analyzer)
+        self.event_index = EventIndex()
+
+    def update(self, context: AnalysisContext):
+        self.event_index = context.event_index
+
+    def result(self) -> Dict[str, List[int]]:
+        timestamps = self.event_index.events['timestamp']
+        return {
+            key: (timestamps[self.event_index.of_type(event_type, subtype)] // 1000).tolist()
+            for key, (event_type, subtype) in self.OBJECTIVES.items()
+        }
@@ -0,0 +1,134 @@
+"""
+배치 타임라인 분석
+여러 매치의 타임라인을 프로세스 풀에 나눠 분석하고 결과를 하나로 합칩니다.
+타임라인 분석은 순수 CPU 작업이므로 스레드 대신 프로세스로 코어를 모두 사용합니다.
+"""
+
+import gzip
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .event_table import RoamingEventTable
+from .replay_analyzer import ReplayAnalyzer
+
+JsonSource = Union[Dict, str, os.PathLike]
+# 타임라인 하나, 또는 (타임라인, 매치 상세 정보) 쌍
+TimelineSource = Union[JsonSource, Tuple[JsonSource, Optional[JsonSource]]]
+
+# 워커 프로세스마다 한 번 만들어 재사용하는 분석기
+_worker_analyzer = None
+
+
+def load_timeline(path: Union[str, os.PathLike]) -> Dict:
+    """타임라인/매치 JSON 파일(.json 또는 MatchStore의 .json.gz)을 읽습니다."""
+    opener = gzip.open if os.fspath(path).endswith('.gz') else open
+    with opener(path, 'rt', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _load(source: Optional[JsonSource]) -> Optional[Dict]:
+    if source is None or isinstance(source, dict):
+        return source
+    return load_timeline(source)
+
+
+def _init_worker(analyzer_factory: Callable[[], ReplayAnalyzer]):
+    global _worker_analyzer
+    _worker_analyzer = analyzer_factory()
+
+
+def _analyze_source(source: TimelineSource,
+                    analyzer: Optional[ReplayAnalyzer] = None) -> Dict:
+    """타임라인 하나를 분석합니다. 실패하면 빈 딕셔너리를 반환합니다."""
+    analyzer = analyzer or _worker_analyzer
+    timeline, match_details = source if isinstance(source, tuple) else (source, None)
+    try:
+        return analyzer.analyze_match_timeline(_load(timeline), _load(match_details))
+    except Exception as e:
+        name = 'dict' if isinstance(timeline, dict) else os.fspath(timeline)
+        print(f"타임라인 분석 실패 ({name}): {e}")
+        return {}
+
+
+class BatchAnalyzer:
+    """프로세스 풀 기반 배치 분석기"""
+
+    def __init__(self, workers: Optional[int] = None,
+                 chunksize: Optional[int] = None,
+                 analyzer_factory: Callable[[], ReplayAnalyzer] = ReplayAnalyzer):
+        """
+        Args:
+            workers: 워커 프로세스 수 (없으면 CPU 코어 수, 1이면 현재 프로세스에서 실행)
+            chunksize: 워커에 한 번에 넘길 타임라인 수 (없으면 워커당 4묶음이 되도록 계산)
+            analyzer_factory: 워커에서 분석기를 만드는 함수 (피클 가능해야 함)
+        """
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.chunksize = chunksize
+        self.analyzer_factory = analyzer_factory
+
+    def analyze(self, timelines: Iterable[TimelineSource]) -> Dict:
+        """
+        타임라인들을 분석합니다.
+
+        Args:
+            timelines: 타임라인 딕셔너리 또는 타임라인 파일 경로.
+                       경로를 넘기면 워커가 직접 파일을 읽으므로 프로세스 간 전송량이 작습니다.
+                       (타임라인, 매치 상세 정보) 쌍을 넘기면 팀/챔피언 정보도 사용합니다.
+
+        Returns:
+            {'matches': 입력 순서대로의 매치별 분석 결과 (실패하면 빈 딕셔너리),
+             'aggregate': merge_results로 합친 결과}
+        """
+        sources = list(timelines)
+
+        if self.workers == 1 or len(sources) <= 1:
+            analyzer = self.analyzer_factory()
+            results = [_analyze_source(source, analyzer) for source in sources]
+        else:
+            chunksize = self.chunksize or max(1, len(sources) // (self.workers * 4))
+            with ProcessPoolExecutor(max_workers=self.workers,
+                                     initializer=_init_worker,
+                                     initargs=(self.analyzer_factory,)) as executor:
+                results = list(executor.map(_analyze_source, sources, chunksize=chunksize))
+
+        return {'matches': results, 'aggregate': self.merge_results(results)}
+
+    @staticmethod
+    def merge_results(results: List[Dict]) -> Dict:
+        """
+        매치별 분석 결과를 합칩니다.
+        포지셔닝/CS 값은 매치별 평균의 평균이고, 로밍과 오브젝트 시간은 모두 모읍니다.
+        로밍은 RoamingEventTable 하나에 모아 챔피언/존/분 단위로 바로 나눠 볼 수 있습니다.
+        """
+        analyzed = [result for result in results if result]
+
+        roaming = RoamingEventTable.from_events(
+            event for result in analyzed for event in result.get('roaming', [])
+        )
+
+        def mean_of(section: str) -> Dict:
+            keys = {key for result in analyzed for key in result.get(section, {})}
+            return {
+                key: float(np.mean([result[section][key] for result in analyzed
+                                    if key in result.get(section, {})]))
+                for key in sorted(keys)
+            }
+
+        objectives = {}
+        for result in analyzed:
+            for key, timings in result.get('objectives', {}).items():
+                objectives.setdefault(key, []).extend(timings)
+
+        return {
+            'match_count': len(analyzed),
+            'failures': len(results) - len(analyzed),
+            'roaming': roaming,
+            'roaming_routes': roaming.counts('from_lane', 'to_lane'),
+            'positioning': mean_of('positioning'),
+            'cs_patterns': mean_of('cs_patterns'),
+            'objectives': {key: sorted(timings) for key, timings in objectives.items()}
+        }
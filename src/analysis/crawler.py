@@ -0,0 +1,304 @@
+"""
+챌린저 리플레이 크롤러
+챌린저 래더 → 소환사 → 매치 히스토리 → 타임라인 순서로 내려받아
+ReplayAnalyzer에 바로 흘려보냅니다. 진행 상황은 체크포인트 파일에 저장되어
+중단된 지점부터 다시 시작할 수 있습니다. 계속 실패하는 매치는 정해진 횟수만큼만
+다시 시도합니다.
+"""
+
+import json
+import os
+import tempfile
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Callable, Dict, List, Optional
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+class ChallengerCrawler:
+    """재시작 가능한 챌린저 매치 크롤러"""
+
+    def __init__(self, api_client, analyzer,
+                 checkpoint_path: Optional[str] = None,
+                 use_checkpoint: bool = True,
+                 matches_per_player: int = 20,
+                 workers: int = 4,
+                 executor: Optional[Executor] = None,
+                 on_result: Optional[Callable[[str, Dict], None]] = None,
+                 checkpoint_every: int = 50,
+                 max_attempts: int = 3):
+        """
+        Args:
+            api_client: RiotAPIClient (또는 같은 메서드를 가진 객체)
+            analyzer: ReplayAnalyzer (또는 analyze_match_timeline을 가진 객체)
+            checkpoint_path: 진행 상황 저장 경로 (없으면 DB_PATH 옆의 crawl_checkpoint.json)
+            use_checkpoint: False이면 진행 상황을 저장하지 않음
+            matches_per_player: 플레이어별로 가져올 최근 매치 수
+            workers: 동시에 처리할 매치 수 (executor가 없을 때 스레드 풀 크기)
+            executor: 매치 처리를 맡길 Executor (주어지면 workers 대신 사용)
+            on_result: 매치 하나의 분석이 끝날 때마다 호출되는 콜백 (match_id, 분석 결과)
+            checkpoint_every: 몇 개의 매치마다 체크포인트를 저장할지
+            max_attempts: 매치 하나를 시도할 최대 횟수 (넘으면 포기)
+        """
+        self.api_client = api_client
+        self.analyzer = analyzer
+        if use_checkpoint:
+            self.checkpoint_path = checkpoint_path or self.default_checkpoint_path()
+        else:
+            self.checkpoint_path = None
+        self.matches_per_player = matches_per_player
+        self.workers = max(1, workers)
+        self.executor = executor
+        self.on_result = on_result
+        self.checkpoint_every = checkpoint_every
+        self.max_attempts = max(1, max_attempts)
+
+        self.pending_players: deque = deque()
+        self.pending_matches: deque = deque()
+        self.seen_matches = set()
+        self.failed_matches: List[str] = []
+        self.abandoned_matches: List[str] = []
+        self.failed_attempts: Dict[str, int] = {}  # 매치 ID -> 실패 횟수
+        self.running_matches = set()
+        self.ladder_loaded = False
+        self.stats = {
+            'players_processed': 0,
+            'matches_analyzed': 0,
+            'duplicates_skipped': 0,
+            'failures': 0,
+            'abandoned': 0
+        }
+
+        self._load_checkpoint()
+
+    @staticmethod
+    def default_checkpoint_path() -> str:
+        """DB_PATH 옆의 crawl_checkpoint.json"""
+        db_path = os.getenv('DB_PATH', './data/lol_data.db')
+        return os.path.join(os.path.dirname(db_path) or '.', 'crawl_checkpoint.json')
+
+    def crawl(self, queue: str = 'RANKED_SOLO_5x5',
+              max_players: Optional[int] = None,
+              max_matches: Optional[int] = None) -> Dict:
+        """
+        크롤링을 실행합니다.
+
+        Args:
+            queue: 큐 종류
+            max_players: 이번 실행에서 처리할 최대 플레이어 수
+            max_matches: 이번 실행에서 분석할 최대 매치 수
+
+        Returns:
+            누적 통계
+        """
+        if not self.ladder_loaded:
+            self._load_ladder(queue)
+
+        # 이전 실행에서 실패한 매치를 다시 시도합니다 (max_attempts번 실패하면 포기)
+        self.pending_matches.extend(self.failed_matches)
+        self.failed_matches = []
+
+        executor = self.executor
+        own_executor = executor is None and self.workers > 1
+        if own_executor:
+            executor = ThreadPoolExecutor(max_workers=self.workers)
+
+        players_done = 0
+        matches_done = 0
+        try:
+            while True:
+                limit = None if max_matches is None else max_matches - matches_done
+                matches_done += self._drain_matches(executor, limit)
+                if max_matches is not None and matches_done >= max_matches:
+                    break
+                if not self.pending_players:
+                    break
+                if max_players is not None and players_done >= max_players:
+                    break
+
+                self._process_player(self.pending_players.popleft())
+                players_done += 1
+        finally:
+            if own_executor:
+                executor.shutdown(wait=True)
+            self.save_checkpoint()
+
+        return dict(self.stats)
+
+    def _load_ladder(self, queue: str):
+        """챌린저 래더를 작업 큐에 넣습니다."""
+        league = self.api_client.get_challenger_players(queue)
+        entries = sorted(
+            league.get('entries', []),
+            key=lambda entry: entry.get('leaguePoints', 0),
+            reverse=True
+        )
+        for entry in entries:
+            self.pending_players.append({
+                'puuid': entry.get('puuid'),
+                'summonerId': entry.get('summonerId')
+            })
+        self.ladder_loaded = True
+
+    def _process_player(self, player: Dict):
+        """플레이어의 매치 히스토리를 가져와 새 매치만 큐에 넣습니다."""
+        puuid = player.get('puuid')
+        if not puuid and player.get('summonerId'):
+            summoner = self.api_client.get_summoner_by_id(player['summonerId'])
+            puuid = summoner.get('puuid')
+
+        if puuid:
+            match_ids = self.api_client.get_match_history(
+                puuid, count=self.matches_per_player
+            )
+            for match_id in match_ids:
+                if match_id in self.seen_matches:
+                    self.stats['duplicates_skipped'] += 1
+                    continue
+                self.seen_matches.add(match_id)
+                self.pending_matches.append(match_id)
+
+        self.stats['players_processed'] += 1
+
+    def _analyze_match(self, match_id: str) -> Optional[Dict]:
+        """
+        타임라인을 받아 곧바로 분석합니다. 원본 타임라인은 보관하지 않습니다.
+        클라이언트와 분석기가 프레임 스트리밍을 지원하면 프레임 단위로 흘려보냅니다.
+        """
+        # 팀/챔피언 구분을 위해 매치 상세 정보도 함께 넘깁니다
+        kwargs = {}
+        get_details = getattr(self.api_client, 'get_match_details', None)
+        if get_details is not None:
+            match_details = get_details(match_id)
+            if match_details:
+                kwargs['match_details'] = match_details
+
+        iter_frames = getattr(self.api_client, 'iter_match_timeline_frames', None)
+        analyze_frames = getattr(self.analyzer, 'analyze_frames', None)
+        if iter_frames is not None and analyze_frames is not None:
+            return analyze_frames(iter_frames(match_id), **kwargs) or None
+
+        timeline = self.api_client.get_match_timeline(match_id)
+        if not timeline:
+            return None
+        return self.analyzer.analyze_match_timeline(timeline, **kwargs)
+
+    def _run_match(self, match_id: str) -> Optional[Dict]:
+        """매치 하나를 분석합니다. 예외(타임라인이 중간에 끊긴 경우 등)는 실패로 처리합니다."""
+        try:
+            return self._analyze_match(match_id)
+        except Exception as e:
+            print(f"매치 분석 실패 ({match_id}): {e}")
+            return None
+
+    def _drain_matches(self, executor: Optional[Executor],
+                       limit: Optional[int]) -> int:
+        """
+        대기 중인 매치를 처리합니다.
+        메모리를 일정하게 유지하기 위해 동시에 진행 중인 작업 수를 제한합니다.
+        """
+        done_count = 0
+        since_checkpoint = 0
+
+        def budget_left():
+            return limit is None or done_count + len(in_flight) < limit
+
+        in_flight = {}
+        while self.pending_matches or in_flight:
+            if executor is None:
+                if not budget_left():
+                    break
+                match_id = self.pending_matches.popleft()
+                self.running_matches.add(match_id)
+                self._finish(match_id, self._run_match(match_id))
+                done_count += 1
+                since_checkpoint += 1
+            else:
+                while (self.pending_matches and len(in_flight) < self.workers * 2
+                       and budget_left()):
+                    match_id = self.pending_matches.popleft()
+                    self.running_matches.add(match_id)
+                    in_flight[executor.submit(self._run_match, match_id)] = match_id
+                if not in_flight:
+                    break
+
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    match_id = in_flight.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        print(f"매치 분석 실패 ({match_id}): {e}")
+                        result = None
+                    self._finish(match_id, result)
+                    done_count += 1
+                    since_checkpoint += 1
+
+            if since_checkpoint >= self.checkpoint_every:
+                self.save_checkpoint()
+                since_checkpoint = 0
+
+        return done_count
+
+    def _finish(self, match_id: str, result: Optional[Dict]):
+        self.running_matches.discard(match_id)
+        if result is None:
+            self.stats['failures'] += 1
+            attempts = self.failed_attempts.get(match_id, 0) + 1
+            if attempts >= self.max_attempts:
+                self.failed_attempts.pop(match_id, None)
+                self.abandoned_matches.append(match_id)
+                self.stats['abandoned'] += 1
+                print(f"매치 {match_id}: {attempts}회 실패하여 포기합니다")
+            else:
+                self.failed_attempts[match_id] = attempts
+                self.failed_matches.append(match_id)
+            return
+
+        self.failed_attempts.pop(match_id, None)
+        self.stats['matches_analyzed'] += 1
+        if self.on_result is not None:
+            self.on_result(match_id, result)
+
+    def save_checkpoint(self):
+        """진행 상황을 저장합니다. 쓰는 도중 중단되어도 이전 체크포인트는 유지됩니다."""
+        if not self.checkpoint_path:
+            return
+
+        state = {
+            'ladder_loaded': self.ladder_loaded,
+            'pending_players': list(self.pending_players),
+            # 진행 중이던 매치는 다음 실행에서 다시 처리합니다
+            'pending_matches': sorted(self.running_matches) + list(self.pending_matches),
+            'failed_matches': self.failed_matches,
+            'failed_attempts': self.failed_attempts,
+            'abandoned_matches': self.abandoned_matches,
+            'seen_matches': sorted(self.seen_matches),
+            'stats': self.stats
+        }
+
+        directory = os.path.dirname(self.checkpoint_path) or '.'
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def _load_checkpoint(self):
+        if not self.checkpoint_path or not os.path.exists(self.checkpoint_path):
+            return
+
+        with open(self.checkpoint_path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+
+        self.ladder_loaded = state.get('ladder_loaded', False)
+        self.pending_players = deque(state.get('pending_players', []))
+        self.pending_matches = deque(state.get('pending_matches', []))
+        self.failed_matches = state.get('failed_matches', [])
+        self.failed_attempts = state.get('failed_attempts', {})
+        self.abandoned_matches = state.get('abandoned_matches', [])
+        self.seen_matches = set(state.get('seen_matches', []))
+        self.stats.update(state.get('stats', {}))
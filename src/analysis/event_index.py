@@ -0,0 +1,153 @@
+"""
+이벤트 인덱스
+타임라인 이벤트를 종류별로 나누고 시간순으로 정렬해 두어,
+"t ± 20초 안에 p번 참가자가 관여한 킬" 같은 구간 질의를 이진 탐색으로 처리합니다.
+"""
+
+import numpy as np
+from typing import Dict, Iterable, Optional, Tuple
+
+from .timeline_columns import (
+    EVENT_DTYPE, TimelineColumns, event_subtype_code, event_type_code
+)
+
+# 킬 관여 방식
+KILLER, VICTIM, ASSIST = 0, 1, 2
+_ROLE_CODES = {'killer': KILLER, 'victim': VICTIM, 'assist': ASSIST}
+
+_CHAMPION_KILL = event_type_code('CHAMPION_KILL')
+
+
+class EventIndex:
+    """종류별로 시간순 정렬된 이벤트 인덱스"""
+
+    def __init__(self):
+        self.events = np.zeros(0, dtype=EVENT_DTYPE)
+        self._assist_offsets = np.zeros(1, dtype=np.int64)
+        self._assist_ids = np.zeros(0, dtype=np.int16)
+        self._stale = False
+
+        # 이벤트 종류 -> (정렬된 타임스탬프, events 행 번호)
+        self._by_type: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+        # 챔피언 킬 관여 기록: (참가자, 타임스탬프) 순으로 정렬
+        self._kill_participants = np.zeros(0, dtype=np.int16)
+        self._kill_times = np.zeros(0, dtype=np.int64)
+        self._kill_rows = np.zeros(0, dtype=np.int64)
+        self._kill_roles = np.zeros(0, dtype=np.int8)
+
+    @classmethod
+    def from_columns(cls, columns: TimelineColumns) -> 'EventIndex':
+        """컬럼형 타임라인의 이벤트 테이블에서 만듭니다."""
+        index = cls()
+        index.extend(columns)
+        return index
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    @property
+    def last_timestamp(self) -> int:
+        """지금까지 받은 이벤트 중 가장 늦은 시각 (밀리초, 없으면 -1)"""
+        return int(self.events['timestamp'].max()) if len(self.events) else -1
+
+    def extend(self, columns: TimelineColumns):
+        """
+        프레임 묶음의 이벤트를 추가합니다.
+        인덱스는 다음 질의 때 한 번에 다시 만듭니다.
+        """
+        if len(columns.events) == 0:
+            return
+        self._assist_offsets = np.concatenate((
+            self._assist_offsets, columns.assist_offsets[1:] + len(self._assist_ids)
+        ))
+        self._assist_ids = np.concatenate((self._assist_ids, columns.assist_ids))
+        self.events = np.concatenate((self.events, columns.events))
+        self._stale = True
+
+    def _rebuild(self):
+        if not self._stale:
+            return
+        events = self.events
+        order = np.argsort(events['timestamp'], kind='stable')
+
+        self._by_type = {}
+        sorted_types = events['type'][order]
+        for code in np.unique(sorted_types):
+            rows = order[sorted_types == code]
+            self._by_type[int(code)] = (events['timestamp'][rows], rows)
+
+        # 킬러 / 희생자 / 어시스트 관여를 한 줄씩 펼칩니다
+        kill_rows = np.flatnonzero(events['type'] == _CHAMPION_KILL)
+        assist_counts = np.diff(self._assist_offsets)[kill_rows]
+        assist_rows = np.repeat(kill_rows, assist_counts)
+        assist_ids = (np.concatenate([
+            self._assist_ids[self._assist_offsets[row]:self._assist_offsets[row + 1]]
+            for row in kill_rows
+        ]) if len(kill_rows) else np.zeros(0, dtype=np.int16))
+
+        rows = np.concatenate((kill_rows, kill_rows, assist_rows))
+        participants = np.concatenate((
+            events['killer_id'][kill_rows], events['victim_id'][kill_rows], assist_ids
+        )).astype(np.int16)
+        roles = np.concatenate((
+            np.full(len(kill_rows), KILLER), np.full(len(kill_rows), VICTIM),
+            np.full(len(assist_rows), ASSIST)
+        )).astype(np.int8)
+        times = events['timestamp'][rows]
+
+        order = np.lexsort((times, participants))
+        self._kill_participants = participants[order]
+        self._kill_times = times[order]
+        self._kill_rows = rows[order]
+        self._kill_roles = roles[order]
+        self._stale = False
+
+    def in_window(self, event_type: str, start: int, end: int,
+                  subtype: Optional[str] = None) -> np.ndarray:
+        """
+        start <= timestamp <= end (밀리초)인 이벤트의 행 번호를 시간순으로 반환합니다.
+
+        Args:
+            event_type: 이벤트 종류 (EVENT_TYPES)
+            start, end: 구간 (밀리초)
+            subtype: 세부 종류 (EVENT_SUBTYPES, 예: 'DRAGON')
+        """
+        self._rebuild()
+        bucket = self._by_type.get(event_type_code(event_type))
+        if bucket is None:
+            return np.zeros(0, dtype=np.int64)
+        times, rows = bucket
+        lo = np.searchsorted(times, start, side='left')
+        hi = np.searchsorted(times, end, side='right')
+        rows = rows[lo:hi]
+        if subtype is not None:
+            rows = rows[self.events['subtype'][rows] == event_subtype_code(subtype)]
+        return rows
+
+    def of_type(self, event_type: str, subtype: Optional[str] = None) -> np.ndarray:
+        """해당 종류의 모든 이벤트 행 번호를 시간순으로 반환합니다."""
+        return self.in_window(event_type, np.iinfo(np.int64).min, np.iinfo(np.int64).max,
+                              subtype)
+
+    def kills_involving(self, participant_id: int, timestamp: int, radius: int = 20000,
+                        roles: Iterable[str] = ('killer', 'victim', 'assist')) -> np.ndarray:
+        """
+        timestamp ± radius (밀리초) 안에서 참가자가 관여한 챔피언 킬의 행 번호를 반환합니다.
+
+        Args:
+            participant_id: 참가자 ID
+            timestamp: 기준 시각 (밀리초)
+            radius: 구간 반경 (밀리초)
+            roles: 포함할 관여 방식 ('killer', 'victim', 'assist')
+        """
+        self._rebuild()
+        participant_id = int(participant_id)
+        first = np.searchsorted(self._kill_participants, participant_id, side='left')
+        last = np.searchsorted(self._kill_participants, participant_id, side='right')
+        times = self._kill_times[first:last]
+        lo = first + np.searchsorted(times, timestamp - radius, side='left')
+        hi = first + np.searchsorted(times, timestamp + radius, side='right')
+
+        role_codes = [_ROLE_CODES[role] for role in roles]
+        matched = np.isin(self._kill_roles[lo:hi], role_codes)
+        return np.unique(self._kill_rows[lo:hi][matched])
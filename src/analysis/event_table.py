@@ -0,0 +1,242 @@
+"""
+로밍 이벤트 테이블
+대량의 RoamingEvent를 객체 대신 NumPy 구조화 배열 한 개에 저장합니다.
+라인/챔피언 같은 문자열은 StringPool에 한 번만 저장하고 정수 코드로 참조하므로
+이벤트 하나가 약 20바이트이며, 챔피언/존/분 단위 필터링과 그룹화를 벡터 연산으로 처리합니다.
+"""
+
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .replay_analyzer import RoamingEvent
+
+ROAMING_DTYPE = np.dtype([
+    ('timestamp', np.int32),  # 초
+    ('from_lane', np.int16),
+    ('to_lane', np.int16),
+    ('champion', np.int32),
+    ('wave_state', np.int16),
+    ('level', np.int8),
+    ('success', np.bool_),
+    ('vision_score', np.int32)
+])
+
+# 문자열 풀을 쓰는 필드 -> 풀 이름
+_STRING_FIELDS = {
+    'from_lane': 'lanes',
+    'to_lane': 'lanes',
+    'champion': 'champions',
+    'wave_state': 'wave_states'
+}
+
+# 그룹화/필터링에 쓸 수 있는 키 (minute은 timestamp에서 계산)
+GROUP_KEYS = ('champion', 'from_lane', 'to_lane', 'wave_state', 'minute', 'level', 'success')
+
+
+class StringPool:
+    """문자열 <-> 정수 코드 표 (같은 문자열은 한 번만 저장)"""
+
+    __slots__ = ('names', '_codes')
+
+    def __init__(self, names: Iterable[str] = ()):
+        self.names: List[str] = []
+        self._codes: Dict[str, int] = {}
+        for name in names:
+            self.code(name)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, code: int) -> str:
+        return self.names[code]
+
+    def code(self, name: str) -> int:
+        """문자열의 코드를 반환합니다. 처음 보는 문자열이면 새로 등록합니다."""
+        code = self._codes.get(name)
+        if code is None:
+            code = self._codes[name] = len(self.names)
+            self.names.append(name)
+        return code
+
+    def find(self, name: str) -> int:
+        """등록된 문자열의 코드를 반환합니다 (없으면 -1)."""
+        return self._codes.get(name, -1)
+
+    def codes(self, names: Iterable[str]) -> np.ndarray:
+        return np.fromiter((self.code(name) for name in names), dtype=np.int32)
+
+
+class RoamingEventTable:
+    """
+    구조화 배열 기반 로밍 이벤트 모음
+
+    필드별 배열은 column(name)으로, 이벤트 객체는 인덱싱이나 순회로 꺼낼 수 있습니다.
+    filter/group_by가 돌려주는 테이블은 문자열 풀을 공유합니다.
+    적 소환사 주문 상태(enemy_summs)는 타임라인에 없는 정보라 저장하지 않습니다.
+    """
+
+    def __init__(self, records: Optional[np.ndarray] = None,
+                 lanes: Optional[StringPool] = None,
+                 champions: Optional[StringPool] = None,
+                 wave_states: Optional[StringPool] = None):
+        """
+        Args:
+            records: ROAMING_DTYPE 구조화 배열 (없으면 빈 테이블)
+            lanes, champions, wave_states: 문자열 풀 (records의 코드가 가리킴)
+        """
+        self._buffer = records if records is not None else np.zeros(0, dtype=ROAMING_DTYPE)
+        self._size = len(self._buffer)
+        self.lanes = lanes or StringPool()
+        self.champions = champions or StringPool()
+        self.wave_states = wave_states or StringPool()
+
+    @classmethod
+    def from_events(cls, events: Iterable[RoamingEvent]) -> 'RoamingEventTable':
+        table = cls()
+        table.extend(events)
+        return table
+
+    @classmethod
+    def concat(cls, tables: Sequence['RoamingEventTable']) -> 'RoamingEventTable':
+        """여러 테이블을 합칩니다. 문자열 코드는 새 풀 기준으로 다시 매깁니다."""
+        result = cls()
+        parts = []
+        for table in tables:
+            records = table.records.copy()
+            for field, pool_name in _STRING_FIELDS.items():
+                remap = getattr(result, pool_name).codes(getattr(table, pool_name).names)
+                if len(remap):
+                    records[field] = remap[records[field]]
+            parts.append(records)
+        if parts:
+            result._buffer = np.concatenate(parts)
+            result._size = len(result._buffer)
+        return result
+
+    @property
+    def records(self) -> np.ndarray:
+        """저장된 이벤트의 구조화 배열 (복사본이 아닌 뷰)"""
+        return self._buffer[:self._size]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[RoamingEvent]:
+        for i in range(self._size):
+            yield self[i]
+
+    def __getitem__(self, i: int) -> RoamingEvent:
+        record = self.records[i]
+        return RoamingEvent(
+            timestamp=int(record['timestamp']),
+            from_lane=self.lanes[record['from_lane']],
+            to_lane=self.lanes[record['to_lane']],
+            champion=self.champions[record['champion']],
+            level=int(record['level']),
+            success=bool(record['success']),
+            wave_state=self.wave_states[record['wave_state']],
+            enemy_summs=(),
+            vision_score=int(record['vision_score'])
+        )
+
+    def to_events(self) -> List[RoamingEvent]:
+        return list(self)
+
+    def append(self, event: RoamingEvent):
+        self.extend((event,))
+
+    def extend(self, events: Iterable[RoamingEvent]):
+        """이벤트를 추가합니다. 버퍼는 두 배씩 늘려 추가 비용을 상수로 유지합니다."""
+        rows = [
+            (event.timestamp, self.lanes.code(event.from_lane), self.lanes.code(event.to_lane),
+             self.champions.code(event.champion), self.wave_states.code(event.wave_state),
+             event.level, event.success, event.vision_score)
+            for event in events
+        ]
+        if not rows:
+            return
+        needed = self._size + len(rows)
+        if needed > len(self._buffer):
+            buffer = np.zeros(max(needed, 2 * len(self._buffer)), dtype=ROAMING_DTYPE)
+            buffer[:self._size] = self.records
+            self._buffer = buffer
+        self._buffer[self._size:needed] = rows
+        self._size = needed
+
+    def column(self, key: str) -> np.ndarray:
+        """필드 하나의 배열 (minute은 timestamp // 60)"""
+        if key == 'minute':
+            return self.records['timestamp'] // 60
+        return self.records[key]
+
+    def _code(self, key: str, value) -> int:
+        pool_name = _STRING_FIELDS.get(key)
+        return getattr(self, pool_name).find(value) if pool_name else value
+
+    def _label(self, key: str, code):
+        pool_name = _STRING_FIELDS.get(key)
+        return getattr(self, pool_name)[code] if pool_name else code.item()
+
+    def mask(self, **criteria) -> np.ndarray:
+        """
+        조건에 맞는 이벤트의 bool 마스크를 반환합니다.
+
+        Args:
+            criteria: GROUP_KEYS의 키 -> 값, 또는 값 목록 (목록이면 그중 하나와 일치)
+                      예: mask(champion='Ahri', minute=range(5, 15))
+        """
+        mask = np.ones(self._size, dtype=bool)
+        for key, value in criteria.items():
+            if key not in GROUP_KEYS:
+                raise ValueError(f"알 수 없는 키: {key}")
+            column = self.column(key)
+            if isinstance(value, (str, bool, int, np.integer)):
+                mask &= column == self._code(key, value)
+            else:
+                mask &= np.isin(column, [self._code(key, v) for v in value])
+        return mask
+
+    def filter(self, **criteria) -> 'RoamingEventTable':
+        """조건에 맞는 이벤트만 담은 테이블 (인자는 mask와 같음)"""
+        return self._take(self.mask(**criteria))
+
+    def _take(self, selection: np.ndarray) -> 'RoamingEventTable':
+        return RoamingEventTable(self.records[selection], self.lanes, self.champions,
+                                 self.wave_states)
+
+    def _group_codes(self, keys: Tuple[str, ...]) -> Tuple[np.ndarray, np.ndarray]:
+        """키 조합별 (고유 코드 행, 이벤트별 그룹 번호)"""
+        if self._size == 0:
+            return np.zeros((0, len(keys)), dtype=np.int64), np.zeros(0, dtype=np.int64)
+        stacked = np.stack([self.column(key).astype(np.int64) for key in keys], axis=1)
+        unique, inverse = np.unique(stacked, axis=0, return_inverse=True)
+        return unique, inverse.reshape(-1)
+
+    def _group_label(self, keys: Tuple[str, ...], codes: np.ndarray):
+        labels = tuple(self._label(key, code) for key, code in zip(keys, codes))
+        return labels[0] if len(keys) == 1 else labels
+
+    def counts(self, *keys: str) -> Dict[Union[str, int, Tuple], int]:
+        """
+        키 조합별 이벤트 수를 셉니다.
+        키가 하나면 딕셔너리 키는 값 자체, 여러 개면 튜플입니다.
+        예: counts('from_lane', 'to_lane') -> {('mid', 'bot'): 12, ...}
+        """
+        unique, inverse = self._group_codes(keys)
+        counts = np.bincount(inverse, minlength=len(unique))
+        return {self._group_label(keys, codes): int(n) for codes, n in zip(unique, counts)}
+
+    def group_by(self, *keys: str) -> Dict[Union[str, int, Tuple], 'RoamingEventTable']:
+        """키 조합별 하위 테이블 (키 형식은 counts와 같음)"""
+        unique, inverse = self._group_codes(keys)
+        order = np.argsort(inverse, kind='stable')
+        bounds = np.searchsorted(inverse[order], np.arange(len(unique) + 1))
+        return {
+            self._group_label(keys, codes): self._take(order[bounds[g]:bounds[g + 1]])
+            for g, codes in enumerate(unique)
+        }
+
+    def success_rate(self) -> float:
+        """성공한 로밍의 비율 (이벤트가 없으면 0)"""
+        return float(self.records['success'].mean()) if self._size else 0.0
@@ -0,0 +1,167 @@
+"""
+맵 존 조회 그리드
+맵을 미리 래스터로 나눠 각 칸의 존 코드를 계산해 두고,
+좌표 배열 전체를 인덱싱 한 번으로 존 코드 배열로 바꿉니다.
+"""
+
+import numpy as np
+from typing import Dict, List, Optional, Sequence, Tuple
+
+MAP_SIZE = 14820
+
+_BASE_SIZE = 4600
+_LANE_WIDTH = 1500
+
+
+def _mirror(polygon: Sequence[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """맵 중앙을 기준으로 점대칭합니다 (블루 진영 -> 레드 진영)."""
+    return [(MAP_SIZE - x, MAP_SIZE - y) for x, y in polygon]
+
+
+_INNER_MIN = _LANE_WIDTH
+_INNER_MAX = MAP_SIZE - _LANE_WIDTH
+_CENTER = (MAP_SIZE / 2, MAP_SIZE / 2)
+
+_BLUE_BASE = [(0, 0), (_BASE_SIZE, 0), (_BASE_SIZE, _LANE_WIDTH),
+              (_LANE_WIDTH, _BASE_SIZE), (0, _BASE_SIZE)]
+_TOP_LANE = [(0, _BASE_SIZE), (_LANE_WIDTH, _BASE_SIZE), (_LANE_WIDTH, _INNER_MAX),
+             (MAP_SIZE - _BASE_SIZE, _INNER_MAX), (MAP_SIZE - _BASE_SIZE, MAP_SIZE),
+             (0, MAP_SIZE)]
+
+# 소환사의 협곡 세부 존 (먼저 나온 존이 우선)
+SUMMONERS_RIFT_ZONES = {
+    'blue_base': _BLUE_BASE,
+    'red_base': _mirror(_BLUE_BASE),
+    'top': _TOP_LANE,
+    'bot': _mirror(_TOP_LANE),
+    'mid': [(2400, 3700), (3700, 2400), (12420, 11120), (11120, 12420)],
+    'river': [(_INNER_MIN, 12420), (2400, _INNER_MAX),
+              (_INNER_MAX, 2400), (12420, _INNER_MIN)],
+    'blue_top_jungle': [(_INNER_MIN, _INNER_MIN), (_INNER_MIN, _INNER_MAX), _CENTER],
+    'blue_bot_jungle': [(_INNER_MIN, _INNER_MIN), (_INNER_MAX, _INNER_MIN), _CENTER],
+    'red_top_jungle': [(_INNER_MIN, _INNER_MAX), (_INNER_MAX, _INNER_MAX), _CENTER],
+    'red_bot_jungle': [(_INNER_MAX, _INNER_MIN), (_INNER_MAX, _INNER_MAX), _CENTER]
+}
+
+
+def _points_in_polygon(xs: np.ndarray, ys: np.ndarray,
+                       polygon: Sequence[Tuple[float, float]]) -> np.ndarray:
+    """짝홀 규칙으로 점들이 다각형 안(경계 포함 근사)에 있는지 판단합니다."""
+    inside = np.zeros(np.shape(xs), dtype=bool)
+    vertices = list(polygon)
+    for (x1, y1), (x2, y2) in zip(vertices, vertices[1:] + vertices[:1]):
+        crosses = (y1 > ys) != (y2 > ys)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x_cross = x1 + (ys - y1) * (x2 - x1) / (y2 - y1)
+        inside ^= crosses & (xs <= x_cross)
+    return inside
+
+
+class ZoneGrid:
+    """
+    좌표 -> 존 코드 조회표
+
+    각 축을 경계값 목록(edges)으로 나누고, 경계값 위의 점과 경계 사이 구간을 서로 다른
+    칸으로 취급합니다. 덕분에 직사각형 존은 경계를 포함하는 비교(<=)까지 정확히 재현되고,
+    다각형 존은 일정 간격 래스터로 근사됩니다.
+    """
+
+    def __init__(self, names: List[str], x_edges: np.ndarray, y_edges: np.ndarray,
+                 table: np.ndarray, cell_size: Optional[int] = None):
+        """
+        Args:
+            names: 존 코드 -> 존 이름 (마지막은 'unknown')
+            x_edges, y_edges: 축별 경계값 (오름차순)
+            table: (2 * len(x_edges) + 1, 2 * len(y_edges) + 1) 존 코드 표
+            cell_size: 경계값이 0부터 일정 간격이면 그 간격 (칸 번호를 나눗셈으로 계산)
+        """
+        self.names = names
+        self.x_edges = x_edges
+        self.y_edges = y_edges
+        self.table = table
+        self.cell_size = cell_size
+        self.unknown = len(names) - 1
+
+    def _cell_codes(self, edges: np.ndarray, values: np.ndarray) -> np.ndarray:
+        # 경계값과 같으면 홀수, 두 경계 사이면 짝수 칸
+        if self.cell_size is None:
+            return (np.searchsorted(edges, values, side='left') +
+                    np.searchsorted(edges, values, side='right'))
+        cells, remainder = np.divmod(values, self.cell_size)
+        codes = 2 * cells + np.where(remainder == 0, 1, 2)
+        return np.clip(codes, 0, 2 * len(edges))
+
+    @staticmethod
+    def _representatives(edges: np.ndarray) -> np.ndarray:
+        """각 칸을 대표하는 좌표를 구합니다."""
+        edges = edges.astype(float)
+        gaps = np.concatenate((
+            [edges[0] - 1], (edges[:-1] + edges[1:]) / 2, [edges[-1] + 1]
+        ))
+        points = np.empty(2 * len(edges) + 1)
+        points[0::2] = gaps
+        points[1::2] = edges
+        return points
+
+    @classmethod
+    def _build(cls, names: List[str], x_edges: np.ndarray, y_edges: np.ndarray,
+               contains, cell_size: Optional[int] = None) -> 'ZoneGrid':
+        xs, ys = np.meshgrid(cls._representatives(x_edges),
+                             cls._representatives(y_edges), indexing='ij')
+        table = np.full(xs.shape, len(names), dtype=np.int8)
+        # 먼저 정의된 존이 우선하도록 뒤에서부터 덮어씁니다
+        for code in range(len(names) - 1, -1, -1):
+            table[contains(code, xs, ys)] = code
+        return cls(list(names) + ['unknown'], x_edges, y_edges, table, cell_size)
+
+    @classmethod
+    def from_rectangles(cls, zones: Dict[str, Dict[str, Tuple[int, int]]]) -> 'ZoneGrid':
+        """
+        ReplayAnalyzer.LANE_ZONES 형식의 직사각형 존에서 만듭니다.
+        경계값을 그대로 칸 경계로 쓰므로 결과가 직사각형 비교와 정확히 같습니다.
+        """
+        names = list(zones)
+        rects = [zones[name] for name in names]
+        x_edges = np.unique([v for rect in rects for v in rect['x']])
+        y_edges = np.unique([v for rect in rects for v in rect['y']])
+
+        def contains(code, xs, ys):
+            rect = rects[code]
+            return ((rect['x'][0] <= xs) & (xs <= rect['x'][1]) &
+                    (rect['y'][0] <= ys) & (ys <= rect['y'][1]))
+
+        return cls._build(names, x_edges, y_edges, contains)
+
+    @classmethod
+    def from_polygons(cls, zones: Dict[str, Sequence[Tuple[float, float]]],
+                      map_size: int = MAP_SIZE, cell_size: int = 50) -> 'ZoneGrid':
+        """
+        다각형 존에서 cell_size 간격의 래스터를 만듭니다.
+
+        Args:
+            zones: 존 이름 -> 꼭짓점 목록 (먼저 나온 존이 우선)
+            map_size: 맵 크기
+            cell_size: 래스터 칸 크기
+        """
+        names = list(zones)
+        polygons = [zones[name] for name in names]
+        edges = np.arange(0, map_size + cell_size, cell_size)
+
+        def contains(code, xs, ys):
+            return _points_in_polygon(xs, ys, polygons[code])
+
+        return cls._build(names, edges, edges, contains, cell_size)
+
+    @classmethod
+    def summoners_rift(cls, cell_size: int = 50) -> 'ZoneGrid':
+        """강, 정글 사분면, 본진을 구분하는 소환사의 협곡 세부 존 그리드"""
+        return cls.from_polygons(SUMMONERS_RIFT_ZONES, cell_size=cell_size)
+
+    def classify(self, xs, ys) -> np.ndarray:
+        """좌표 배열을 존 코드 배열로 변환합니다."""
+        return self.table[self._cell_codes(self.x_edges, np.asarray(xs)),
+                          self._cell_codes(self.y_edges, np.asarray(ys))]
+
+    def zone_of(self, x: float, y: float) -> str:
+        """좌표 하나의 존 이름을 반환합니다."""
+        return self.names[int(self.classify(x, y))]
@@ -0,0 +1,108 @@
+"""
+참가자 인덱스
+매치 상세 정보에서 참가자 ID -> 팀, 챔피언, 포지션, PUUID 표를 만들고,
+분석기가 쓰는 아군/적군 마스크를 배열로 미리 계산합니다.
+"""
+
+import numpy as np
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+BLUE_TEAM = 100
+RED_TEAM = 200
+
+
+@dataclass
+class ParticipantInfo:
+    """참가자 정보"""
+    participant_id: str
+    team_id: int  # 100 (블루) / 200 (레드), 모르면 0
+    champion: str
+    role: str  # TOP, JUNGLE, MIDDLE, BOTTOM, UTILITY (모르면 빈 문자열)
+    puuid: str
+
+
+class ParticipantIndex:
+    """매치 하나의 참가자 인덱스"""
+
+    def __init__(self, participants: Iterable[ParticipantInfo]):
+        self._participants: Dict[str, ParticipantInfo] = {
+            info.participant_id: info for info in participants
+        }
+
+    @classmethod
+    def from_match_details(cls, match_details: Optional[Dict]) -> 'ParticipantIndex':
+        """Riot API 매치 상세 정보(match-v5)에서 만듭니다."""
+        participants = (match_details or {}).get('info', {}).get('participants', [])
+        return cls(
+            ParticipantInfo(
+                participant_id=str(participant.get('participantId', index + 1)),
+                team_id=participant.get('teamId', 0),
+                champion=participant.get('championName') or 'Unknown',
+                role=(participant.get('teamPosition') or
+                      participant.get('individualPosition') or ''),
+                puuid=participant.get('puuid', '')
+            )
+            for index, participant in enumerate(participants)
+        )
+
+    @classmethod
+    def from_participant_ids(cls, participant_ids: Iterable[str]) -> 'ParticipantIndex':
+        """
+        매치 상세 정보가 없을 때 참가자 ID만으로 만듭니다.
+        1~5번은 블루, 6~10번은 레드 팀으로 가정하며 챔피언은 알 수 없습니다.
+        """
+        return cls(
+            ParticipantInfo(
+                participant_id=str(pid),
+                team_id=(BLUE_TEAM if int(pid) <= 5 else RED_TEAM) if str(pid).isdigit() else 0,
+                champion='Unknown',
+                role='',
+                puuid=''
+            )
+            for pid in participant_ids
+        )
+
+    def __len__(self) -> int:
+        return len(self._participants)
+
+    def __contains__(self, participant_id) -> bool:
+        return str(participant_id) in self._participants
+
+    def get(self, participant_id) -> Optional[ParticipantInfo]:
+        return self._participants.get(str(participant_id))
+
+    def find_by_puuid(self, puuid: str) -> Optional[ParticipantInfo]:
+        """PUUID로 참가자를 찾습니다."""
+        for info in self._participants.values():
+            if info.puuid == puuid:
+                return info
+        return None
+
+    def team_ids(self, participant_ids: Sequence[str]) -> np.ndarray:
+        """열 순서대로의 팀 ID 배열 (모르는 참가자는 0)"""
+        return np.array([
+            info.team_id if info else 0
+            for info in map(self.get, participant_ids)
+        ], dtype=np.int16)
+
+    def champions(self, participant_ids: Sequence[str]) -> List[str]:
+        """열 순서대로의 챔피언 이름"""
+        return [info.champion if info else 'Unknown' for info in map(self.get, participant_ids)]
+
+    def team_masks(self, participant_ids: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        (참가자, 다른 참가자) 아군/적군 마스크를 만듭니다.
+        팀을 모르는 참가자는 어느 쪽에도 포함되지 않으며, 자기 자신은 아군에서 제외됩니다.
+
+        Returns:
+            (allies, enemies) - 둘 다 (P, P) bool 배열
+        """
+        teams = self.team_ids(participant_ids)
+        known = teams > 0
+        both_known = known[:, None] & known[None, :]
+        same_team = teams[:, None] == teams[None, :]
+
+        allies = both_known & same_team & ~np.eye(len(teams), dtype=bool)
+        enemies = both_known & ~same_team
+        return allies, enemies
@@ -0,0 +1,322 @@
+"""
+패턴 저장소
+여러 매치의 분석 결과를 (챔피언, 분, 존) 단위 통계로 누적합니다.
+평균/분산/히스토그램을 온라인으로 갱신하므로 원본 타임라인을 보관하지 않고도
+수많은 챌린저 게임에서 학습할 수 있습니다.
+
+디스크에는 매치마다 변화량 한 줄을 덧붙이는 JSON Lines 로그로 저장하며,
+불러올 때 모든 줄을 다시 합칩니다. 각 줄에는 매치 ID가 함께 기록되어 같은 매치는
+한 번만 더해집니다. 로그가 길어지면 compact()로 스냅샷 한 줄로 줄입니다.
+여러 프로세스가 같은 로그를 쓸 수 있도록 덧붙이기와 compact()는 잠금 파일로 보호합니다.
+"""
+
+import json
+import os
+import tempfile
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from dotenv import load_dotenv
+
+load_dotenv()
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# 모든 챔피언을 합친 통계의 챔피언 이름
+ALL_CHAMPIONS = '*'
+
+# 지표 -> 히스토그램 (최솟값, 최댓값, 구간 수), 범위 밖의 값은 양 끝 구간에 넣음
+METRIC_BINS = {
+    'safety': (0.0, 10.0, 10),
+    'cs_per_min': (0.0, 15.0, 15)
+}
+
+PatternKey = Tuple[str, int, str]  # (챔피언, 분, 존)
+
+
+@contextmanager
+def _file_lock(path: str):
+    """프로세스 사이의 배타적 파일 잠금"""
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    with open(path, 'a+b') as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class RunningStats:
+    """개수/평균/편차 제곱합(Welford)과 히스토그램을 온라인으로 갱신하는 통계"""
+
+    __slots__ = ('count', 'mean', 'm2', 'histogram')
+
+    def __init__(self, bins: int):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.histogram = [0] * bins
+
+    @property
+    def variance(self) -> float:
+        """표본 분산 (값이 2개 미만이면 0)"""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        return self.variance ** 0.5
+
+    def merge(self, count: int, mean: float, m2: float, histogram: Sequence[int]):
+        """다른 표본 묶음의 통계를 합칩니다 (Chan의 병렬 알고리즘)."""
+        if count == 0:
+            return
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+        for i, n in enumerate(histogram):
+            self.histogram[i] += n
+
+    def to_list(self) -> List:
+        return [self.count, self.mean, self.m2, self.histogram]
+
+
+class PatternStats:
+    """(챔피언, 분, 존) 하나의 누적 통계"""
+
+    __slots__ = ('samples', 'roams', 'metrics')
+
+    def __init__(self):
+        self.samples = 0  # 관측한 (프레임, 참가자) 수
+        self.roams: Counter = Counter()  # 목적지 존 -> 로밍 횟수
+        self.metrics = {name: RunningStats(bins) for name, (_, _, bins) in METRIC_BINS.items()}
+
+    @property
+    def roam_count(self) -> int:
+        return sum(self.roams.values())
+
+    @property
+    def roam_rate(self) -> float:
+        """이 존에 있을 때 다음 프레임에 로밍을 시작한 비율"""
+        return self.roam_count / self.samples if self.samples else 0.0
+
+    @property
+    def top_destination(self) -> Optional[str]:
+        """가장 많이 로밍한 목적지 존"""
+        return self.roams.most_common(1)[0][0] if self.roams else None
+
+
+class PatternStore:
+    """덧붙이기 전용 로그로 저장되는 패턴 통계 저장소"""
+
+    # 스냅샷 이후 로그 줄이 이 수를 넘으면 자동으로 compact()
+    COMPACT_EVERY = 1000
+
+    def __init__(self, path: Optional[str] = None, compact_every: Optional[int] = None):
+        """
+        Args:
+            path: 로그 파일 경로 (None이면 메모리에만 보관)
+            compact_every: 자동 compact() 기준 로그 줄 수 (없으면 COMPACT_EVERY)
+        """
+        self.path = path
+        self.compact_every = compact_every or self.COMPACT_EVERY
+        self._lock = threading.Lock()
+        self._reset()
+
+        if path and os.path.exists(path):
+            self._load()
+
+    def _reset(self):
+        self._stats: Dict[PatternKey, PatternStats] = {}
+        self._match_ids = set()
+        self._log_lines = 0
+        self.match_count = 0
+
+    @staticmethod
+    def default_path() -> str:
+        """DB_PATH 옆의 patterns.jsonl"""
+        db_path = os.getenv('DB_PATH', './data/lol_data.db')
+        return os.path.join(os.path.dirname(db_path) or '.', 'patterns.jsonl')
+
+    def __len__(self) -> int:
+        return len(self._stats)
+
+    def __contains__(self, match_id: str) -> bool:
+        """이미 더한 매치인지"""
+        return match_id in self._match_ids
+
+    def get(self, champion: str, minute: int, zone: str) -> Optional[PatternStats]:
+        """통계를 조회합니다. 없으면 None."""
+        return self._stats.get((champion, minute, zone))
+
+    def update(self, champions: Sequence[str], champion_idx: np.ndarray,
+               minutes: np.ndarray, zones: Sequence[str], zone_idx: np.ndarray,
+               metrics: Dict[str, np.ndarray],
+               roams: Iterable[Tuple[str, int, str, str]] = (),
+               match_id: Optional[str] = None) -> bool:
+        """
+        한 매치의 표본을 키별로 묶어 통계에 더하고, 로그에 한 줄 덧붙입니다.
+        모든 표본은 ALL_CHAMPIONS 통계에도 함께 더해집니다.
+        이미 더한 match_id면 아무것도 하지 않습니다.
+
+        Args:
+            champions: 챔피언 이름 목록 (champion_idx가 가리킴)
+            champion_idx, minutes, zone_idx: 표본별 키 (1차원 배열)
+            zones: 존 이름 목록 (zone_idx가 가리킴)
+            metrics: 지표 이름 -> 표본별 값 (값이 없으면 NaN)
+            roams: (챔피언, 분, 출발 존, 목적지 존) 로밍 목록
+            match_id: 매치 ID (None이면 중복 확인 없이 더함)
+
+        Returns:
+            통계에 더했는지 여부
+        """
+        if match_id is not None and match_id in self._match_ids:
+            return False
+
+        champions = list(champions) + [ALL_CHAMPIONS]
+        all_idx = np.full(len(champion_idx), len(champions) - 1)
+        champion_idx = np.concatenate((champion_idx, all_idx))
+        minutes = np.tile(minutes, 2)
+        zone_idx = np.tile(zone_idx, 2)
+        metrics = {name: np.tile(np.asarray(values, dtype=float), 2)
+                   for name, values in metrics.items()}
+
+        entries = {}
+        if len(champion_idx):
+            keys, inverse = np.unique(
+                np.stack((champion_idx, minutes, zone_idx), axis=1), axis=0, return_inverse=True
+            )
+            inverse = inverse.reshape(-1)
+            samples = np.bincount(inverse, minlength=len(keys))
+            summaries = {name: self._summarize(name, values, inverse, len(keys))
+                         for name, values in metrics.items()}
+            for g, (c, minute, z) in enumerate(keys):
+                entries[(champions[c], int(minute), zones[z])] = {
+                    'n': int(samples[g]),
+                    'r': {},
+                    'm': {name: [int(count[g]), float(mean[g]), float(m2[g]), hist[g].tolist()]
+                          for name, (count, mean, m2, hist) in summaries.items()}
+                }
+
+        for champion, minute, from_zone, to_zone in roams:
+            for name in (champion, ALL_CHAMPIONS):
+                entry = entries.setdefault((name, minute, from_zone), {'n': 0, 'r': {}, 'm': {}})
+                entry['r'][to_zone] = entry['r'].get(to_zone, 0) + 1
+
+        record = [[*key, entry['n'], entry['r'], entry['m']] for key, entry in entries.items()]
+        match_ids = [] if match_id is None else [match_id]
+        with self._lock:
+            # 같은 매치를 동시에 더하는 경우를 위해 잠금 안에서 다시 확인합니다
+            if match_id is not None and match_id in self._match_ids:
+                return False
+            self._apply(record)
+            self._match_ids.update(match_ids)
+            self.match_count += 1
+            if self.path:
+                with _file_lock(self.path + '.lock'):
+                    self._append(record, match_ids)
+                    if self._log_lines > self.compact_every:
+                        self._write_snapshot()
+        return True
+
+    @staticmethod
+    def _summarize(name: str, values: np.ndarray, groups: np.ndarray, n_groups: int):
+        """그룹별 개수/평균/편차 제곱합/히스토그램을 한 번에 계산합니다."""
+        low, high, bins = METRIC_BINS[name]
+        valid = ~np.isnan(values)
+        values, groups = values[valid], groups[valid]
+
+        count = np.bincount(groups, minlength=n_groups)
+        total = np.bincount(groups, weights=values, minlength=n_groups)
+        mean = np.divide(total, count, out=np.zeros(n_groups), where=count > 0)
+        m2 = np.bincount(groups, weights=(values - mean[groups]) ** 2, minlength=n_groups)
+
+        bin_idx = np.clip(((values - low) / (high - low) * bins).astype(int), 0, bins - 1)
+        hist = np.bincount(groups * bins + bin_idx, minlength=n_groups * bins)
+        return count, mean, m2, hist.reshape(n_groups, bins)
+
+    def _apply(self, record: List):
+        for champion, minute, zone, samples, roams, metrics in record:
+            stats = self._stats.get((champion, minute, zone))
+            if stats is None:
+                stats = self._stats[(champion, minute, zone)] = PatternStats()
+            stats.samples += samples
+            stats.roams.update(roams)
+            for name, values in metrics.items():
+                stats.metrics[name].merge(*values)
+
+    def _append(self, record: List, match_ids: List[str]):
+        directory = os.path.dirname(self.path) or '.'
+        os.makedirs(directory, exist_ok=True)
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({'matches': 1, 'match_ids': match_ids, 'entries': record},
+                               separators=(',', ':'), ensure_ascii=False) + '\n')
+        self._log_lines += 1
+
+    def _load(self):
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                self._log_lines += 1
+                try:
+                    data = json.loads(line)
+                except ValueError:
+                    # 쓰는 도중 중단된 마지막 줄은 건너뜁니다
+                    continue
+                match_ids = data.get('match_ids', [])
+                # 다른 프로세스가 같은 매치를 덧붙인 줄은 건너뜁니다
+                if not self._match_ids.isdisjoint(match_ids):
+                    continue
+                self._apply(data['entries'])
+                self._match_ids.update(match_ids)
+                self.match_count += data.get('matches', 1)
+
+    def compact(self):
+        """로그를 현재 통계 스냅샷 한 줄로 다시 씁니다."""
+        if not self.path:
+            return
+
+        with self._lock, _file_lock(self.path + '.lock'):
+            self._write_snapshot()
+
+    def _write_snapshot(self):
+        """
+        로그를 스냅샷 한 줄로 다시 씁니다. 잠금 파일을 잡은 상태에서 호출해야 합니다.
+
+        다른 프로세스가 덧붙인 줄을 잃지 않도록, 메모리의 통계가 아니라 지금 로그 전체를
+        다시 읽은 결과로 스냅샷을 만듭니다 (이 저장소가 더한 매치도 모두 로그에 있음).
+        """
+        if os.path.exists(self.path):
+            self._reset()
+            self._load()
+
+        record = [
+            [champion, minute, zone, stats.samples, dict(stats.roams),
+             {name: metric.to_list() for name, metric in stats.metrics.items()}]
+            for (champion, minute, zone), stats in self._stats.items()
+        ]
+        directory = os.path.dirname(self.path) or '.'
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({'matches': self.match_count,
+                                'match_ids': sorted(self._match_ids), 'entries': record},
+                               separators=(',', ':'), ensure_ascii=False) + '\n')
+        os.replace(tmp_path, self.path)
+        self._log_lines = 1
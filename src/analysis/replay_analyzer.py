@@ -4,13 +4,26 @@
 """
 
 import numpy as np
-from typing import Dict, List, Tuple, Optional
+from typing import Callable, Dict, Iterable, List, Tuple, Optional
 from dataclasses import dataclass
 
+from .accumulators import (
+    Accumulator, AnalysisContext, CSAccumulator, ObjectiveAccumulator,
+    PositioningAccumulator, RoamingAccumulator
+)
+from .map_zones import ZoneGrid
+from .participants import ParticipantIndex
+from .pattern_store import ALL_CHAMPIONS, PatternStats, PatternStore
+from .timeline_columns import TimelineColumns
+
 
 @dataclass
 class RoamingEvent:
     """로밍 이벤트 정보"""
+    # 수많은 매치의 이벤트를 메모리에 들고 있으므로 인스턴스마다 __dict__를 만들지 않음
+    __slots__ = ('timestamp', 'from_lane', 'to_lane', 'champion', 'level', 'success',
+                 'wave_state', 'enemy_summs', 'vision_score')
+
     timestamp: int  # 게임 시간 (초)
     from_lane: str  # 출발 라인
     to_lane: str  # 목적지 라인
@@ -18,13 +31,16 @@ class RoamingEvent:
     level: int
     success: bool  # 로밍 성공 여부 (킬/어시스트 획득)
     wave_state: str  # push, freeze, slow_push
-    enemy_summs: List[str]  # 적 소환사 주문 상태
+    enemy_summs: Tuple[str, ...]  # 적 소환사 주문 상태
     vision_score: int
 
 
 @dataclass
 class PositioningData:
     """포지셔닝 데이터"""
+    __slots__ = ('timestamp', 'x', 'y', 'champion', 'team', 'game_phase',
+                 'nearby_allies', 'nearby_enemies')
+
     timestamp: int
     x: int
     y: int
@@ -47,18 +63,40 @@ class ReplayAnalyzer:
         'jungle': {'x': (3000, 11820), 'y': (3000, 11820)}
     }
 
-    def __init__(self):
-        """분석기 초기화"""
-        self.roaming_patterns = []
-        self.positioning_data = []
-        self.cs_patterns = []
+    # 로밍 판단에 사용하는 직전 프레임 수
+    ROAMING_WINDOW = 3
+    # 로밍 성공 판단 구간 (로밍 시각 ± 밀리초 안의 킬/어시스트)
+    ROAMING_SUCCESS_WINDOW = 20000
+
+    # 기본 분석 누적기 (결과 딕셔너리 순서)
+    ACCUMULATORS = (RoamingAccumulator, PositioningAccumulator, CSAccumulator,
+                    ObjectiveAccumulator)
+
+    # 패턴 통계로 추천하기 위한 최소 표본 수
+    MIN_PATTERN_SAMPLES = 20
 
-    def analyze_match_timeline(self, timeline_data: Dict) -> Dict:
+    def __init__(self, zone_grid: Optional[ZoneGrid] = None,
+                 pattern_store: Optional[PatternStore] = None):
+        """
+        분석기 초기화
+
+        Args:
+            zone_grid: 존 조회 그리드 (없으면 LANE_ZONES에서 만듦,
+                       세부 존은 ZoneGrid.summoners_rift())
+            pattern_store: 분석한 매치의 패턴을 누적할 저장소 (없으면 누적하지 않음)
+        """
+        self.zone_grid = zone_grid or ZoneGrid.from_rectangles(self.LANE_ZONES)
+        self.pattern_store = pattern_store
+        self.accumulator_factories = list(self.ACCUMULATORS)
+
+    def analyze_match_timeline(self, timeline_data: Dict,
+                               match_details: Optional[Dict] = None) -> Dict:
         """
         매치 타임라인을 분석합니다.
 
         Args:
             timeline_data: Riot API에서 가져온 타임라인 데이터
+            match_details: 같은 매치의 상세 정보 (팀/챔피언 구분에 사용)
 
         Returns:
             분석 결과 딕셔너리
@@ -66,141 +104,164 @@ class ReplayAnalyzer:
         if not timeline_data or 'info' not in timeline_data:
             return {}
 
-        frames = timeline_data['info'].get('frames', [])
+        return self.analyze_columns(
+            TimelineColumns.from_timeline(timeline_data), self._participant_index(match_details),
+            match_id=self._match_id(timeline_data) or self._match_id(match_details)
+        )
+
+    def analyze_frames(self, frames: Iterable[Dict],
+                       match_details: Optional[Dict] = None) -> Dict:
+        """
+        프레임을 하나씩 받아 분석합니다.
 
-        roaming_events = self._detect_roaming(frames)
-        positioning_analysis = self._analyze_positioning(frames)
-        cs_analysis = self._analyze_cs_patterns(frames)
-        objective_control = self._analyze_objectives(frames)
+        RiotAPIClient.iter_match_timeline_frames 같은 스트림을 그대로 받을 수 있으며,
+        원본 프레임은 받는 즉시 컬럼형 배열로 옮기고 버립니다.
 
-        return {
-            'roaming': roaming_events,
-            'positioning': positioning_analysis,
-            'cs_patterns': cs_analysis,
-            'objectives': objective_control
-        }
+        Args:
+            frames: 타임라인 프레임 이터러블
+            match_details: 같은 매치의 상세 정보 (팀/챔피언 구분에 사용)
 
-    def _detect_roaming(self, frames: List[Dict]) -> List[RoamingEvent]:
+        Returns:
+            analyze_match_timeline과 같은 형식의 분석 결과 (프레임이 없으면 빈 딕셔너리)
         """
-        로밍 이벤트를 감지합니다.
+        columns = TimelineColumns.from_frames(frames)
+        if columns.n_frames == 0:
+            return {}
+        return self.analyze_columns(columns, self._participant_index(match_details),
+                                    match_id=self._match_id(match_details))
 
-        로밍 조건:
-        1. 라이너가 자신의 라인을 벗어남
-        2. 다른 라인이나 정글로 이동
-        3. 일정 시간(15초 이상) 체류
+    def analyze_columns(self, columns: TimelineColumns,
+                        participants: Optional[ParticipantIndex] = None,
+                        match_id: Optional[str] = None) -> Dict:
         """
-        roaming_events = []
-
-        for i, frame in enumerate(frames):
-            if i == 0:
-                continue
-
-            timestamp = frame.get('timestamp', 0) // 1000  # 밀리초 -> 초
-            participants = frame.get('participantFrames', {})
-
-            for participant_id, data in participants.items():
-                position = data.get('position', {})
-                x, y = position.get('x', 0), position.get('y', 0)
-
-                # 현재 존 파악
-                current_zone = self._get_zone(x, y)
-
-                # 이전 프레임과 비교하여 로밍 감지
-                if i > 5:  # 최소 5분 후부터 분석
-                    prev_positions = self._get_previous_positions(
-                        frames, i, participant_id, 3
-                    )
-
-                    if self._is_roaming(prev_positions, current_zone):
-                        champion_stats = data.get('championStats', {})
-
-                        roaming_event = RoamingEvent(
-                            timestamp=timestamp,
-                            from_lane=prev_positions[0]['zone'],
-                            to_lane=current_zone,
-                            champion="Unknown",  # 매치 데이터에서 가져와야 함
-                            level=champion_stats.get('level', 0),
-                            success=False,  # 킬 이벤트와 연결 필요
-                            wave_state="unknown",
-                            enemy_summs=[],
-                            vision_score=data.get('wardScore', 0)
-                        )
-                        roaming_events.append(roaming_event)
-
-        return roaming_events
+        컬럼형 타임라인에 대해 등록된 모든 분석을 수행합니다.
+        공통 파생 배열은 AnalysisContext에서 한 번만 계산됩니다.
+
+        Args:
+            columns: 컬럼형 타임라인
+            participants: 참가자 인덱스 (없으면 참가자 ID로 팀을 추정)
+            match_id: 매치 ID (패턴 저장소가 같은 매치를 두 번 더하지 않도록 사용)
+        """
+        context = AnalysisContext(self, columns, participants=participants)
+        accumulators = self.create_accumulators()
+        for accumulator in accumulators:
+            accumulator.update(context)
+        results = {accumulator.name: accumulator.result() for accumulator in accumulators}
+
+        if self.pattern_store is not None and match_id not in self.pattern_store:
+            self._record_patterns(context, results['roaming'], match_id)
+
+        return results
+
+    def register_accumulator(self, factory: Callable[['ReplayAnalyzer'], Accumulator]):
+        """
+        분석을 추가합니다. 결과 딕셔너리에 factory(self).name 키로 들어갑니다.
+
+        Args:
+            factory: 분석기를 받아 Accumulator를 만드는 함수 (보통 Accumulator 하위 클래스)
+        """
+        self.accumulator_factories.append(factory)
+
+    def create_accumulators(self) -> List[Accumulator]:
+        """게임 하나를 분석할 새 누적기들을 만듭니다."""
+        return [factory(self) for factory in self.accumulator_factories]
+
+    @staticmethod
+    def _match_id(data: Optional[Dict]) -> Optional[str]:
+        """타임라인/매치 상세 정보의 metadata.matchId"""
+        return (data or {}).get('metadata', {}).get('matchId')
+
+    @staticmethod
+    def _participant_index(match_details: Optional[Dict]) -> Optional[ParticipantIndex]:
+        if not match_details:
+            return None
+        return ParticipantIndex.from_match_details(match_details)
+
+    def _make_roaming_event(self, context: AnalysisContext, i: int, p: int,
+                            from_zone: int, to_zone: int) -> RoamingEvent:
+        """프레임 i, 열 p의 존 전환을 로밍 이벤트로 만듭니다."""
+        columns = context.columns
+        zone_names = self.zone_names
+        return RoamingEvent(
+            timestamp=int(columns.timestamps[i]) // 1000,  # 밀리초 -> 초
+            from_lane=zone_names[from_zone],
+            to_lane=zone_names[to_zone],
+            champion=context.champions[p],
+            level=int(columns.level[i, p]),
+            success=False,  # RoamingAccumulator가 이벤트 인덱스로 확인
+            wave_state="unknown",
+            enemy_summs=(),
+            vision_score=int(columns.ward_score[i, p])
+        )
+
+    @property
+    def zone_names(self) -> List[str]:
+        """존 코드 -> 존 이름 (마지막은 'unknown')"""
+        return self.zone_grid.names
 
     def _get_zone(self, x: int, y: int) -> str:
         """좌표로부터 맵 존을 파악합니다."""
-        for zone, coords in self.LANE_ZONES.items():
-            if (coords['x'][0] <= x <= coords['x'][1] and
-                    coords['y'][0] <= y <= coords['y'][1]):
-                return zone
-        return 'unknown'
-
-    def _get_previous_positions(self, frames: List[Dict],
-                                 current_idx: int,
-                                 participant_id: str,
-                                 count: int) -> List[Dict]:
-        """이전 포지션들을 가져옵니다."""
-        positions = []
-        for i in range(max(0, current_idx - count), current_idx):
-            frame = frames[i]
-            participant = frame.get('participantFrames', {}).get(participant_id, {})
-            pos = participant.get('position', {})
-
-            if pos:
-                x, y = pos.get('x', 0), pos.get('y', 0)
-                positions.append({
-                    'x': x,
-                    'y': y,
-                    'zone': self._get_zone(x, y)
-                })
-
-        return positions
-
-    def _is_roaming(self, prev_positions: List[Dict], current_zone: str) -> bool:
-        """로밍 여부를 판단합니다."""
-        if not prev_positions:
-            return False
-
-        # 이전 존과 현재 존이 다르고, 일정 거리 이상 이동한 경우
-        prev_zones = [pos['zone'] for pos in prev_positions]
-
-        if len(set(prev_zones)) == 1 and prev_zones[0] != current_zone:
-            # 같은 존에 있다가 다른 존으로 이동
-            return True
-
-        return False
-
-    def _analyze_positioning(self, frames: List[Dict]) -> Dict:
-        """포지셔닝을 분석합니다."""
-        positioning_scores = {
-            'early_game': [],
-            'mid_game': [],
-            'late_game': []
-        }
-
-        for frame in frames:
-            timestamp = frame.get('timestamp', 0) // 1000
-            game_phase = self._get_game_phase(timestamp)
-
-            participants = frame.get('participantFrames', {})
-
-            for participant_id, data in participants.items():
-                position = data.get('position', {})
-                x, y = position.get('x', 0), position.get('y', 0)
-
-                # 안전한 포지셔닝 점수 계산
-                safety_score = self._calculate_safety_score(
-                    x, y, participants, participant_id
-                )
+        return self.zone_grid.zone_of(x, y)
+
+    def _classify_zones(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """
+        좌표 배열 전체를 존 코드 배열로 변환합니다 (_get_zone의 벡터화 버전).
+        코드는 zone_names의 인덱스입니다.
+        """
+        return self.zone_grid.classify(xs, ys)
 
-                positioning_scores[game_phase].append(safety_score)
+    @staticmethod
+    def _find_zone_transitions(zones: np.ndarray, valid: np.ndarray,
+                               window: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        직전 window개 프레임의 유효한 위치가 모두 같은 존이고,
+        현재 존이 그와 다른 (프레임, 참가자)를 찾습니다.
 
-        return {
-            phase: np.mean(scores) if scores else 0
-            for phase, scores in positioning_scores.items()
-        }
+        Returns:
+            (전환 여부 배열, 직전 존 코드 배열 - 유효한 직전 프레임이 없으면 -1)
+        """
+        shifted = []
+        for offset in range(1, window + 1):
+            shifted_zones = np.full(zones.shape, -1, dtype=np.int16)
+            shifted_valid = np.zeros(zones.shape, dtype=bool)
+            shifted_zones[offset:] = zones[:-offset]
+            shifted_valid[offset:] = valid[:-offset]
+            shifted.append((shifted_zones, shifted_valid))
+
+        # 창 안에서 가장 이른 유효 프레임의 존을 기준으로 삼습니다
+        reference = np.full(zones.shape, -1, dtype=np.int16)
+        for shifted_zones, shifted_valid in reversed(shifted):
+            unset = (reference < 0) & shifted_valid
+            reference[unset] = shifted_zones[unset]
+
+        same_zone = reference >= 0
+        for shifted_zones, shifted_valid in shifted:
+            same_zone &= ~shifted_valid | (shifted_zones == reference)
+
+        return same_zone & (reference != zones), reference
+
+    def _positioning_scores(self, columns: TimelineColumns, allies: np.ndarray,
+                            enemies: np.ndarray) -> np.ndarray:
+        """
+        (프레임, 참가자) 안전도 점수를 계산합니다 (프레임에 없는 참가자의 값은 의미 없음).
+        게임 전체의 (프레임, 참가자, 참가자) 거리 텐서를 한 번에 계산합니다.
+
+        Args:
+            columns: 컬럼형 타임라인
+            allies, enemies: ParticipantIndex.team_masks의 (참가자, 다른 참가자) 마스크
+        """
+        present = columns.present
+        xs = columns.x.astype(float)
+        ys = columns.y.astype(float)
+        distances = np.sqrt(
+            (xs[:, :, None] - xs[:, None, :]) ** 2 +
+            (ys[:, :, None] - ys[:, None, :]) ** 2
+        )
+
+        # 같은 프레임에 있는 참가자 쌍
+        pairs = present[:, :, None] & present[:, None, :]
+
+        return self._calculate_safety_scores(distances, pairs & allies, pairs & enemies)
 
     def _get_game_phase(self, timestamp: int) -> str:
         """게임 페이즈를 반환합니다."""
@@ -211,112 +272,84 @@ class ReplayAnalyzer:
         else:
             return 'late_game'
 
-    def _calculate_safety_score(self, x: int, y: int,
-                                 participants: Dict,
-                                 current_id: str) -> float:
+    def _calculate_safety_scores(self, distances: np.ndarray, ally_pairs: np.ndarray,
+                                 enemy_pairs: np.ndarray) -> np.ndarray:
         """
         안전도 점수를 계산합니다.
         아군과의 거리, 적과의 거리, 와드 등을 고려합니다.
+
+        Args:
+            distances: (프레임, 참가자, 참가자) 거리
+            ally_pairs, enemy_pairs: 거리 계산에 포함할 (참가자, 아군/적군) 쌍
+
+        Returns:
+            (프레임, 참가자) 안전도 점수 (0 ~ 10)
         """
         # 간단한 안전도 계산
         # 실제로는 더 복잡한 알고리즘이 필요합니다
 
-        current_pos = participants[current_id].get('position', {})
-        current_x, current_y = current_pos.get('x', 0), current_pos.get('y', 0)
-
-        ally_distances = []
-        enemy_distances = []
-
-        for pid, data in participants.items():
-            if pid == current_id:
-                continue
-
-            pos = data.get('position', {})
-            px, py = pos.get('x', 0), pos.get('y', 0)
-
-            distance = np.sqrt((current_x - px) ** 2 + (current_y - py) ** 2)
-
-            # 간단하게 ID로 팀 구분 (실제로는 매치 데이터 필요)
-            if int(pid) <= 5:
-                ally_distances.append(distance)
-            else:
-                enemy_distances.append(distance)
+        ally_count = ally_pairs.sum(axis=2)
+        enemy_count = enemy_pairs.sum(axis=2)
 
         # 아군과 가까울수록, 적과 멀수록 안전
-        avg_ally_dist = np.mean(ally_distances) if ally_distances else 10000
-        avg_enemy_dist = np.mean(enemy_distances) if enemy_distances else 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            avg_ally_dist = np.where(
+                ally_count > 0,
+                np.where(ally_pairs, distances, 0).sum(axis=2) / ally_count, 10000
+            )
+            avg_enemy_dist = np.where(
+                enemy_count > 0,
+                np.where(enemy_pairs, distances, 0).sum(axis=2) / enemy_count, 0
+            )
 
         safety_score = (avg_enemy_dist / 1000) - (avg_ally_dist / 2000)
 
-        return max(0, min(10, safety_score))
-
-    def _analyze_cs_patterns(self, frames: List[Dict]) -> Dict:
-        """CS 패턴을 분석합니다."""
-        cs_data = {
-            'per_minute': [],
-            'efficiency': []
-        }
-
-        for i, frame in enumerate(frames):
-            if i == 0:
-                continue
-
-            timestamp = frame.get('timestamp', 0) // 60000  # 분 단위
-
-            participants = frame.get('participantFrames', {})
-
-            for participant_id, data in participants.items():
-                minions_killed = data.get('minionKills', 0)
-                jungle_kills = data.get('jungleMinionsKilled', 0)
-
-                total_cs = minions_killed + jungle_kills
-
-                if timestamp > 0:
-                    cs_per_min = total_cs / timestamp
-                    cs_data['per_minute'].append(cs_per_min)
-
-                    # 효율성: 이상적인 CS(분당 10개)와 비교
-                    efficiency = (cs_per_min / 10) * 100
-                    cs_data['efficiency'].append(min(100, efficiency))
-
-        return {
-            'avg_cs_per_min': np.mean(cs_data['per_minute']) if cs_data['per_minute'] else 0,
-            'avg_efficiency': np.mean(cs_data['efficiency']) if cs_data['efficiency'] else 0
-        }
-
-    def _analyze_objectives(self, frames: List[Dict]) -> Dict:
-        """오브젝트 관련 분석을 수행합니다."""
-        objectives = {
-            'dragons': [],
-            'barons': [],
-            'heralds': [],
-            'towers': []
-        }
-
-        for frame in frames:
-            events = frame.get('events', [])
-
-            for event in events:
-                event_type = event.get('type')
-
-                if event_type == 'ELITE_MONSTER_KILL':
-                    monster_type = event.get('monsterType')
-                    timestamp = event.get('timestamp', 0) // 1000
-
-                    if monster_type == 'DRAGON':
-                        objectives['dragons'].append(timestamp)
-                    elif monster_type == 'BARON_NASHOR':
-                        objectives['barons'].append(timestamp)
-                    elif monster_type == 'RIFTHERALD':
-                        objectives['heralds'].append(timestamp)
-
-                elif event_type == 'BUILDING_KILL':
-                    building_type = event.get('buildingType')
-                    if building_type == 'TOWER_BUILDING':
-                        timestamp = event.get('timestamp', 0) // 1000
-                        objectives['towers'].append(timestamp)
-
-        return objectives
+        return np.clip(safety_score, 0, 10)
+
+    @staticmethod
+    def _cs_rates(total_cs: np.ndarray, minutes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """분당 CS와 효율성(이상적인 분당 10개 대비 %)을 계산합니다."""
+        cs_per_min = total_cs / minutes
+        efficiency = np.minimum(100, (cs_per_min / 10) * 100)
+        return cs_per_min, efficiency
+
+    def _record_patterns(self, context: AnalysisContext, roaming_events: List[RoamingEvent],
+                         match_id: Optional[str] = None):
+        """위치가 있는 (프레임, 참가자) 표본과 로밍을 패턴 저장소에 더합니다."""
+        columns = context.columns
+        valid = columns.present & columns.has_position
+        frames, participants = np.nonzero(valid)
+
+        # 첫 프레임과 0분 프레임은 CS 표본에서 제외
+        total_cs = (columns.minions_killed + columns.jungle_minions_killed)[valid]
+        sample_minutes = context.minutes[frames]
+        cs_per_min = np.full(len(frames), np.nan)
+        counted = (frames > 0) & (sample_minutes > 0)
+        cs_per_min[counted] = self._cs_rates(total_cs[counted], sample_minutes[counted])[0]
+
+        self.pattern_store.update(
+            champions=context.champions,
+            champion_idx=participants,
+            minutes=sample_minutes,
+            zones=self.zone_names,
+            zone_idx=context.zones[valid],
+            metrics={
+                'safety': context.safety_scores[valid],
+                'cs_per_min': cs_per_min
+            },
+            roams=[(event.champion, event.timestamp // 60, event.from_lane, event.to_lane)
+                   for event in roaming_events],
+            match_id=match_id
+        )
+
+    def _lookup_pattern(self, champion: Optional[str], minute: int,
+                        zone: str) -> Optional[PatternStats]:
+        """챔피언 통계가 부족하면 전체 챔피언 통계를 사용합니다."""
+        for name in (champion, ALL_CHAMPIONS):
+            stats = self.pattern_store.get(name, minute, zone) if name else None
+            if stats is not None and stats.samples >= self.MIN_PATTERN_SAMPLES:
+                return stats
+        return None
 
     def get_roaming_recommendations(self, game_state: Dict) -> List[str]:
         """
@@ -358,4 +391,18 @@ class ReplayAnalyzer:
         if champion in ['Ahri', 'Zed', 'Talon', 'Twisted Fate']:
             recommendations.append(f"✓ {champion}는 로밍이 강한 챔피언입니다")
 
+        # 6. 챌린저 패턴 통계 기반
+        zone = game_state.get('zone')
+        position = game_state.get('position')
+        if zone is None and position:
+            zone = self._get_zone(position.get('x', 0), position.get('y', 0))
+        if self.pattern_store is not None and zone:
+            minute = timestamp // 60
+            stats = self._lookup_pattern(champion, minute, zone)
+            if stats is not None and stats.roam_count:
+                recommendations.append(
+                    f"✓ 챌린저는 {minute}분 {zone}에서 {stats.roam_rate:.0%} 확률로 "
+                    f"로밍했습니다 (주로 {stats.top_destination})"
+                )
+
         return recommendations
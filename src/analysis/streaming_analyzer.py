@@ -0,0 +1,82 @@
+"""
+스트리밍 리플레이 분석기
+프레임을 하나씩 받아 누적값만 갱신하는 상태형 분석기입니다.
+참가자별로 최근 존 몇 개만 링 버퍼에 보관하므로 게임 길이와 상관없이
+메모리 사용량이 일정하며, 진행 중인 게임의 실시간 분석에도 쓸 수 있습니다.
+"""
+
+from typing import Dict, List, Optional
+
+from .accumulators import AnalysisContext, RoamingAccumulator
+from .event_index import EventIndex
+from .map_zones import ZoneGrid
+from .participants import ParticipantIndex
+from .replay_analyzer import ReplayAnalyzer, RoamingEvent
+from .timeline_columns import TimelineColumns
+
+
+class StreamingReplayAnalyzer(ReplayAnalyzer):
+    """
+    feed(frame)로 프레임을 넣고 finalize()로 결과를 받는 분석기
+
+    ReplayAnalyzer와 같은 누적기를 프레임 하나씩 갱신하므로 결과는 같은 프레임을
+    analyze_frames에 넘긴 것과 같습니다 (평균값은 부동소수점 합산 순서 차이만큼 다를 수 있음).
+    register_accumulator로 추가한 분석은 다음 reset()부터 적용됩니다.
+    """
+
+    def __init__(self, zone_grid: Optional[ZoneGrid] = None,
+                 participants: Optional[ParticipantIndex] = None):
+        """
+        Args:
+            zone_grid: 존 조회 그리드
+            participants: 참가자 인덱스 (없으면 참가자 ID로 팀을 추정)
+        """
+        super().__init__(zone_grid)
+        self.reset(participants)
+
+    def reset(self, participants: Optional[ParticipantIndex] = None):
+        """
+        누적 상태를 모두 지우고 새 게임을 받을 준비를 합니다.
+
+        Args:
+            participants: 새 게임의 참가자 인덱스
+        """
+        self.participants = participants
+        self.frame_count = 0
+        self.event_index = EventIndex()
+        self._accumulators = self.create_accumulators()
+
+    def feed(self, frame: Dict) -> List[RoamingEvent]:
+        """
+        프레임 하나를 반영합니다.
+
+        Args:
+            frame: 타임라인 프레임 (timestamp, participantFrames, events)
+
+        Returns:
+            이 프레임에서 새로 감지된 로밍 이벤트
+            (성공 여부는 이후 ROAMING_SUCCESS_WINDOW만큼의 프레임을 받으면서 갱신될 수 있음)
+        """
+        columns = TimelineColumns.from_frames([frame])
+        self.event_index.extend(columns)
+        context = AnalysisContext(self, columns, self.frame_count, self.participants,
+                                  self.event_index)
+        self.frame_count += 1
+
+        roaming = next(a for a in self._accumulators if isinstance(a, RoamingAccumulator))
+        seen = len(roaming.events)
+        for accumulator in self._accumulators:
+            accumulator.update(context)
+        return roaming.events[seen:]
+
+    def finalize(self) -> Dict:
+        """
+        지금까지 받은 프레임의 분석 결과를 반환합니다.
+        상태는 그대로 두므로 게임 도중에 호출한 뒤 계속 feed할 수 있습니다.
+
+        Returns:
+            analyze_frames와 같은 형식의 분석 결과 (프레임이 없으면 빈 딕셔너리)
+        """
+        if self.frame_count == 0:
+            return {}
+        return {accumulator.name: accumulator.result() for accumulator in self._accumulators}
@@ -0,0 +1,191 @@
+"""
+컬럼형 타임라인
+타임라인 프레임을 한 번만 순회해서 참가자 × 프레임 NumPy 배열과
+이벤트 테이블로 변환합니다. 분석기는 중첩 딕셔너리 대신 이 배열을 사용합니다.
+"""
+
+import numpy as np
+from dataclasses import dataclass
+from typing import Dict, Iterable, List
+
+# 이벤트 종류 (인덱스가 이벤트 테이블의 type 코드, 0은 그 외)
+EVENT_TYPES = (
+    'OTHER',
+    'CHAMPION_KILL',
+    'CHAMPION_SPECIAL_KILL',
+    'ELITE_MONSTER_KILL',
+    'BUILDING_KILL',
+    'TURRET_PLATE_DESTROYED',
+    'WARD_PLACED',
+    'WARD_KILL'
+)
+
+# 이벤트 세부 종류 (monsterType / buildingType, 0은 없음)
+EVENT_SUBTYPES = (
+    '',
+    'DRAGON',
+    'BARON_NASHOR',
+    'RIFTHERALD',
+    'HORDE',
+    'ATAKHAN',
+    'TOWER_BUILDING',
+    'INHIBITOR_BUILDING'
+)
+
+EVENT_DTYPE = np.dtype([
+    ('frame', np.int32),
+    ('timestamp', np.int64),  # 밀리초
+    ('type', np.int8),
+    ('subtype', np.int8),
+    ('killer_id', np.int16),
+    ('victim_id', np.int16),
+    ('team_id', np.int16),
+    ('x', np.int32),
+    ('y', np.int32)
+])
+
+_EVENT_TYPE_CODES = {name: code for code, name in enumerate(EVENT_TYPES)}
+_EVENT_SUBTYPE_CODES = {name: code for code, name in enumerate(EVENT_SUBTYPES)}
+
+
+def event_type_code(name: str) -> int:
+    """이벤트 종류 이름을 코드로 변환합니다."""
+    return _EVENT_TYPE_CODES[name]
+
+
+def event_subtype_code(name: str) -> int:
+    """이벤트 세부 종류 이름을 코드로 변환합니다."""
+    return _EVENT_SUBTYPE_CODES[name]
+
+
+@dataclass
+class TimelineColumns:
+    """
+    컬럼형 타임라인
+
+    참가자 배열은 모두 (프레임 수, 참가자 수) 모양이며, 열 순서는 participant_ids를 따릅니다.
+    프레임에 없던 참가자나 값은 0으로 채우고 present / has_position으로 구분합니다.
+    """
+    participant_ids: List[str]
+    timestamps: np.ndarray  # (n_frames,) 밀리초
+    present: np.ndarray  # 프레임에 참가자 데이터가 있는지
+    has_position: np.ndarray  # 위치 데이터가 있는지
+    x: np.ndarray
+    y: np.ndarray
+    level: np.ndarray
+    minions_killed: np.ndarray
+    jungle_minions_killed: np.ndarray
+    total_gold: np.ndarray
+    current_gold: np.ndarray
+    xp: np.ndarray
+    ward_score: np.ndarray
+    events: np.ndarray  # EVENT_DTYPE 구조화 배열 (프레임, 발생 순서)
+    assist_offsets: np.ndarray  # events[i]의 어시스트는 assist_ids[offsets[i]:offsets[i + 1]]
+    assist_ids: np.ndarray
+
+    @property
+    def n_frames(self) -> int:
+        return len(self.timestamps)
+
+    @property
+    def n_participants(self) -> int:
+        return len(self.participant_ids)
+
+    def column_index(self, participant_id) -> int:
+        """참가자 ID의 열 번호를 반환합니다."""
+        return self.participant_ids.index(str(participant_id))
+
+    def event_assists(self, event_index: int) -> np.ndarray:
+        """이벤트의 어시스트 참가자 ID 배열을 반환합니다."""
+        start, end = self.assist_offsets[event_index], self.assist_offsets[event_index + 1]
+        return self.assist_ids[start:end]
+
+    @classmethod
+    def from_timeline(cls, timeline_data: Dict) -> 'TimelineColumns':
+        """Riot API 타임라인 딕셔너리에서 만듭니다."""
+        return cls.from_frames(timeline_data.get('info', {}).get('frames', []))
+
+    @classmethod
+    def from_frames(cls, frames: Iterable[Dict]) -> 'TimelineColumns':
+        """
+        프레임 이터러블에서 만듭니다.
+        스트림을 그대로 받을 수 있으며, 각 프레임은 필요한 값만 읽고 버립니다.
+        """
+        timestamps = []
+        frame_rows = []  # 프레임별 [(participant_id, 값 튜플), ...]
+        participant_ids = set()
+        event_rows = []
+        assist_ids = []
+        assist_offsets = [0]
+
+        for frame_index, frame in enumerate(frames):
+            timestamps.append(frame.get('timestamp', 0))
+
+            rows = []
+            for participant_id, data in frame.get('participantFrames', {}).items():
+                participant_ids.add(participant_id)
+                position = data.get('position')
+                rows.append((
+                    participant_id,
+                    bool(position),
+                    position.get('x', 0) if position else 0,
+                    position.get('y', 0) if position else 0,
+                    data.get('level', data.get('championStats', {}).get('level', 0)),
+                    data.get('minionsKilled', data.get('minionKills', 0)),
+                    data.get('jungleMinionsKilled', 0),
+                    data.get('totalGold', 0),
+                    data.get('currentGold', 0),
+                    data.get('xp', 0),
+                    data.get('wardScore', 0)
+                ))
+            frame_rows.append(rows)
+
+            for event in frame.get('events', []):
+                subtype = event.get('monsterType') or event.get('buildingType') or ''
+                position = event.get('position') or {}
+                event_rows.append((
+                    frame_index,
+                    event.get('timestamp', 0),
+                    _EVENT_TYPE_CODES.get(event.get('type'), 0),
+                    _EVENT_SUBTYPE_CODES.get(subtype, 0),
+                    event.get('killerId', 0),
+                    event.get('victimId', 0),
+                    event.get('teamId', event.get('killerTeamId', 0)),
+                    position.get('x', 0),
+                    position.get('y', 0)
+                ))
+                assist_ids.extend(event.get('assistingParticipantIds', []))
+                assist_offsets.append(len(assist_ids))
+
+        ordered_ids = sorted(
+            participant_ids, key=lambda pid: (0, int(pid)) if pid.isdigit() else (1, pid)
+        )
+        columns = {pid: index for index, pid in enumerate(ordered_ids)}
+        shape = (len(frame_rows), len(ordered_ids))
+
+        present = np.zeros(shape, dtype=bool)
+        values = np.zeros(shape + (10,), dtype=np.int32)
+        for frame_index, rows in enumerate(frame_rows):
+            for row in rows:
+                column = columns[row[0]]
+                present[frame_index, column] = True
+                values[frame_index, column] = row[1:]
+
+        return cls(
+            participant_ids=ordered_ids,
+            timestamps=np.asarray(timestamps, dtype=np.int64),
+            present=present,
+            has_position=values[:, :, 0].astype(bool),
+            x=np.ascontiguousarray(values[:, :, 1]),
+            y=np.ascontiguousarray(values[:, :, 2]),
+            level=np.ascontiguousarray(values[:, :, 3]),
+            minions_killed=np.ascontiguousarray(values[:, :, 4]),
+            jungle_minions_killed=np.ascontiguousarray(values[:, :, 5]),
+            total_gold=np.ascontiguousarray(values[:, :, 6]),
+            current_gold=np.ascontiguousarray(values[:, :, 7]),
+            xp=np.ascontiguousarray(values[:, :, 8]),
+            ward_score=np.ascontiguousarray(values[:, :, 9]),
+            events=np.array(event_rows, dtype=EVENT_DTYPE),
+            assist_offsets=np.asarray(assist_offsets, dtype=np.int64),
+            assist_ids=np.asarray(assist_ids, dtype=np.int16)
+        )
@@ -1,3 +1,11 @@
 from .riot_client import RiotAPIClient
+from .async_client import AsyncRiotClient
+from .cache import TTLCache
+from .match_store import MatchStore
+from .rate_limiter import RateLimiter
+from .retry import RetryPolicy
 
-__all__ = ['RiotAPIClient']
+__all__ = [
+    'RiotAPIClient', 'AsyncRiotClient', 'MatchStore', 'RateLimiter',
+    'RetryPolicy', 'TTLCache'
+]
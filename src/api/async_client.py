@@ -0,0 +1,248 @@
+"""
+비동기 Riot Games API 클라이언트
+aiohttp로 여러 매치/타임라인을 동시에 내려받습니다.
+동시 요청 수는 세마포어와 레이트 리밋 스케줄러로 제한됩니다.
+"""
+
+import asyncio
+from typing import Dict, List, Optional
+
+import aiohttp
+from dotenv import load_dotenv
+
+from .client_base import RiotClientBase
+from .match_store import MatchStore
+from .rate_limiter import RateLimiter
+from .retry import RetryPolicy
+from .singleflight import AsyncSingleFlight
+
+load_dotenv()
+
+
+class AsyncRiotClient(RiotClientBase):
+    """RiotAPIClient와 같은 인터페이스를 가진 비동기 클라이언트"""
+
+    def __init__(self, api_key: Optional[str] = None, region: str = 'kr',
+                 rate_limiter: Optional[RateLimiter] = None,
+                 max_concurrency: int = 20, pool_size: int = 10,
+                 keep_alive: bool = True, compression: bool = True,
+                 match_store: Optional[MatchStore] = None,
+                 use_match_store: bool = True,
+                 cache_size: int = 1024,
+                 cache_ttls: Optional[Dict[str, float]] = None,
+                 retry_policy: Optional[RetryPolicy] = None):
+        """
+        Args:
+            api_key: Riot API 키 (없으면 환경변수에서 가져옴)
+            region: 지역 (기본값: kr)
+            rate_limiter: 공유 레이트 리밋 스케줄러 (동기 클라이언트와 공유 가능)
+            max_concurrency: 동시에 진행할 최대 요청 수
+            pool_size: 라우팅 호스트별 커넥션 풀 크기
+            keep_alive: 커넥션 재사용 여부
+            compression: gzip/brotli 응답 압축 협상 여부
+            match_store: 매치/타임라인 로컬 저장소 (동기 클라이언트와 공유 가능)
+            use_match_store: False이면 로컬 저장소를 사용하지 않음
+            cache_size: 메모리 캐시 최대 항목 수 (0이면 캐시 사용 안 함)
+            cache_ttls: 메서드별 캐시 유지 시간 (CACHE_TTLS를 덮어씀)
+            retry_policy: 재시도/타임아웃 정책 (없으면 기본 정책)
+        """
+        super().__init__(api_key, region, rate_limiter, pool_size, keep_alive, compression,
+                         match_store, use_match_store, cache_size, cache_ttls, retry_policy)
+        self.max_concurrency = max_concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._inflight = AsyncSingleFlight()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        """HTTP 세션을 닫습니다."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit_per_host=self.pool_size, force_close=not self.keep_alive
+            )
+            headers = dict(self.headers)
+            if not self.compression:
+                headers['Accept-Encoding'] = 'identity'
+            timeout = aiohttp.ClientTimeout(
+                sock_connect=self.retry_policy.connect_timeout,
+                sock_read=self.retry_policy.read_timeout
+            )
+            self._session = aiohttp.ClientSession(
+                headers=headers, connector=connector, timeout=timeout
+            )
+        return self._session
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # 세마포어는 실행 중인 이벤트 루프에서 만들어야 합니다
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def _make_request(self, endpoint: str, params: Dict = None,
+                            host: Optional[str] = None, method: str = '',
+                            default=None):
+        """API 요청을 수행합니다. 인자는 RiotAPIClient._make_request와 같습니다."""
+        default = {} if default is None else default
+        key, ttl = self._cache_entry(method, endpoint, params)
+        data = self._cache_get(key, ttl)
+        if data is not None:
+            return data
+
+        leader = []
+
+        async def fetch():
+            leader.append(True)
+            data = await self._fetch(endpoint, params, host, method, default)
+            self._cache_set(key, ttl, data)
+            return data
+
+        data = await self._inflight.do(key, fetch)
+        if not leader:
+            self.request_stats.record(method, 'coalesced')
+        return data
+
+    async def _fetch(self, endpoint: str, params: Optional[Dict], host: Optional[str],
+                     method: str, default):
+        """네트워크로 요청을 보냅니다. 재시도 규칙은 RiotAPIClient._fetch와 같습니다."""
+        host = host or self.region
+        url = self._url(host, endpoint)
+        attempt = 0
+
+        while True:
+            # 레이트 리밋 토큰을 먼저 얻고 나서 세마포어에 들어갑니다.
+            # 반대로 하면 막힌 호스트를 기다리는 요청이 자리를 모두 차지해
+            # 다른 호스트로 가는 요청까지 멈춥니다.
+            await self.rate_limiter.acquire_async(host, method)
+            async with self._get_semaphore():
+                self.request_stats.record(method, 'requests')
+                status, retry_after, limit_type, error = None, None, None, None
+
+                try:
+                    async with self._get_session().get(url, params=params) as response:
+                        status = response.status
+                        retry = self._response_error(host, method, url, status,
+                                                     response.headers)
+                        if retry is None:
+                            response.raise_for_status()
+                            try:
+                                return await response.json()
+                            except (aiohttp.ContentTypeError, ValueError) as e:
+                                self._record_failure(method, f"API 응답 해석 실패 ({method})", e)
+                                return default
+                        error, retry_after, limit_type = retry
+                except (asyncio.TimeoutError, aiohttp.ClientConnectionError) as e:
+                    self.request_stats.record(method, 'timeouts')
+                    error = e
+                except aiohttp.ClientError as e:
+                    self._record_failure(method, f"API 요청 실패 ({method})", e)
+                    return default
+
+            # 대기 중에는 세마포어를 놓아 다른 요청이 진행되게 합니다
+            delay = self._retry_delay(host, method, status, attempt, error,
+                                      retry_after, limit_type)
+            if delay is None:
+                return default
+            if delay > 0:
+                await asyncio.sleep(delay)
+            attempt += 1
+
+    async def get_summoner_by_name(self, summoner_name: str) -> Dict:
+        """소환사 이름으로 소환사 정보를 가져옵니다."""
+        endpoint = f"/lol/summoner/v4/summoners/by-name/{summoner_name}"
+        return await self._make_request(endpoint, method='summoner-v4.by-name')
+
+    async def get_summoner_by_id(self, summoner_id: str) -> Dict:
+        """암호화된 소환사 ID로 소환사 정보를 가져옵니다."""
+        endpoint = f"/lol/summoner/v4/summoners/{summoner_id}"
+        return await self._make_request(endpoint, method='summoner-v4.by-id')
+
+    async def get_summoner_by_puuid(self, puuid: str) -> Dict:
+        """PUUID로 소환사 정보를 가져옵니다."""
+        endpoint = f"/lol/summoner/v4/summoners/by-puuid/{puuid}"
+        return await self._make_request(endpoint, method='summoner-v4.by-puuid')
+
+    async def get_challenger_players(self, queue: str = 'RANKED_SOLO_5x5') -> Dict:
+        """챌린저 플레이어 목록을 가져옵니다."""
+        endpoint = f"/lol/league/v4/challengerleagues/by-queue/{queue}"
+        return await self._make_request(endpoint, method='league-v4.challenger')
+
+    async def get_match_history(self, puuid: str, count: int = 20) -> List[str]:
+        """플레이어의 최근 매치 ID 목록을 가져옵니다."""
+        endpoint = f"/lol/match/v5/matches/by-puuid/{puuid}/ids"
+        return await self._make_request(
+            endpoint, params={'count': count}, host=self.routing,
+            method='match-v5.ids', default=[]
+        )
+
+    async def get_match_details(self, match_id: str) -> Dict:
+        """매치의 상세 정보를 가져옵니다."""
+        endpoint = f"/lol/match/v5/matches/{match_id}"
+        return await self._get_stored(
+            match_id, 'match',
+            lambda: self._make_request(endpoint, host=self.routing, method='match-v5.match')
+        )
+
+    async def get_match_timeline(self, match_id: str) -> Dict:
+        """매치의 타임라인 데이터를 가져옵니다 (로밍, 포지셔닝 분석용)."""
+        endpoint = f"/lol/match/v5/matches/{match_id}/timeline"
+        return await self._get_stored(
+            match_id, 'timeline',
+            lambda: self._make_request(endpoint, host=self.routing, method='match-v5.timeline')
+        )
+
+    async def _get_stored(self, match_id: str, kind: str, fetch) -> Dict:
+        """로컬 저장소를 먼저 확인하고, 없으면 받아와서 저장합니다."""
+        if self.match_store is None:
+            return await fetch()
+
+        async def load():
+            # 압축 해제와 파일 입출력은 이벤트 루프 밖에서 수행합니다
+            data = await asyncio.to_thread(self.match_store.get, match_id, kind)
+            if data is not None:
+                return data
+
+            data = await fetch()
+            if data:
+                await asyncio.to_thread(self.match_store.put, match_id, kind, data)
+            return data
+
+        return await self._inflight.do(('match-store', match_id, kind), load)
+
+    async def get_matches(self, match_ids: List[str]) -> Dict[str, Dict]:
+        """여러 매치의 상세 정보를 동시에 가져옵니다."""
+        results = await asyncio.gather(
+            *(self.get_match_details(match_id) for match_id in match_ids)
+        )
+        return dict(zip(match_ids, results))
+
+    async def get_timelines(self, match_ids: List[str]) -> Dict[str, Dict]:
+        """여러 매치의 타임라인을 동시에 가져옵니다."""
+        results = await asyncio.gather(
+            *(self.get_match_timeline(match_id) for match_id in match_ids)
+        )
+        return dict(zip(match_ids, results))
+
+    async def get_matches_with_timelines(self, match_ids: List[str]) -> Dict[str, Dict]:
+        """
+        매치 상세 정보와 타임라인을 함께 동시에 가져옵니다.
+
+        Returns:
+            {match_id: {'details': ..., 'timeline': ...}}
+        """
+        details, timelines = await asyncio.gather(
+            self.get_matches(match_ids), self.get_timelines(match_ids)
+        )
+        return {
+            match_id: {'details': details[match_id], 'timeline': timelines[match_id]}
+            for match_id in match_ids
+        }
@@ -0,0 +1,91 @@
+"""
+메모리 응답 캐시
+엔드포인트별 TTL과 크기 기반 LRU 제거를 지원합니다.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """항목별 만료 시간을 가진 스레드 안전 LRU 캐시"""
+
+    def __init__(self, maxsize: int = 1024, clock=time.monotonic):
+        """
+        Args:
+            maxsize: 최대 항목 수 (넘으면 가장 오래 사용하지 않은 항목 제거)
+            clock: 시간 함수 (테스트용)
+        """
+        self.maxsize = maxsize
+        self._clock = clock
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def get(self, key: Hashable, default=None):
+        """만료되지 않은 값을 반환합니다."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self.misses += 1
+                return default
+
+            expires_at, value = item
+            if expires_at <= self._clock():
+                del self._data[key]
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: float):
+        """값을 ttl초 동안 저장합니다."""
+        with self._lock:
+            self._data[key] = (self._clock() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> bool:
+        """항목 하나를 제거합니다."""
+        with self._lock:
+            return self._data.pop(key, None) is not None
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        """조건에 맞는 키를 모두 제거하고 제거한 개수를 반환합니다."""
+        with self._lock:
+            keys = [key for key in self._data if predicate(key)]
+            for key in keys:
+                del self._data[key]
+            return len(keys)
+
+    def clear(self):
+        """모든 항목을 제거합니다."""
+        with self._lock:
+            self._data.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """적중/실패/제거 횟수를 반환합니다."""
+        with self._lock:
+            return {
+                'size': len(self._data),
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions
+            }
+
+
+def make_cache_key(method: str, endpoint: str, params: Optional[Dict]) -> Tuple:
+    """요청을 캐시 키로 변환합니다."""
+    return (method, endpoint, tuple(sorted((params or {}).items())))
@@ -0,0 +1,194 @@
+"""
+Riot API 클라이언트 공통 부분
+동기(requests)/비동기(aiohttp) 클라이언트가 함께 쓰는 설정, 캐시 정책,
+통계, 응답 상태 해석과 재시도 판단을 모아 둡니다. 전송 방식에 따라 다른
+요청 전송과 대기만 각 클라이언트가 구현합니다.
+"""
+
+import os
+from typing import Dict, Hashable, Optional, Tuple
+
+from dotenv import load_dotenv
+
+from .cache import TTLCache, make_cache_key
+from .match_store import MatchStore
+from .rate_limiter import RateLimiter
+from .retry import RETRYABLE_STATUS, RequestStats, RetryPolicy
+
+load_dotenv()
+
+
+class RiotClientBase:
+    """RiotAPIClient와 AsyncRiotClient의 공통 기반 클래스"""
+
+    BASE_URLS = {
+        'kr': 'https://kr.api.riotgames.com',
+        'asia': 'https://asia.api.riotgames.com'
+    }
+
+    # 플랫폼 지역 -> 매치 API 라우팅 지역
+    REGIONAL_ROUTING = {
+        'kr': 'asia'
+    }
+
+    # 메서드별 메모리 캐시 유지 시간 (초)
+    CACHE_TTLS = {
+        'summoner-v4.by-name': 24 * 3600,
+        'summoner-v4.by-puuid': 24 * 3600,
+        'summoner-v4.by-id': 24 * 3600,
+        'league-v4.challenger': 10 * 60,
+        'match-v5.ids': 60
+    }
+
+    def __init__(self, api_key: Optional[str] = None, region: str = 'kr',
+                 rate_limiter: Optional[RateLimiter] = None,
+                 pool_size: int = 10, keep_alive: bool = True,
+                 compression: bool = True,
+                 match_store: Optional[MatchStore] = None,
+                 use_match_store: bool = True,
+                 cache_size: int = 1024,
+                 cache_ttls: Optional[Dict[str, float]] = None,
+                 retry_policy: Optional[RetryPolicy] = None):
+        self.api_key = api_key or os.getenv('RIOT_API_KEY')
+        self.region = region if region in self.BASE_URLS else 'kr'
+        self.routing = self.REGIONAL_ROUTING.get(self.region, 'asia')
+        self.base_url = self.BASE_URLS[self.region]
+        self.headers = {'X-Riot-Token': self.api_key}
+        self.rate_limiter = rate_limiter or RateLimiter()
+
+        self.pool_size = pool_size
+        self.keep_alive = keep_alive
+        self.compression = compression
+
+        if use_match_store:
+            self.match_store = match_store or MatchStore()
+        else:
+            self.match_store = None
+
+        self.cache_ttls = dict(self.CACHE_TTLS, **(cache_ttls or {}))
+        self.response_cache = TTLCache(cache_size) if cache_size > 0 else None
+
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.request_stats = RequestStats()
+
+    def _cache_entry(self, method: str, endpoint: str,
+                     params: Optional[Dict]) -> Tuple[Hashable, Optional[float]]:
+        """
+        요청의 캐시 키와 유지 시간을 반환합니다.
+        CACHE_TTLS에 없는 메서드이거나 캐시를 쓰지 않으면 유지 시간은 None입니다.
+        """
+        key = make_cache_key(method, endpoint, params)
+        ttl = self.cache_ttls.get(method)
+        if self.response_cache is None or not ttl:
+            ttl = None
+        return key, ttl
+
+    def _cache_get(self, key: Hashable, ttl: Optional[float]):
+        return self.response_cache.get(key) if ttl else None
+
+    def _cache_set(self, key: Hashable, ttl: Optional[float], data):
+        if ttl and data:
+            self.response_cache.set(key, data, ttl)
+
+    def _url(self, host: str, endpoint: str) -> str:
+        return f"{self.BASE_URLS[host]}{endpoint}"
+
+    def _response_error(self, host: str, method: str, url: str, status: int,
+                        headers) -> Optional[Tuple[str, Optional[str], Optional[str]]]:
+        """
+        응답 헤더로 레이트 리밋을 갱신하고, 다시 시도할 상태 코드인지 판단합니다.
+
+        Returns:
+            다시 시도할 응답이면 (오류 메시지, Retry-After 헤더 값, X-Rate-Limit-Type 헤더 값),
+            아니면 None
+        """
+        self.rate_limiter.update_from_headers(host, method, headers)
+        if status == 429:
+            self.request_stats.record(method, 'throttled')
+            return (f"429 Too Many Requests ({url})", headers.get('Retry-After'),
+                    headers.get('X-Rate-Limit-Type'))
+        if status in RETRYABLE_STATUS:
+            self.request_stats.record(method, 'server_errors')
+            return f"{status} Server Error ({url})", None, None
+        return None
+
+    def _retry_delay(self, host: str, method: str, status: Optional[int], attempt: int,
+                     error, retry_after: Optional[str] = None,
+                     limit_type: Optional[str] = None) -> Optional[float]:
+        """
+        실패한 요청을 다시 시도할지 정하고 대기 시간을 계산합니다.
+
+        429는 X-Rate-Limit-Type에 따라 막는 범위가 다릅니다.
+        application이면 호스트 전체, method면 (호스트, 메서드)만 막고,
+        service이거나 헤더가 없으면(Riot 앞단의 제한) 이 요청만 기다립니다.
+
+        Args:
+            status: HTTP 상태 코드 (타임아웃/연결 오류이면 None)
+            attempt: 지금까지의 재시도 횟수
+            error: 로그에 남길 오류
+            retry_after: Retry-After 헤더 값
+            limit_type: X-Rate-Limit-Type 헤더 값
+
+        Returns:
+            호출한 쪽이 직접 기다릴 시간 (초, 레이트 리미터가 대신 막으면 0),
+            포기해야 하면 None
+        """
+        policy = self.retry_policy
+        if not policy.should_retry(status, attempt):
+            self._record_failure(method, f"API 요청 실패 ({method}, {attempt}회 재시도)", error)
+            return None
+
+        self.request_stats.record(method, 'retries')
+        delay = policy.get_delay(attempt, retry_after, status)
+        if status == 429 and limit_type == 'application':
+            # 같은 호스트로 가는 다른 요청도 함께 기다리게 합니다
+            self.rate_limiter.block(host, delay)
+            return 0.0
+        if status == 429 and limit_type == 'method':
+            self.rate_limiter.block(host, delay, method=method)
+            return 0.0
+        return delay
+
+    def _record_failure(self, method: str, message: str, error):
+        self.request_stats.record(method, 'failures')
+        print(f"{message}: {error}")
+
+    def get_cache_stats(self) -> Dict[str, int]:
+        """로컬 매치 저장소의 적중/실패 횟수를 반환합니다."""
+        if self.match_store is None:
+            return {'hits': 0, 'misses': 0, 'writes': 0}
+        return self.match_store.get_stats()
+
+    def get_request_stats(self, method: Optional[str] = None) -> Dict:
+        """
+        메서드별 요청/재시도/429/5xx/타임아웃/실패/병합 횟수를 반환합니다.
+
+        Args:
+            method: 특정 메서드만 조회 (예: 'match-v5.timeline')
+        """
+        return self.request_stats.get(method)
+
+    def get_response_cache_stats(self) -> Dict[str, int]:
+        """메모리 캐시의 크기와 적중/실패/제거 횟수를 반환합니다."""
+        if self.response_cache is None:
+            return {'size': 0, 'hits': 0, 'misses': 0, 'evictions': 0}
+        return self.response_cache.get_stats()
+
+    def invalidate_cache(self, method: Optional[str] = None,
+                         endpoint: Optional[str] = None) -> int:
+        """
+        메모리 캐시를 비웁니다.
+
+        Args:
+            method: 이 메서드의 항목만 제거 (예: 'match-v5.ids')
+            endpoint: 이 경로의 항목만 제거
+
+        Returns:
+            제거한 항목 수
+        """
+        if self.response_cache is None:
+            return 0
+        return self.response_cache.invalidate_where(
+            lambda key: (method is None or key[0] == method) and
+                        (endpoint is None or key[1] == endpoint)
+        )
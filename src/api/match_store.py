@@ -0,0 +1,162 @@
+"""
+로컬 매치 저장소
+끝난 게임의 매치/타임라인 데이터는 바뀌지 않으므로 매치 ID를 키로
+gzip 압축 JSON 파일에 저장해 두고 네트워크 요청 전에 먼저 확인합니다.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from typing import Dict, IO, Optional
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+class MatchStore:
+    """매치 ID로 주소를 정하는 압축 파일 저장소"""
+
+    KINDS = ('match', 'timeline')
+
+    def __init__(self, root: Optional[str] = None, compresslevel: int = 6):
+        """
+        Args:
+            root: 저장소 디렉토리 (없으면 DB_PATH 옆의 matches 디렉토리)
+            compresslevel: gzip 압축 레벨
+        """
+        if root is None:
+            db_path = os.getenv('DB_PATH', './data/lol_data.db')
+            root = os.path.join(os.path.dirname(db_path) or '.', 'matches')
+        self.root = root
+        self.compresslevel = compresslevel
+
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+    def path_for(self, match_id: str, kind: str) -> str:
+        """
+        데이터 파일 경로를 반환합니다.
+        한 디렉토리에 파일이 몰리지 않도록 매치 ID 해시 앞 두 글자로 나눕니다.
+        """
+        if kind not in self.KINDS:
+            raise ValueError(f"알 수 없는 데이터 종류: {kind}")
+        shard = hashlib.sha1(match_id.encode('utf-8')).hexdigest()[:2]
+        return os.path.join(self.root, kind, shard, f"{match_id}.json.gz")
+
+    def contains(self, match_id: str, kind: str) -> bool:
+        """저장되어 있는지 확인합니다 (통계에는 반영하지 않음)."""
+        return os.path.exists(self.path_for(match_id, kind))
+
+    def get(self, match_id: str, kind: str) -> Optional[Dict]:
+        """저장된 데이터를 반환합니다. 없으면 None."""
+        path = self.path_for(match_id, kind)
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, EOFError, ValueError):
+            self._count('misses')
+            return None
+
+        self._count('hits')
+        return data
+
+    def open(self, match_id: str, kind: str) -> Optional[IO[bytes]]:
+        """
+        압축을 풀면서 읽는 바이너리 스트림을 반환합니다. 없으면 None.
+        큰 타임라인을 전부 메모리에 올리지 않고 읽을 때 사용합니다.
+        """
+        path = self.path_for(match_id, kind)
+        if not os.path.exists(path):
+            self._count('misses')
+            return None
+
+        self._count('hits')
+        return gzip.open(path, 'rb')
+
+    def open_writer(self, match_id: str, kind: str) -> '_PendingWrite':
+        """
+        원본 JSON 바이트를 조금씩 받아 압축 저장하는 쓰기 객체를 반환합니다.
+        응답을 스트리밍으로 파싱하면서 동시에 저장할 때 사용합니다.
+        commit()을 호출해야 파일이 저장소에 나타납니다.
+        """
+        path = self.path_for(match_id, kind)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        return _PendingWrite(self, path)
+
+    def put(self, match_id: str, kind: str, data: Dict):
+        """데이터를 저장합니다. 쓰는 도중 중단되어도 깨진 파일이 남지 않습니다."""
+        path = self.path_for(match_id, kind)
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as raw:
+                with gzip.GzipFile(fileobj=raw, mode='wb',
+                                   compresslevel=self.compresslevel) as f:
+                    f.write(json.dumps(data, separators=(',', ':')).encode('utf-8'))
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        self._count('writes')
+
+    def get_stats(self) -> Dict[str, int]:
+        """캐시 적중/실패 횟수를 반환합니다."""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'writes': self.writes}
+
+    def _count(self, name: str):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+
+class _PendingWrite:
+    """MatchStore.open_writer가 반환하는 쓰기 객체"""
+
+    def __init__(self, store: MatchStore, path: str):
+        self._store = store
+        self._path = path
+        fd, self._tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        self._raw = os.fdopen(fd, 'wb')
+        self._gzip = gzip.GzipFile(fileobj=self._raw, mode='wb',
+                                   compresslevel=store.compresslevel)
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
+
+    def write(self, data: bytes):
+        self._gzip.write(data)
+
+    def commit(self):
+        """임시 파일을 저장소 경로로 옮깁니다."""
+        if self._closed:
+            return
+        self._gzip.close()
+        self._raw.close()
+        os.replace(self._tmp_path, self._path)
+        self._closed = True
+        self._store._count('writes')
+
+    def abort(self):
+        """쓰던 내용을 버립니다."""
+        if self._closed:
+            return
+        self._gzip.close()
+        self._raw.close()
+        os.remove(self._tmp_path)
+        self._closed = True
@@ -0,0 +1,199 @@
+"""
+Riot API 레이트 리밋 스케줄러
+X-App-Rate-Limit / X-Method-Rate-Limit 헤더를 읽어 라우팅 호스트별로
+여러 시간 창(window)을 추적하고, 버킷이 실제로 비었을 때만 대기합니다.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+# 헤더를 받기 전까지 사용하는 개발용 키 기본 제한 (요청 수, 초)
+DEFAULT_APP_LIMITS = [(20, 1), (100, 120)]
+
+
+def parse_rate_limit_header(value: Optional[str]) -> List[Tuple[int, int]]:
+    """
+    "20:1,100:120" 형식의 헤더를 [(20, 1), (100, 120)]으로 변환합니다.
+    """
+    limits = []
+    if not value:
+        return limits
+
+    for part in value.split(','):
+        try:
+            count, window = part.strip().split(':')
+            limits.append((int(count), int(window)))
+        except ValueError:
+            continue
+
+    return limits
+
+
+class _Bucket:
+    """
+    하나의 시간 창에 대한 버킷
+
+    Riot 서버는 고정 창으로 카운트하므로, 어떤 구간에서도 한도를 넘지 않도록
+    최근 요청 시각을 기록하는 슬라이딩 로그 방식으로 토큰을 계산합니다.
+    """
+
+    def __init__(self, limit: int, window: float):
+        self.limit = limit
+        self.window = window
+        self.timestamps = deque()
+
+    def _evict(self, now: float):
+        while self.timestamps and now - self.timestamps[0] >= self.window:
+            self.timestamps.popleft()
+
+    def wait_time(self, now: float) -> float:
+        """토큰이 생길 때까지 남은 시간 (0이면 즉시 사용 가능)"""
+        self._evict(now)
+        if len(self.timestamps) < self.limit:
+            return 0.0
+        return self.timestamps[len(self.timestamps) - self.limit] + self.window - now
+
+    def consume(self, now: float):
+        self.timestamps.append(now)
+
+    def sync(self, server_count: int, now: float):
+        """서버가 알려준 사용량이 더 크면 로컬 기록을 맞춥니다."""
+        self._evict(now)
+        while len(self.timestamps) < min(server_count, self.limit):
+            self.timestamps.append(now)
+
+
+class RateLimiter:
+    """
+    라우팅 호스트(kr, asia 등)별 앱 제한과 (호스트, 메서드)별 메서드 제한을
+    함께 관리하는 스레드 안전 스케줄러입니다.
+    """
+
+    def __init__(self, app_limits: Optional[List[Tuple[int, int]]] = None,
+                 clock=time.monotonic, sleep=time.sleep):
+        """
+        Args:
+            app_limits: 헤더를 받기 전 사용할 앱 제한 [(요청 수, 초), ...]
+            clock: 시간 함수 (테스트용)
+            sleep: 대기 함수 (테스트용)
+        """
+        self.default_app_limits = app_limits or DEFAULT_APP_LIMITS
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._app_buckets: Dict[str, List[_Bucket]] = {}
+        self._method_buckets: Dict[Tuple[str, str], List[_Bucket]] = {}
+        self._blocked_until: Dict[str, float] = {}
+        self._method_blocked_until: Dict[Tuple[str, str], float] = {}
+
+    def _buckets_for(self, host: str, method: str) -> List[_Bucket]:
+        if host not in self._app_buckets:
+            self._app_buckets[host] = [
+                _Bucket(limit, window) for limit, window in self.default_app_limits
+            ]
+        return self._app_buckets[host] + self._method_buckets.get((host, method), [])
+
+    def reserve(self, host: str, method: str) -> float:
+        """
+        토큰을 예약합니다.
+
+        Returns:
+            0이면 토큰을 소비한 것이고, 양수이면 그만큼 기다린 뒤 다시 시도해야 합니다.
+        """
+        with self._lock:
+            now = self._clock()
+            buckets = self._buckets_for(host, method)
+
+            delay = max(self._blocked_until.get(host, 0.0),
+                        self._method_blocked_until.get((host, method), 0.0)) - now
+            for bucket in buckets:
+                delay = max(delay, bucket.wait_time(now))
+
+            if delay > 0:
+                return delay
+
+            for bucket in buckets:
+                bucket.consume(now)
+            return 0.0
+
+    def acquire(self, host: str, method: str):
+        """토큰을 얻을 때까지 블로킹합니다."""
+        while True:
+            delay = self.reserve(host, method)
+            if delay <= 0:
+                return
+            self._sleep(delay)
+
+    async def acquire_async(self, host: str, method: str):
+        """토큰을 얻을 때까지 이벤트 루프를 막지 않고 대기합니다."""
+        while True:
+            delay = self.reserve(host, method)
+            if delay <= 0:
+                return
+            await asyncio.sleep(delay)
+
+    def update_from_headers(self, host: str, method: str, headers):
+        """
+        응답 헤더로부터 제한과 현재 사용량을 갱신합니다.
+
+        Args:
+            host: 라우팅 호스트 (kr, asia 등)
+            method: 메서드 식별자 (예: match-v5.timeline)
+            headers: 응답 헤더 (대소문자 무시 매핑)
+        """
+        app_limits = parse_rate_limit_header(headers.get('X-App-Rate-Limit'))
+        app_counts = parse_rate_limit_header(headers.get('X-App-Rate-Limit-Count'))
+        method_limits = parse_rate_limit_header(headers.get('X-Method-Rate-Limit'))
+        method_counts = parse_rate_limit_header(headers.get('X-Method-Rate-Limit-Count'))
+
+        with self._lock:
+            now = self._clock()
+            if app_limits:
+                self._app_buckets[host] = self._rebuild(
+                    self._app_buckets.get(host, []), app_limits
+                )
+            if method_limits:
+                self._method_buckets[(host, method)] = self._rebuild(
+                    self._method_buckets.get((host, method), []), method_limits
+                )
+
+            self._sync(self._app_buckets.get(host, []), app_counts, now)
+            self._sync(self._method_buckets.get((host, method), []), method_counts, now)
+
+    def block(self, host: str, seconds: float, method: Optional[str] = None):
+        """
+        429 응답 등으로 일정 시간 요청을 막습니다.
+
+        Args:
+            host: 라우팅 호스트
+            seconds: 막을 시간 (초)
+            method: 주어지면 이 메서드만 막고, 없으면 호스트 전체를 막음
+        """
+        with self._lock:
+            until = self._clock() + seconds
+            blocked = self._blocked_until if method is None else self._method_blocked_until
+            key = host if method is None else (host, method)
+            blocked[key] = max(blocked.get(key, 0.0), until)
+
+    @staticmethod
+    def _rebuild(buckets: List[_Bucket], limits: List[Tuple[int, int]]) -> List[_Bucket]:
+        """기존 기록을 유지하면서 제한값이 바뀐 버킷만 새로 만듭니다."""
+        existing = {bucket.window: bucket for bucket in buckets}
+        rebuilt = []
+        for limit, window in limits:
+            bucket = existing.get(window)
+            if bucket is None:
+                bucket = _Bucket(limit, window)
+            bucket.limit = limit
+            rebuilt.append(bucket)
+        return rebuilt
+
+    @staticmethod
+    def _sync(buckets: List[_Bucket], counts: List[Tuple[int, int]], now: float):
+        by_window = {window: count for count, window in counts}
+        for bucket in buckets:
+            if bucket.window in by_window:
+                bucket.sync(by_window[bucket.window], now)
@@ -0,0 +1,111 @@
+"""
+재시도 정책
+429 응답은 Retry-After 헤더를 따르고, 5xx 응답과 타임아웃은
+지터가 섞인 지수 백오프로 다시 시도합니다.
+"""
+
+import random
+import threading
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+# 재시도할 서버 오류 상태 코드
+RETRYABLE_STATUS = {500, 502, 503, 504}
+
+
+@dataclass
+class RetryPolicy:
+    """재시도 정책 설정"""
+    max_retries: int = 4
+    backoff_base: float = 0.5  # 첫 재시도 대기 시간 (초)
+    backoff_max: float = 30.0  # 최대 대기 시간 (초)
+    jitter: float = 0.5  # 대기 시간에 곱해지는 무작위 비율 (0 ~ jitter)
+    default_retry_after: float = 1.0  # 429인데 Retry-After가 없을 때 대기 시간
+    connect_timeout: float = 3.05
+    read_timeout: float = 10.0
+
+    @property
+    def timeout(self):
+        """requests에 넘길 (연결, 읽기) 타임아웃"""
+        return (self.connect_timeout, self.read_timeout)
+
+    def should_retry(self, status: Optional[int], attempt: int) -> bool:
+        """
+        재시도 여부를 판단합니다.
+
+        Args:
+            status: HTTP 상태 코드 (타임아웃/연결 오류이면 None)
+            attempt: 지금까지의 재시도 횟수
+        """
+        if attempt >= self.max_retries:
+            return False
+        return status is None or status == 429 or status in RETRYABLE_STATUS
+
+    def get_delay(self, attempt: int, retry_after: Optional[str] = None,
+                  status: Optional[int] = None) -> float:
+        """
+        다음 시도까지 기다릴 시간을 계산합니다.
+
+        Args:
+            attempt: 지금까지의 재시도 횟수 (0부터)
+            retry_after: 응답의 Retry-After 헤더 값 (초 또는 HTTP 날짜)
+            status: HTTP 상태 코드 (429인데 Retry-After가 없으면 default_retry_after)
+        """
+        if retry_after is not None:
+            return self._parse_retry_after(retry_after)
+        if status == 429:
+            return self.default_retry_after
+
+        delay = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return delay * (1 + random.uniform(0, self.jitter))
+
+    def _parse_retry_after(self, retry_after: str) -> float:
+        """Retry-After 값(초 또는 HTTP 날짜)을 대기 시간으로 바꿉니다."""
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            retry_at = None
+        if retry_at is None:
+            return self.default_retry_after
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RequestStats:
+    """엔드포인트(메서드)별 요청/재시도/제한/병합 횟수"""
+
+    FIELDS = ('requests', 'retries', 'throttled', 'server_errors', 'timeouts',
+              'failures', 'coalesced')
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Counter] = defaultdict(Counter)
+
+    def record(self, method: str, field: str):
+        with self._lock:
+            self._counters[method][field] += 1
+
+    def get(self, method: Optional[str] = None) -> Dict:
+        """
+        메서드 하나 또는 전체의 통계를 반환합니다.
+
+        Returns:
+            method가 주어지면 {필드: 횟수}, 아니면 {메서드: {필드: 횟수}}
+        """
+        with self._lock:
+            if method is not None:
+                counter = self._counters.get(method, Counter())
+                return {field: counter[field] for field in self.FIELDS}
+            return {
+                name: {field: counter[field] for field in self.FIELDS}
+                for name, counter in self._counters.items()
+            }
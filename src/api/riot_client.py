@@ -3,100 +3,305 @@ Riot Games API 클라이언트
 매치 데이터, 챔피언 정보, 리플레이 데이터를 가져옵니다.
 """
 
-import os
-import requests
+import threading
 import time
-from typing import Dict, List, Optional
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from typing import Dict, Iterator, List, Optional
 from dotenv import load_dotenv
 
+from .client_base import RiotClientBase
+from .match_store import MatchStore
+from .rate_limiter import RateLimiter
+from .retry import RetryPolicy
+from .singleflight import SingleFlight
+from .timeline_stream import (
+    DEFAULT_CHUNK_SIZE, TimelineStreamError, TimelineTruncatedError,
+    iter_file_chunks, iter_timeline_frames
+)
+
 load_dotenv()
 
 
-class RiotAPIClient:
+class RiotAPIClient(RiotClientBase):
     """Riot Games API와 상호작용하는 클라이언트"""
 
-    BASE_URLS = {
-        'kr': 'https://kr.api.riotgames.com',
-        'asia': 'https://asia.api.riotgames.com'
-    }
-
-    def __init__(self, api_key: Optional[str] = None, region: str = 'kr'):
+    def __init__(self, api_key: Optional[str] = None, region: str = 'kr',
+                 rate_limiter: Optional[RateLimiter] = None,
+                 pool_size: int = 10, keep_alive: bool = True,
+                 compression: bool = True,
+                 match_store: Optional[MatchStore] = None,
+                 use_match_store: bool = True,
+                 cache_size: int = 1024,
+                 cache_ttls: Optional[Dict[str, float]] = None,
+                 retry_policy: Optional[RetryPolicy] = None):
         """
         Args:
             api_key: Riot API 키 (없으면 환경변수에서 가져옴)
             region: 지역 (기본값: kr)
+            rate_limiter: 공유 레이트 리밋 스케줄러 (없으면 새로 생성)
+            pool_size: 라우팅 호스트별 커넥션 풀 크기
+            keep_alive: 커넥션 재사용 여부
+            compression: gzip/brotli 응답 압축 협상 여부
+            match_store: 매치/타임라인 로컬 저장소 (없으면 DB_PATH 기준 기본 저장소)
+            use_match_store: False이면 로컬 저장소를 사용하지 않음
+            cache_size: 메모리 캐시 최대 항목 수 (0이면 캐시 사용 안 함)
+            cache_ttls: 메서드별 캐시 유지 시간 (CACHE_TTLS를 덮어씀)
+            retry_policy: 재시도/타임아웃 정책 (없으면 기본 정책)
         """
-        self.api_key = api_key or os.getenv('RIOT_API_KEY')
-        self.region = region
-        self.base_url = self.BASE_URLS.get(region, self.BASE_URLS['kr'])
-        self.headers = {'X-Riot-Token': self.api_key}
-        self.rate_limit_delay = 1.2  # API 제한을 피하기 위한 딜레이
+        super().__init__(api_key, region, rate_limiter, pool_size, keep_alive, compression,
+                         match_store, use_match_store, cache_size, cache_ttls, retry_policy)
+        self._sessions: Dict[str, requests.Session] = {}
+        self._sessions_lock = threading.Lock()
+        self._inflight = SingleFlight()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
 
-    def _make_request(self, endpoint: str, params: Dict = None) -> Dict:
-        """API 요청을 수행합니다."""
-        url = f"{self.base_url}{endpoint}"
+    def close(self):
+        """라우팅 호스트별 세션을 모두 닫습니다."""
+        with self._sessions_lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+    def _get_session(self, host: str) -> requests.Session:
+        """라우팅 호스트별로 커넥션 풀을 가진 세션을 반환합니다."""
+        with self._sessions_lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=1, pool_maxsize=self.pool_size
+                )
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+
+                session.headers.update(self.headers)
+                if self.compression:
+                    # brotli 패키지가 설치되어 있으면 br도 협상합니다
+                    session.headers.update(make_headers(accept_encoding=True))
+                else:
+                    session.headers['Accept-Encoding'] = 'identity'
+                if not self.keep_alive:
+                    session.headers['Connection'] = 'close'
+
+                self._sessions[host] = session
+            return session
+
+    def _make_request(self, endpoint: str, params: Dict = None,
+                      host: Optional[str] = None, method: str = '',
+                      default=None):
+        """
+        API 요청을 수행합니다.
+        CACHE_TTLS에 등록된 메서드는 메모리 캐시를 먼저 확인하고,
+        같은 요청이 이미 진행 중이면 새로 보내지 않고 그 응답을 공유합니다.
+
+        Args:
+            endpoint: API 경로
+            params: 쿼리 파라미터
+            host: 라우팅 호스트 (기본값: 플랫폼 지역)
+            method: 메서드 제한을 구분하는 식별자
+            default: 실패 시 반환할 값 (기본값: {})
+        """
+        default = {} if default is None else default
+        key, ttl = self._cache_entry(method, endpoint, params)
+        data = self._cache_get(key, ttl)
+        if data is not None:
+            return data
+
+        leader = []
+
+        def fetch():
+            leader.append(True)
+            data = self._fetch(endpoint, params, host, method, default)
+            self._cache_set(key, ttl, data)
+            return data
+
+        data = self._inflight.do(key, fetch)
+        if not leader:
+            self.request_stats.record(method, 'coalesced')
+        return data
+
+    def _fetch(self, endpoint: str, params: Optional[Dict], host: Optional[str],
+               method: str, default):
+        """네트워크로 요청을 보내고 JSON 응답을 반환합니다."""
+        response = self._send(endpoint, params, host, method)
+        if response is None:
+            return default
 
         try:
-            response = requests.get(url, headers=self.headers, params=params)
-            response.raise_for_status()
-            time.sleep(self.rate_limit_delay)
             return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"API 요청 실패: {e}")
-            return {}
+        except ValueError as e:
+            self._record_failure(method, f"API 응답 해석 실패 ({method})", e)
+            return default
+
+    def _send(self, endpoint: str, params: Optional[Dict], host: Optional[str],
+              method: str, stream: bool = False) -> Optional[requests.Response]:
+        """
+        네트워크로 요청을 보냅니다.
+        429, 5xx, 타임아웃은 retry_policy에 따라 다시 시도합니다.
+
+        Returns:
+            성공한 응답 (실패하면 None)
+        """
+        host = host or self.region
+        url = self._url(host, endpoint)
+        attempt = 0
+
+        while True:
+            self.rate_limiter.acquire(host, method)
+            self.request_stats.record(method, 'requests')
+            status, retry_after, limit_type, error = None, None, None, None
+
+            try:
+                response = self._get_session(host).get(
+                    url, params=params, timeout=self.retry_policy.timeout, stream=stream
+                )
+                status = response.status_code
+                retry = self._response_error(host, method, url, status, response.headers)
+                if retry is None:
+                    response.raise_for_status()
+                    return response
+                error, retry_after, limit_type = retry
+                response.close()
+            except (requests.exceptions.Timeout,
+                    requests.exceptions.ConnectionError) as e:
+                self.request_stats.record(method, 'timeouts')
+                error = e
+            except requests.exceptions.RequestException as e:
+                self._record_failure(method, f"API 요청 실패 ({method})", e)
+                return None
+
+            delay = self._retry_delay(host, method, status, attempt, error,
+                                      retry_after, limit_type)
+            if delay is None:
+                return None
+            if delay > 0:
+                time.sleep(delay)
+            attempt += 1
 
     def get_summoner_by_name(self, summoner_name: str) -> Dict:
         """소환사 이름으로 소환사 정보를 가져옵니다."""
         endpoint = f"/lol/summoner/v4/summoners/by-name/{summoner_name}"
-        return self._make_request(endpoint)
+        return self._make_request(endpoint, method='summoner-v4.by-name')
+
+    def get_summoner_by_id(self, summoner_id: str) -> Dict:
+        """암호화된 소환사 ID로 소환사 정보를 가져옵니다."""
+        endpoint = f"/lol/summoner/v4/summoners/{summoner_id}"
+        return self._make_request(endpoint, method='summoner-v4.by-id')
 
     def get_summoner_by_puuid(self, puuid: str) -> Dict:
         """PUUID로 소환사 정보를 가져옵니다."""
         endpoint = f"/lol/summoner/v4/summoners/by-puuid/{puuid}"
-        return self._make_request(endpoint)
+        return self._make_request(endpoint, method='summoner-v4.by-puuid')
 
     def get_challenger_players(self, queue: str = 'RANKED_SOLO_5x5') -> Dict:
         """챌린저 플레이어 목록을 가져옵니다."""
         endpoint = f"/lol/league/v4/challengerleagues/by-queue/{queue}"
-        return self._make_request(endpoint)
+        return self._make_request(endpoint, method='league-v4.challenger')
 
     def get_match_history(self, puuid: str, count: int = 20) -> List[str]:
         """플레이어의 최근 매치 ID 목록을 가져옵니다."""
         # 아시아 서버 사용
-        url = f"https://asia.api.riotgames.com/lol/match/v5/matches/by-puuid/{puuid}/ids"
-        params = {'count': count}
-
-        try:
-            response = requests.get(url, headers=self.headers, params=params)
-            response.raise_for_status()
-            time.sleep(self.rate_limit_delay)
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"매치 히스토리 가져오기 실패: {e}")
-            return []
+        endpoint = f"/lol/match/v5/matches/by-puuid/{puuid}/ids"
+        return self._make_request(
+            endpoint, params={'count': count}, host=self.routing,
+            method='match-v5.ids', default=[]
+        )
 
     def get_match_details(self, match_id: str) -> Dict:
         """매치의 상세 정보를 가져옵니다."""
-        url = f"https://asia.api.riotgames.com/lol/match/v5/matches/{match_id}"
-
-        try:
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
-            time.sleep(self.rate_limit_delay)
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"매치 상세정보 가져오기 실패: {e}")
-            return {}
+        endpoint = f"/lol/match/v5/matches/{match_id}"
+        return self._get_stored(
+            match_id, 'match',
+            lambda: self._make_request(endpoint, host=self.routing, method='match-v5.match')
+        )
 
     def get_match_timeline(self, match_id: str) -> Dict:
         """매치의 타임라인 데이터를 가져옵니다 (로밍, 포지셔닝 분석용)."""
-        url = f"https://asia.api.riotgames.com/lol/match/v5/matches/{match_id}/timeline"
+        endpoint = f"/lol/match/v5/matches/{match_id}/timeline"
+        return self._get_stored(
+            match_id, 'timeline',
+            lambda: self._make_request(endpoint, host=self.routing, method='match-v5.timeline')
+        )
+
+    def iter_match_timeline_frames(self, match_id: str) -> Iterator[Dict]:
+        """
+        매치 타임라인의 프레임을 하나씩 가져옵니다.
 
+        get_match_timeline과 달리 응답 전체를 딕셔너리로 만들지 않고
+        스트림을 파싱하면서 프레임 단위로 내보냅니다. 로컬 저장소에 있으면
+        압축 파일에서 바로 읽고, 없으면 내려받으면서 동시에 저장합니다.
+        첫 프레임 전에 실패하면 프레임을 내보내지 않습니다.
+
+        Raises:
+            TimelineTruncatedError: 프레임 일부를 내보낸 뒤 스트림이 끊긴 경우
+        """
+        if self.match_store is not None:
+            stored = self.match_store.open(match_id, 'timeline')
+            if stored is not None:
+                with stored:
+                    yield from iter_timeline_frames(iter_file_chunks(stored))
+                return
+
+        endpoint = f"/lol/match/v5/matches/{match_id}/timeline"
+        response = self._send(endpoint, None, self.routing, 'match-v5.timeline', stream=True)
+        if response is None:
+            return
+
+        writer = None
+        if self.match_store is not None:
+            writer = self.match_store.open_writer(match_id, 'timeline')
+
+        def chunks():
+            for chunk in response.iter_content(DEFAULT_CHUNK_SIZE):
+                if writer is not None:
+                    writer.write(chunk)
+                yield chunk
+
+        stream = chunks()
+        yielded = 0
         try:
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
-            time.sleep(self.rate_limit_delay)
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"매치 타임라인 가져오기 실패: {e}")
-            return {}
+            for frame in iter_timeline_frames(stream):
+                yielded += 1
+                yield frame
+            if writer is not None:
+                # frames 이후의 나머지 응답까지 받아야 온전한 파일이 됩니다
+                for _ in stream:
+                    pass
+                writer.commit()
+        except (requests.exceptions.RequestException, TimelineStreamError) as e:
+            self.request_stats.record('match-v5.timeline', 'failures')
+            print(f"타임라인 스트리밍 실패 ({match_id}): {e}")
+            if yielded:
+                # 끊긴 타임라인이 끝까지 받은 것처럼 분석되지 않도록 알립니다
+                raise TimelineTruncatedError(
+                    f"{yielded}번째 프레임 이후 타임라인이 끊겼습니다 ({match_id})"
+                ) from e
+        finally:
+            if writer is not None:
+                writer.abort()
+            response.close()
+
+    def _get_stored(self, match_id: str, kind: str, fetch) -> Dict:
+        """로컬 저장소를 먼저 확인하고, 없으면 받아와서 저장합니다."""
+        if self.match_store is None:
+            return fetch()
+
+        def load():
+            data = self.match_store.get(match_id, kind)
+            if data is not None:
+                return data
+
+            data = fetch()
+            if data:
+                self.match_store.put(match_id, kind, data)
+            return data
+
+        # 같은 매치를 동시에 요청하면 저장소 확인과 다운로드를 한 번만 합니다
+        return self._inflight.do(('match-store', match_id, kind), load)
@@ -0,0 +1,88 @@
+"""
+요청 병합 (single-flight)
+같은 키로 동시에 들어온 호출은 하나의 실제 요청을 공유합니다.
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class _Call:
+    """진행 중인 호출 하나"""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """스레드용 요청 병합기"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.shared = 0  # 다른 호출의 결과를 공유받은 횟수
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        fn을 실행합니다. 같은 키의 호출이 이미 진행 중이면 그 결과를 기다려 반환합니다.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+            else:
+                self.shared += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+        return call.result
+
+
+class AsyncSingleFlight:
+    """asyncio용 요청 병합기"""
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+        self.shared = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        fn()을 await합니다. 같은 키의 호출이 이미 진행 중이면 그 결과를 기다려 반환합니다.
+
+        fn()은 별도 태스크에서 실행되므로, 처음 호출한 쪽을 포함해 어느 호출이 취소되어도
+        요청은 계속 진행되고 나머지 호출은 결과를 받습니다.
+        """
+        task = self._calls.get(key)
+        if task is not None:
+            self.shared += 1
+        else:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Task):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # 기다리는 쪽이 모두 취소되었을 때 "예외가 조회되지 않음" 경고를 막습니다
+        if not task.cancelled():
+            task.exception()
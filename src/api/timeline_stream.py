@@ -0,0 +1,104 @@
+"""
+타임라인 스트리밍 파서
+타임라인 JSON 전체를 딕셔너리로 만들지 않고, 바이트 청크를 받아
+info.frames 배열의 프레임을 하나씩 파싱해 내보냅니다.
+메모리 사용량은 게임 전체가 아니라 프레임 하나 크기에 비례합니다.
+"""
+
+import codecs
+import json
+import re
+from typing import Dict, Iterable, Iterator, IO
+
+# "frames" 키와 배열 시작 부분 ("frameInterval"과는 구분됨)
+_FRAMES_START = re.compile(r'"frames"\s*:\s*\[')
+_WHITESPACE = ' \t\r\n'
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+class TimelineStreamError(ValueError):
+    """스트림이 올바른 타임라인 JSON이 아닐 때 발생합니다."""
+
+
+class TimelineTruncatedError(TimelineStreamError):
+    """프레임 일부를 내보낸 뒤 스트림이 끊겼을 때 발생합니다."""
+
+
+def iter_file_chunks(f: IO[bytes], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """파일 객체를 청크 단위로 읽습니다."""
+    while True:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_timeline_frames(chunks: Iterable[bytes]) -> Iterator[Dict]:
+    """
+    타임라인 JSON 바이트 청크에서 프레임을 하나씩 파싱합니다.
+
+    Args:
+        chunks: 타임라인 JSON의 바이트 청크 (HTTP 응답, gzip 파일 등)
+
+    Yields:
+        프레임 딕셔너리 (timestamp, participantFrames, events)
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder('utf-8')()
+    chunk_iter = iter(chunks)
+    buffer = ''
+    pos = 0
+    exhausted = False
+
+    def read_more() -> bool:
+        nonlocal buffer, pos, exhausted
+        if exhausted:
+            return False
+        try:
+            chunk = next(chunk_iter)
+        except StopIteration:
+            exhausted = True
+            buffer = buffer[pos:] + text_decoder.decode(b'', final=True)
+            pos = 0
+            return False
+        # 이미 처리한 앞부분은 버려서 버퍼가 커지지 않게 합니다
+        buffer = buffer[pos:] + text_decoder.decode(chunk)
+        pos = 0
+        return True
+
+    # 1. frames 배열 시작 위치 찾기
+    while True:
+        match = _FRAMES_START.search(buffer)
+        if match:
+            pos = match.end()
+            break
+        # 키가 청크 경계에 걸칠 수 있으므로 끝부분은 남겨 둡니다
+        pos = max(0, len(buffer) - 32)
+        if not read_more():
+            return
+
+    # 2. 프레임 객체를 하나씩 디코딩
+    while True:
+        while True:
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE + ',':
+                pos += 1
+            if pos < len(buffer):
+                break
+            if not read_more():
+                raise TimelineStreamError("frames 배열이 끝나기 전에 스트림이 끝났습니다")
+
+        if buffer[pos] == ']':
+            return
+
+        while True:
+            try:
+                frame, end = decoder.raw_decode(buffer, pos)
+                break
+            except json.JSONDecodeError as e:
+                # 프레임이 아직 다 도착하지 않았으면 더 읽어서 다시 시도합니다
+                if not read_more():
+                    raise TimelineStreamError(f"프레임 파싱 실패: {e}") from e
+
+        pos = end
+        yield frame
@@ -21,6 +21,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from api.riot_client import RiotAPIClient
 from data.champion_data import ChampionDatabase, ItemDatabase
 from analysis.replay_analyzer import ReplayAnalyzer
+from analysis.pattern_store import PatternStore
 from ai.decision_engine import DecisionEngine
 
 
@@ -65,7 +66,7 @@ class AnalysisThread(QThread):
                 timeline = self.api_client.get_match_timeline(match_id)
 
                 if timeline:
-                    analysis = self.analyzer.analyze_match_timeline(timeline)
+                    analysis = self.analyzer.analyze_match_timeline(timeline, match_details)
                     all_analysis.append(analysis)
 
             self.progress.emit(100)
@@ -87,7 +88,7 @@ class LOLAIAssistant(QMainWindow):
         self.api_client = RiotAPIClient()
         self.champion_db = ChampionDatabase()
         self.item_db = ItemDatabase()
-        self.analyzer = ReplayAnalyzer()
+        self.analyzer = ReplayAnalyzer(pattern_store=PatternStore(PatternStore.default_path()))
         self.decision_engine = DecisionEngine()
 
         self.init_ui()
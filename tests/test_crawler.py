@@ -0,0 +1,169 @@
+"""
+챌린저 크롤러 테스트
+"""
+
+import sys
+import os
+import tempfile
+import threading
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.analysis.crawler import ChallengerCrawler
+from src.api.timeline_stream import TimelineTruncatedError
+
+
+class FakeAPIClient:
+    """매치가 서로 겹치는 가짜 API 클라이언트"""
+
+    def __init__(self, players=6, matches_per_player=5):
+        self.players = players
+        self.matches_per_player = matches_per_player
+        self.timeline_calls = []
+        self.lock = threading.Lock()
+
+    def get_challenger_players(self, queue='RANKED_SOLO_5x5'):
+        return {'entries': [
+            {'summonerId': f'sid-{i}', 'leaguePoints': 1000 - i}
+            for i in range(self.players)
+        ]}
+
+    def get_summoner_by_id(self, summoner_id):
+        return {'puuid': summoner_id.replace('sid', 'puuid')}
+
+    def get_match_history(self, puuid, count=20):
+        # 이웃한 플레이어끼리 매치 2개씩 공유
+        index = int(puuid.split('-')[1])
+        start = index * (self.matches_per_player - 2)
+        return [f'KR_{start + j}' for j in range(min(count, self.matches_per_player))]
+
+    def get_match_timeline(self, match_id):
+        with self.lock:
+            self.timeline_calls.append(match_id)
+        return {'metadata': {'matchId': match_id}, 'info': {'frames': []}}
+
+    def get_match_details(self, match_id):
+        return {'metadata': {'matchId': match_id}, 'info': {'participants': []}}
+
+
+class FakeAnalyzer:
+    def analyze_match_timeline(self, timeline, match_details=None):
+        # 같은 매치의 상세 정보가 함께 넘어와야 함
+        assert match_details['metadata'] == timeline['metadata']
+        return {'match_id': timeline['metadata']['matchId']}
+
+
+class StreamingAPIClient(FakeAPIClient):
+    """KR_1의 타임라인 스트림이 중간에 끊기는 가짜 API 클라이언트"""
+
+    def iter_match_timeline_frames(self, match_id):
+        with self.lock:
+            self.timeline_calls.append(match_id)
+        for i in range(3):
+            yield {'timestamp': i * 60000, 'participantFrames': {}, 'events': []}
+        if match_id == 'KR_1':
+            raise TimelineTruncatedError("타임라인이 끊겼습니다")
+        yield {'timestamp': 180000, 'participantFrames': {}, 'events': []}
+
+
+class FrameAnalyzer:
+    def analyze_frames(self, frames, match_details=None):
+        return {'frames': len(list(frames))}
+
+
+def test_crawler():
+    """크롤러 중복 제거 및 재시작 테스트"""
+    print("=" * 60)
+    print("챌린저 크롤러 테스트")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        checkpoint = os.path.join(tmp, 'checkpoint.json')
+
+        print("\n1. 첫 실행: 플레이어 3명만 처리")
+        client = FakeAPIClient()
+        results = []
+        crawler = ChallengerCrawler(
+            client, FakeAnalyzer(), checkpoint_path=checkpoint, workers=4,
+            on_result=lambda match_id, result: results.append(match_id)
+        )
+        stats = crawler.crawl(max_players=3)
+        assert stats['players_processed'] == 3
+        assert len(results) == len(set(results)) == 11
+        print(f"  통계: {stats}")
+
+        print("\n2. 체크포인트에서 이어서 실행")
+        crawler = ChallengerCrawler(
+            client, FakeAnalyzer(), checkpoint_path=checkpoint, workers=1,
+            on_result=lambda match_id, result: results.append(match_id)
+        )
+        stats = crawler.crawl()
+        assert stats['players_processed'] == 6
+        assert stats['duplicates_skipped'] == 10
+        assert len(results) == len(set(results)) == 20
+        assert sorted(client.timeline_calls) == sorted(results)
+        print(f"  통계: {stats}")
+
+    print("\n✓ 모든 테스트 통과!")
+
+
+def test_crawler_truncated_timeline():
+    """끊긴 타임라인 스트림 처리 테스트"""
+    print("=" * 60)
+    print("끊긴 타임라인 테스트")
+    print("=" * 60)
+
+    for workers in (1, 4):
+        results = {}
+        crawler = ChallengerCrawler(
+            StreamingAPIClient(players=1), FrameAnalyzer(), use_checkpoint=False,
+            workers=workers, on_result=results.__setitem__
+        )
+        stats = crawler.crawl()
+        assert 'KR_1' not in results
+        assert crawler.failed_matches == ['KR_1']
+        assert stats['failures'] == 1 and stats['matches_analyzed'] == 4
+        assert all(result == {'frames': 4} for result in results.values())
+        print(f"✓ workers={workers}: 끊긴 매치는 실패로 기록, 통계: {stats}")
+
+    print("\n✓ 모든 테스트 통과!")
+
+
+def test_crawler_retry_limit():
+    """실패한 매치 재시도 한도 테스트"""
+    print("=" * 60)
+    print("재시도 한도 테스트")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # 체크포인트 기본 경로는 DB_PATH 옆
+        old_db_path = os.environ.get('DB_PATH')
+        os.environ['DB_PATH'] = os.path.join(tmp, 'lol_data.db')
+        try:
+            client = StreamingAPIClient(players=1)
+            crawler = ChallengerCrawler(client, FrameAnalyzer(), workers=1, max_attempts=3)
+        finally:
+            if old_db_path is None:
+                del os.environ['DB_PATH']
+            else:
+                os.environ['DB_PATH'] = old_db_path
+        assert crawler.checkpoint_path == os.path.join(tmp, 'crawl_checkpoint.json')
+        print(f"✓ 체크포인트 경로: {crawler.checkpoint_path}")
+
+        # 실행마다 체크포인트에서 다시 시작해도 실패 횟수가 이어짐
+        for run in range(4):
+            crawler = ChallengerCrawler(client, FrameAnalyzer(), workers=1, max_attempts=3,
+                                        checkpoint_path=os.path.join(tmp, 'crawl_checkpoint.json'))
+            stats = crawler.crawl()
+        assert client.timeline_calls.count('KR_1') == 3
+        assert crawler.failed_matches == [] and crawler.abandoned_matches == ['KR_1']
+        assert stats['failures'] == 3 and stats['abandoned'] == 1
+        assert stats['matches_analyzed'] == 4
+        print(f"✓ KR_1은 3회 시도 후 포기, 통계: {stats}")
+
+    print("\n✓ 모든 테스트 통과!")
+
+
+if __name__ == '__main__':
+    test_crawler()
+    test_crawler_truncated_timeline()
+    test_crawler_retry_limit()
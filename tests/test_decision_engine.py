@@ -4,9 +4,54 @@ AI 의사결정 엔진 테스트
 
 import sys
 import os
+import json
+import random
+import tempfile
+
+import numpy as np
+
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.ai.decision_engine import DecisionEngine
+from src.ai.game_states import GameStateColumns
+from src.ai.incremental import IncrementalDecisionEngine
+from src.ai.objectives import ObjectiveScheduler
+from src.ai.rules import (DEFAULT_RECOMMENDATIONS, DEFAULT_RULES, FEATURES, CompiledRules,
+                          encode_features)
+from src.ai.spatial import GridIndex, count_within, neighbor_counts
+
+
+def make_game_state(rng: random.Random) -> dict:
+    """테스트용 무작위 게임 상태를 만듭니다."""
+    def position():
+        return {'x': rng.randint(0, 14820), 'y': rng.randint(0, 14820)}
+
+    return {
+        'timestamp': rng.randint(0, 2700),
+        'player': {
+            'champion': 'Ahri',
+            'level': rng.randint(1, 18),
+            'cs': rng.randint(0, 400),
+            'position': position(),
+            'vision_score': rng.randint(0, 80),
+            'health': rng.randint(1, 100),
+            'max_health': 100,
+            'items': [1055] * rng.randint(0, 6)
+        },
+        'allies': [{'position': position()} for _ in range(rng.randint(0, 4))],
+        'enemies': [{'visible': rng.random() < 0.5} for _ in range(rng.randint(0, 5))],
+        'lane_enemy': {
+            'level': rng.randint(1, 18),
+            'health': rng.randint(1, 100),
+            'max_health': 100,
+            'items': [1055] * rng.randint(0, 6)
+        },
+        'objectives': {
+            'dragon_alive': rng.random() < 0.7,
+            'baron_alive': rng.random() < 0.5,
+            'herald_alive': rng.random() < 0.5
+        }
+    }
 
 
 def test_decision_engine():
@@ -76,5 +121,278 @@ def test_decision_engine():
     print("\n✓ 테스트 완료!")
 
 
+def test_batch_game_states():
+    """배치 분석이 상태별 분석과 같은지 테스트"""
+    print("\n" + "=" * 60)
+    print("배치 게임 상태 분석 테스트")
+    print("=" * 60)
+
+    engine = DecisionEngine()
+    rng = random.Random(0)
+    game_states = [make_game_state(rng) for _ in range(2000)]
+    states = GameStateColumns.from_game_states(game_states)
+    batch = engine.analyze_game_states(states)
+
+    for i, game_state in enumerate(game_states):
+        analysis = engine.analyze_game_state(game_state)
+        assert engine.action_list(batch, i) == analysis['recommended_actions'], i
+        assert batch['phase'][i] == analysis['phase']
+        assert batch['cs_deficit'][i] == analysis['wave_state']['cs_deficit']
+        assert batch['nearby_allies'][i] == analysis['map_position']['nearby_allies']
+        assert batch['danger_level'][i] == analysis['map_position']['danger_level']
+        assert np.isclose(batch['power_score'][i], analysis['power_level']['power_score'])
+        assert batch['vision_deficit'][i] == analysis['vision_score']['vision_deficit']
+        next_objective = analysis['objective_priority']['next_objective']
+        assert batch['objective_priority'][i] == (next_objective['priority']
+                                                  if next_objective else 0)
+    print(f"✓ 상태 {len(game_states)}개 결과 일치")
+
+    # 배열에서 바로 만든 상태
+    states = GameStateColumns.from_arrays(np.arange(0, 2400, 60), cs=np.arange(40) * 8,
+                                          level=9, enemy_level=7)
+    batch = engine.analyze_game_states(states)
+    assert batch['level_diff'].tolist() == [2] * 40
+    assert batch['actions'].shape == (40, 3)
+    print(f"✓ 1분 간격 {len(states)}개 상태: 첫 추천 {engine.action_list(batch, 10)[0]['action']}")
+
+    print("\n✓ 테스트 완료!")
+
+
+def test_spatial_queries():
+    """주변 유닛 수 공간 질의 테스트"""
+    print("\n" + "=" * 60)
+    print("공간 질의 테스트")
+    print("=" * 60)
+
+    rng = np.random.default_rng(0)
+    engine = DecisionEngine()
+
+    # 한 게임 10명: 모든 쌍을 직접 비교한 결과와 같아야 함
+    positions = rng.uniform(0, 14820, size=(50, 10, 2))
+    teams = np.array([100] * 5 + [200] * 5)
+    allies, enemies = neighbor_counts(positions[..., 0], positions[..., 1], teams, 3000)
+    for state in range(50):
+        for unit in range(10):
+            distances = np.hypot(*(positions[state] - positions[state, unit]).T)
+            near = (distances <= 3000) & (np.arange(10) != unit)
+            assert allies[state, unit] == np.sum(near & (teams == teams[unit]))
+            assert enemies[state, unit] == np.sum(near & (teams != teams[unit]))
+
+        player = {'x': positions[state, 0, 0], 'y': positions[state, 0, 1]}
+        others = [{'x': x, 'y': y} for x, y in positions[state, 1:5]]
+        assert engine._count_nearby_units(player, others, 3000) == allies[state, 0]
+    print("✓ 10명 아군/적군 수 일치")
+
+    # 유닛이 많으면 격자 인덱스를 사용하며 결과는 같아야 함
+    x, y = rng.uniform(0, 14820, size=(2, 2, 600))
+    x[0, 7] = np.nan  # 없는 유닛
+    teams = rng.integers(0, 2, size=600)
+    grid_allies, grid_enemies = neighbor_counts(x, y, teams, 1500)
+    for state in range(2):
+        dx = x[state][:, None] - x[state][None, :]
+        dy = y[state][:, None] - y[state][None, :]
+        near = (dx * dx + dy * dy <= 1500 ** 2) & ~np.eye(600, dtype=bool)
+        same_team = teams[:, None] == teams[None, :]
+        assert grid_allies[state].tolist() == np.sum(near & same_team, axis=1).tolist()
+        assert grid_enemies[state].tolist() == np.sum(near & ~same_team, axis=1).tolist()
+    assert grid_allies[0, 7] == grid_enemies[0, 7] == 0
+
+    index = GridIndex(x[1], y[1], cell_size=1000)
+    qx, qy = rng.uniform(-2000, 16000, size=(2, 300))
+    assert index.count_within(qx, qy, 2500).tolist() == \
+        count_within(qx, qy, x[1], y[1], 2500).tolist()
+    print("✓ 격자 인덱스 결과 일치")
+
+    print("\n✓ 테스트 완료!")
+
+
+def test_incremental_engine():
+    """증분 의사결정 엔진 테스트"""
+    print("\n" + "=" * 60)
+    print("증분 의사결정 엔진 테스트")
+    print("=" * 60)
+
+    rng = random.Random(1)
+    reference = DecisionEngine()
+    game_state = make_game_state(rng)
+    game_state['timestamp'] = 240
+    engine = IncrementalDecisionEngine(game_state)
+    assert engine.analysis == reference.analyze_game_state(game_state)
+
+    ticks = 1200  # 20분, 1초 간격
+    previous = dict(engine.analysis)
+    for tick in range(ticks):
+        delta = {'timestamp': engine.state['timestamp'] + 1}
+        if rng.random() < 0.1:
+            delta['player'] = {'cs': engine.state['player']['cs'] + 1}
+        if rng.random() < 0.05:
+            delta['lane_enemy'] = {'health': rng.randint(1, 100)}
+        if rng.random() < 0.02:
+            delta['allies'] = [{'position': {'x': rng.randint(0, 14820),
+                                             'y': rng.randint(0, 14820)}}]
+        changes = engine.update(delta)
+
+        # 결과는 매번 처음부터 계산한 것과 같고, 바뀐 항목만 내보내야 함
+        expected = reference.analyze_game_state(engine.state)
+        assert engine.analysis == expected, tick
+        assert changes == {key: value for key, value in expected.items()
+                           if previous.get(key) != value}, tick
+        previous = expected
+
+    counts = engine.recompute_counts
+    assert counts['objective_priority'] < ticks // 20
+    assert counts['wave_state'] < ticks // 5
+    print(f"✓ {ticks}틱 동안 다시 계산한 횟수: {counts}")
+
+    # 입력을 바꾸지 않으면 아무것도 내보내지 않음
+    assert engine.update({}) == {}
+    print("✓ 변화 없는 틱")
+
+    print("\n✓ 테스트 완료!")
+
+
+def test_rule_table():
+    """데이터 기반 규칙 테이블 테스트"""
+    print("\n" + "=" * 60)
+    print("규칙 테이블 테스트")
+    print("=" * 60)
+
+    rng = random.Random(2)
+    game_states = [make_game_state(rng) for _ in range(1000)]
+    states = GameStateColumns.from_game_states(game_states)
+
+    # JSON에서 불러온 규칙: 시야 우선순위를 올리고 갱킹 규칙을 추가
+    rules = [dict(rule) for rule in DEFAULT_RULES]
+    rules[-1]['priority'] = 9.5
+    rules.append({'action': 'gank', 'priority': 7, 'reason': '레벨 우위 - 갱킹',
+                  'when': {'power_score': ('>=', 4), 'phase': [('==', 'mid')]}})
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'rules.json')
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'rules': rules, 'recommendations': DEFAULT_RECOMMENDATIONS}, f,
+                      ensure_ascii=False)
+        engine = DecisionEngine(CompiledRules.load(path))
+
+    batch = engine.analyze_game_states(states)
+    ward_first = gank = 0
+    for i, game_state in enumerate(game_states):
+        actions = engine.analyze_game_state(game_state)['recommended_actions']
+        assert engine.action_list(batch, i) == actions, i
+        ward_first += bool(actions) and actions[0]['action'] == 'ward'
+        gank += any(action['action'] == 'gank' for action in actions)
+    assert ward_first > 0 and gank > 0
+    print(f"✓ 사용자 규칙: 시야 우선 {ward_first}회, 갱킹 {gank}회 (단일/배치 일치)")
+
+    # 추천 문장: 배열 평가와 단일 평가가 같아야 함
+    default = CompiledRules.default()
+    values = np.arange(-20, 21, 0.5)
+    for name in DEFAULT_RECOMMENDATIONS:
+        texts = default.recommendation_texts(name)
+        codes = default.recommend(name, values)
+        assert [texts[code] for code in codes] == \
+            [default.recommendation(name, value) for value in values]
+    assert default.recommendation('position', 1) == "⚠️ 주의! 아군 지원 없이 싸우지 마세요"
+    print("✓ 추천 문장 규칙")
+
+    # 목록에 없는 범주 값은 이웃 범주로 바뀌지 않고 오류여야 함
+    values = {feature: np.zeros(4) for feature in FEATURES}
+    for unknown in ('midd', 'zzz', 'a'):
+        values['phase'] = np.array(['early', 'mid', 'late', unknown])
+        try:
+            encode_features(values)
+        except ValueError as e:
+            assert 'phase' in str(e) and unknown in str(e), e
+        else:
+            raise AssertionError(f"알 수 없는 phase 값 {unknown!r}가 통과함")
+
+    bad_rules = [
+        {'action': 'gank', 'priority': 7, 'when': {'phase': [('==', 'midgame')]}},
+        {'action': 'gank', 'priority': 7, 'when': {'power_scor': ('>=', 4)}},
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'rules.json')
+        for rule in bad_rules:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump({'rules': DEFAULT_RULES + [rule]}, f, ensure_ascii=False)
+            try:
+                CompiledRules.load(path)
+            except ValueError as e:
+                assert f"규칙 {len(DEFAULT_RULES)} (gank)" in str(e), e
+            else:
+                raise AssertionError(f"잘못된 규칙이 통과함: {rule}")
+    print("✓ 알 수 없는 범주 값/특징 이름 거부")
+
+    print("\n✓ 테스트 완료!")
+
+
+def test_objective_scheduler():
+    """오브젝트 일정표 테스트"""
+    print("\n" + "=" * 60)
+    print("오브젝트 일정표 테스트")
+    print("=" * 60)
+
+    # 처치 기록이 없으면 기존 고정 구간과 같음
+    scheduler = ObjectiveScheduler()
+    timestamps = np.concatenate([np.arange(0, 3600, 0.5), [359.9, 840, 840.5, 1199.9]])
+    expected = {
+        'dragon': (timestamps >= 300) & (timestamps % 300 < 60),
+        'herald': (timestamps >= 360) & (timestamps <= 840),
+        'baron': timestamps >= 1200
+    }
+    for name, up in expected.items():
+        assert (scheduler.is_up_many(name, timestamps) == up).all(), name
+        assert [scheduler.is_up(name, t) for t in timestamps] == list(up), name
+    assert scheduler.next_spawn(100) == ('dragon', 200)
+    assert scheduler.next_spawn(330) == ('dragon', 0)
+    print("✓ 기본 일정")
+
+    # 타임라인 처치 기록: 5분 20초 드래곤, 12분 전령, 25분 바론
+    events = [
+        {'type': 'ELITE_MONSTER_KILL', 'monsterType': 'DRAGON', 'timestamp': 320000},
+        {'type': 'ELITE_MONSTER_KILL', 'monsterType': 'RIFTHERALD', 'timestamp': 720000},
+        {'type': 'ELITE_MONSTER_KILL', 'monsterType': 'BARON_NASHOR', 'timestamp': 1500000},
+        {'type': 'CHAMPION_KILL', 'timestamp': 330000}
+    ]
+    scheduler = ObjectiveScheduler.from_timeline_events(events)
+    assert not scheduler.is_up('dragon', 330) and scheduler.is_up('dragon', 620)
+    assert not scheduler.is_up('herald', 800)
+    assert not scheduler.is_up('baron', 1600) and scheduler.is_up('baron', 1860)
+    assert scheduler.time_to_spawn('dragon', 330) == 290
+    assert scheduler.time_to_spawn('herald', 800) is None
+    assert scheduler.next_spawn(1700) == ('dragon', 120)
+    assert scheduler.next_spawn(1890) == ('baron', 0)
+    assert (scheduler.time_to_spawn_many('baron', [1700, 1900]) == [160, 0]).all()
+    print("✓ 처치 기록 반영")
+
+    # 실시간 조언과 배치 분석이 같은 일정표를 사용
+    rng = random.Random(3)
+    game_states = [make_game_state(rng) for _ in range(500)]
+    engine = DecisionEngine(objective_scheduler=scheduler)
+    batch = engine.analyze_game_states(GameStateColumns.from_game_states(game_states))
+    names = list(DecisionEngine.OBJECTIVES)
+    for i, game_state in enumerate(game_states):
+        objective = engine.analyze_game_state(game_state)['objective_priority']['next_objective']
+        assert (objective['type'] if objective else None) == \
+            (names[batch['next_objective'][i]] if batch['next_objective'][i] >= 0 else None), i
+        upcoming = engine.next_objective_spawn(game_state['timestamp'])
+        assert upcoming == (names[batch['upcoming_objective'][i]], batch['time_to_spawn'][i]), i
+    print("✓ 단일/배치 일치")
+
+    # 증분 엔진: 처치 기록을 추가하면 다음 update부터 반영
+    incremental = IncrementalDecisionEngine({'timestamp': 1300}, ObjectiveScheduler())
+    assert incremental.analysis['objective_priority']['next_objective']['type'] == 'baron'
+    incremental.objective_scheduler.record_kill('baron', 1310)
+    changes = incremental.update({'timestamp': 1320})
+    assert changes['objective_priority']['next_objective'] is None
+    print("✓ 증분 엔진 처치 반영")
+
+    print("\n✓ 테스트 완료!")
+
+
 if __name__ == '__main__':
     test_decision_engine()
+    test_batch_game_states()
+    test_spatial_queries()
+    test_incremental_engine()
+    test_rule_table()
+    test_objective_scheduler()
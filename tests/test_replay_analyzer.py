@@ -0,0 +1,773 @@
+"""
+리플레이 분석 엔진 테스트
+"""
+
+import sys
+import os
+import gzip
+import json
+import random
+import tempfile
+from collections import Counter
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.analysis.batch import BatchAnalyzer
+from src.analysis.accumulators import Accumulator, AnalysisContext
+from src.analysis.event_index import EventIndex
+from src.analysis.event_table import RoamingEventTable
+from src.analysis.map_zones import ZoneGrid
+from src.analysis.participants import ParticipantIndex
+from src.analysis.pattern_store import ALL_CHAMPIONS, PatternStore
+from src.analysis.replay_analyzer import ReplayAnalyzer
+from src.analysis.streaming_analyzer import StreamingReplayAnalyzer
+from src.analysis.timeline_columns import TimelineColumns, EVENT_TYPES, event_type_code
+from src.api.timeline_stream import iter_timeline_frames
+
+# 참가자별 라인 위치 (1-5 블루팀, 6-10 레드팀)
+LANE_POSITIONS = {
+    'top': (2000, 12000), 'jungle': (6000, 4000), 'mid': (7400, 7400),
+    'bot': (12000, 2000), 'support': (12500, 2500)
+}
+ROLES = ['top', 'jungle', 'mid', 'bot', 'support']
+
+
+def make_timeline(n_frames: int = 36, seed: int = 0) -> dict:
+    """테스트용 가짜 타임라인을 만듭니다."""
+    rng = random.Random(seed)
+    frames = []
+    cs = {pid: 0 for pid in range(1, 11)}
+
+    for i in range(n_frames):
+        participant_frames = {}
+        for pid in range(1, 11):
+            role = ROLES[(pid - 1) % 5]
+            x, y = LANE_POSITIONS[role]
+            # 가끔 다른 라인으로 이동 (로밍)
+            if rng.random() < 0.15:
+                x, y = LANE_POSITIONS[rng.choice(ROLES)]
+            cs[pid] += rng.randint(0, 10)
+            participant_frames[str(pid)] = {
+                'participantId': pid,
+                'position': {'x': x + rng.randint(-800, 800),
+                             'y': y + rng.randint(-800, 800)},
+                'championStats': {'health': 1000, 'level': min(18, 1 + i // 2)},
+                'level': min(18, 1 + i // 2),
+                'minionsKilled': cs[pid],
+                'jungleMinionsKilled': rng.randint(0, 5) * i,
+                'totalGold': 500 + 400 * i,
+                'currentGold': rng.randint(0, 1500),
+                'xp': 280 * i,
+            }
+
+        events = []
+        timestamp = i * 60000
+        if i > 0 and rng.random() < 0.6:
+            killer = rng.randint(1, 10)
+            victim = rng.randint(1, 10)
+            events.append({
+                'type': 'CHAMPION_KILL', 'timestamp': timestamp - rng.randint(0, 59000),
+                'killerId': killer, 'victimId': victim,
+                'assistingParticipantIds': [rng.randint(1, 10)],
+                'position': {'x': 7000, 'y': 7000}
+            })
+        if i in (6, 12, 18, 25):
+            events.append({
+                'type': 'ELITE_MONSTER_KILL', 'timestamp': timestamp - 3000,
+                'monsterType': 'DRAGON', 'killerId': 3, 'killerTeamId': 100
+            })
+        if i == 9:
+            events.append({
+                'type': 'ELITE_MONSTER_KILL', 'timestamp': timestamp - 1000,
+                'monsterType': 'RIFTHERALD', 'killerId': 7, 'killerTeamId': 200
+            })
+        if i == 27:
+            events.append({
+                'type': 'ELITE_MONSTER_KILL', 'timestamp': timestamp - 2000,
+                'monsterType': 'BARON_NASHOR', 'killerId': 2, 'killerTeamId': 100
+            })
+        if i in (14, 20, 31):
+            events.append({
+                'type': 'BUILDING_KILL', 'timestamp': timestamp - 5000,
+                'buildingType': 'TOWER_BUILDING', 'teamId': 200
+            })
+        events.append({'type': 'ITEM_PURCHASED', 'timestamp': timestamp, 'itemId': 1055})
+
+        frames.append({
+            'timestamp': timestamp,
+            'participantFrames': participant_frames,
+            'events': events
+        })
+
+    return {
+        'metadata': {'matchId': f'KR_{seed}', 'participants': []},
+        'info': {'frameInterval': 60000, 'frames': frames, 'gameId': seed}
+    }
+
+
+def make_match_details(teams: dict, champions: dict = None) -> dict:
+    """참가자 ID -> 팀 ID로 매치 상세 정보를 만듭니다."""
+    champions = champions or {}
+    return {'info': {'participants': [
+        {
+            'participantId': int(pid),
+            'teamId': team,
+            'championName': champions.get(pid, f'Champion{pid}'),
+            'teamPosition': ROLES[(int(pid) - 1) % 5].upper(),
+            'puuid': f'puuid-{pid}'
+        }
+        for pid, team in teams.items()
+    ]}}
+
+
+def json_chunks(data: dict, size: int = 1000):
+    """JSON을 작은 바이트 청크로 나눕니다."""
+    raw = json.dumps(data, ensure_ascii=False).encode('utf-8')
+    for start in range(0, len(raw), size):
+        yield raw[start:start + size]
+
+
+def test_streaming_analysis():
+    """프레임 스트리밍 분석 테스트"""
+    print("=" * 60)
+    print("프레임 스트리밍 분석 테스트")
+    print("=" * 60)
+
+    analyzer = ReplayAnalyzer()
+    timeline = make_timeline()
+
+    print("\n1. 청크 경계와 무관하게 프레임을 복원")
+    frames = list(iter_timeline_frames(json_chunks(timeline, size=97)))
+    assert frames == timeline['info']['frames']
+    print(f"✓ 프레임 {len(frames)}개 복원")
+
+    print("\n2. 스트리밍 분석 결과가 전체 분석과 같음")
+    expected = analyzer.analyze_match_timeline(timeline)
+    streamed = analyzer.analyze_frames(iter_timeline_frames(json_chunks(timeline)))
+    assert streamed == expected
+    print(f"  로밍 이벤트: {len(streamed['roaming'])}개")
+    print(f"  포지셔닝: {streamed['positioning']}")
+
+    print("\n3. 빈 스트림")
+    assert analyzer.analyze_frames(iter([])) == {}
+    print("✓ 빈 결과 반환")
+
+    print("\n✓ 모든 테스트 통과!")
+
+
+def test_timeline_columns():
+    """컬럼형 타임라인 변환 테스트"""
+    print("\n" + "=" * 60)
+    print("컬럼형 타임라인 테스트")
+    print("=" * 60)
+
+    timeline = make_timeline(n_frames=30, seed=1)
+    frames = timeline['info']['frames']
+    columns = TimelineColumns.from_timeline(timeline)
+
+    print("\n1. 참가자 × 프레임 배열")
+    assert columns.participant_ids == [str(pid) for pid in range(1, 11)]
+    assert columns.x.shape == (30, 10)
+    assert columns.present.all()
+    participant = frames[12]['participantFrames']['7']
+    assert columns.x[12, 6] == participant['position']['x']
+    assert columns.minions_killed[12, 6] == participant['minionsKilled']
+    assert columns.total_gold[12, 6] == participant['totalGold']
+    print(f"✓ 배열 크기: {columns.x.shape}")
+
+    print("\n2. 이벤트 테이블")
+    all_events = [event for frame in frames for event in frame['events']]
+    assert len(columns.events) == len(all_events)
+    for index, event in enumerate(all_events):
+        assert EVENT_TYPES[columns.events['type'][index]] in (event['type'], 'OTHER')
+        assert columns.events['timestamp'][index] == event['timestamp']
+        assert columns.event_assists(index).tolist() == \
+            event.get('assistingParticipantIds', [])
+    print(f"✓ 이벤트 {len(columns.events)}개")
+
+    print("\n3. 누락된 참가자/위치")
+    del frames[3]['participantFrames']['2']['position']
+    del frames[4]['participantFrames']['5']
+    columns = TimelineColumns.from_timeline(timeline)
+    assert columns.present[3, 1] and not columns.has_position[3, 1]
+    assert not columns.present[4, 4]
+    print("✓ present / has_position 마스크")
+
+    print("\n4. 분석 결과")
+    analysis = ReplayAnalyzer().analyze_columns(columns)
+    assert analysis['objectives']['dragons'] == [357, 717, 1077, 1497]
+    assert analysis['objectives']['heralds'] == [539]
+    assert analysis['objectives']['barons'] == [1618]
+    assert analysis['objectives']['towers'] == [835, 1195]
+    assert 0 < analysis['cs_patterns']['avg_cs_per_min'] < 20
+    print(f"  오브젝트: {analysis['objectives']}")
+    print(f"  CS: {analysis['cs_patterns']}")
+
+    print("\n✓ 모든 테스트 통과!")
+
+
+def test_roaming_detection():
+    """로밍 감지 테스트"""
+    print("\n" + "=" * 60)
+    print("로밍 감지 테스트")
+    print("=" * 60)
+
+    # 1번은 탑에 머물다 8분에 미드로, 2번은 계속 미드
+    path = ['top'] * 8 + ['mid'] * 4
+    frames = []
+    for i, zone in enumerate(path):
+        x, y = LANE_POSITIONS[zone]
+        frames.append({
+            'timestamp': i * 60000,
+            'participantFrames': {
+                '1': {'position': {'x': x, 'y': y}, 'level': i + 1, 'wardScore': i},
+                '2': {'position': {'x': 7400, 'y': 7400}, 'level': i + 1}
+            },
+            'events': []
+        })
+
+    events = ReplayAnalyzer().analyze_frames(iter(frames))['roaming']
+    assert len(events) == 1
+    event = events[0]
+    assert (event.timestamp, event.from_lane, event.to_lane) == (480, 'top', 'mid')
+    assert (event.level, event.vision_score) == (9, 8)
+    print(f"✓ {event.timestamp}초: {event.from_lane} → {event.to_lane}")
+
+    print("\n✓ 모든 테스트 통과!")
+
+
+def test_positioning():
+    """포지셔닝 분석 테스트"""
+    print("\n" + "=" * 60)
+    print("포지셔닝 분석 테스트")
+    print("=" * 60)
+
+    frames = [
+        {
+            'timestamp': 60000,
+            'participantFrames': {
+                '1': {'position': {'x': 0, 'y': 0}},
+                '2': {'position': {'x': 3000, 'y': 4000}},
+                '6': {'position': {'x': 0, 'y': 8000}}
+            }
+        },
+        {
+            'timestamp': 1800000,
+            'participantFrames': {'6': {'position': {'x': 0, 'y': 8000}}}
+        }
+    ]
+
+    # 매치 정보가 없으면 1~5번 블루, 6~10번 레드
+    # 1번: 아군 5000, 적 8000 -> 5.5 / 2번: 아군 5000, 적 5000 -> 2.5
+    # 6번: 아군 없음(10000), 적 평균 6500 -> 1.5 / 후반 6번 혼자 -> 0
+    positioning = ReplayAnalyzer().analyze_frames(iter(frames))['positioning']
+    assert np.isclose(positioning['early_game'], 9.5 / 3)
+    assert positioning['mid_game'] == 0
+    assert positioning['late_game'] == 0
+    print(f"✓ 초반 안전도: {positioning['early_game']:.3f}")
+
+    # 매치 정보의 팀을 따름: 1, 6번 블루 / 2번 레드
+    # 1번: 아군 8000, 적 5000 -> 1 / 2번: 아군 없음, 적 5000 -> 0 / 6번: 아군 8000, 적 5000 -> 1
+    match_details = make_match_details({'1': 100, '2': 200, '6': 100})
+    positioning = ReplayAnalyzer().analyze_frames(iter(frames), match_details)['positioning']
+    assert np.isclose(positioning['early_game'], 2 / 3)
+    print(f"✓ 매치 정보 팀 기준 초반 안전도: {positioning['early_game']:.3f}")
+
+    print("\n✓ 모든 테스트 통과!")
+
+
+def test_zone_grid():
+    """존 조회 그리드 테스트"""
+    print("\n" + "=" * 60)
+    print("존 조회 그리드 테스트")
+    print("=" * 60)
+
+    analyzer = ReplayAnalyzer()
+
+    # 경계값(포함), 겹치는 영역(먼저 정의된 존 우선), 맵 밖까지 기존 비교와 같아야 함
+    def reference(x, y):
+        for zone, coords in ReplayAnalyzer.LANE_ZONES.items():
+            if (coords['x'][0] <= x <= coords['x'][1] and
+                    coords['y'][0] <= y <= coords['y'][1]):
+                return zone
+        return 'unknown'
+
+    rng = np.random.default_rng(0)
+    edges = [0, 2999, 3000, 3001, 5000, 5001, 9820, 11820, 14820, 14821]
+    xs = np.concatenate((rng.integers(-500, 15500, 5000), np.repeat(edges, len(edges))))
+    ys = np.concatenate((rng.integers(-500, 15500, 5000), np.tile(edges, len(edges))))
+    codes = analyzer._classify_zones(xs, ys)
+    for x, y, code in zip(xs, ys, codes):
+        assert analyzer.zone_names[code] == reference(x, y) == analyzer._get_zone(x, y)
+    print(f"✓ 좌표 {len(xs)}개 분류 일치")
+
+    # 세부 존 (본진, 라인, 강, 정글 사분면)
+    grid = ZoneGrid.summoners_rift()
+    expected = {
+        (500, 500): 'blue_base', (14300, 14300): 'red_base',
+        (700, 8000): 'top', (8000, 700): 'bot', (7410, 7410): 'mid',
+        (5000, 9800): 'river', (3500, 8000): 'blue_top_jungle',
+        (8000, 3500): 'blue_bot_jungle', (7000, 11000): 'red_top_jungle',
+        (11000, 7000): 'red_bot_jungle', (-10, 100): 'unknown'
+    }
+    for (x, y), zone in expected.items():
+        assert grid.zone_of(x, y) == zone, (x, y, grid.zone_of(x, y))
+    print(f"✓ 세부 존 {len(grid.names) - 1}개")
+
+    detailed = ReplayAnalyzer(zone_grid=grid)
+    assert detailed.zone_names[-1] == 'unknown'
+    assert detailed._get_zone(5000, 9800) == 'river'
+
+    print("\n✓ 모든 테스트 통과!")
+
+
+def test_batch_analysis():
+    """프로세스 풀 배치 분석 테스트"""
+    print("\n" + "=" * 60)
+    print("배치 분석 테스트")
+    print("=" * 60)
+
+    timelines = [make_timeline(30 + seed, seed) for seed in range(6)]
+    expected = [ReplayAnalyzer().analyze_match_timeline(timeline) for timeline in timelines]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # 딕셔너리, .json, .json.gz, 깨진 파일을 섞어서 넘김
+        sources = [timelines[0], timelines[1]]
+        for i, timeline in enumerate(timelines[2:], start=2):
+            path = os.path.join(tmp, f'KR_{i}.json' + ('.gz' if i % 2 else ''))
+            opener = gzip.open if i % 2 else open
+            with opener(path, 'wt', encoding='utf-8') as f:
+                json.dump(timeline, f)
+            sources.append(path)
+        broken = os.path.join(tmp, 'broken.json')
+        with open(broken, 'w', encoding='utf-8') as f:
+            f.write('{"info": ')
+        sources.append(broken)
+
+        batch = BatchAnalyzer(workers=2, chunksize=2).analyze(sources)
+
+    matches = batch['matches']
+    assert len(matches) == len(sources)
+    assert matches[-1] == {}
+    for result, reference in zip(matches, expected):
+        assert [(e.timestamp, e.from_lane, e.to_lane) for e in result['roaming']] == \
+            [(e.timestamp, e.from_lane, e.to_lane) for e in reference['roaming']]
+        assert result['positioning'] == reference['positioning']
+        assert result['objectives'] == reference['objectives']
+    print(f"✓ 매치별 결과 {len(matches) - 1}개 일치, 실패 1개")
+
+    aggregate = batch['aggregate']
+    assert (aggregate['match_count'], aggregate['failures']) == (6, 1)
+    assert len(aggregate['roaming']) == sum(len(r['roaming']) for r in expected)
+    assert sum(aggregate['roaming_routes'].values()) == len(aggregate['roaming'])
+    dragons = sum(len(r['objectives']['dragons']) for r in expected)
+    assert len(aggregate['objectives']['dragons']) == dragons
+    assert np.isclose(aggregate['cs_patterns']['avg_cs_per_min'],
+                      np.mean([r['cs_patterns']['avg_cs_per_min'] for r in expected]))
+    print(f"✓ 합산: 매치 {aggregate['match_count']}개, 로밍 {len(aggregate['roaming'])}회")
+
+    print("\n✓ 모든 테스트 통과!")
+
+
+def test_incremental_analysis():
+    """프레임 단위 스트리밍 분석기 테스트"""
+    print("\n" + "=" * 60)
+    print("스트리밍 분석기 테스트")
+    print("=" * 60)
+
+    analyzer = StreamingReplayAnalyzer()
+    assert analyzer.finalize() == {}
+
+    for seed in range(5):
+        timeline = make_timeline(45, seed)
+        frames = timeline['info']['frames']
+        # 위치가 빠진 프레임, 중간에 사라지는 참가자
+        for frame in frames[::4]:
+            frame['participantFrames']['4'].pop('position', None)
+        for frame in frames[20:]:
+            frame['participantFrames'].pop('9', None)
+
+        expected = ReplayAnalyzer().analyze_frames(iter(frames))
+
+        analyzer.reset()
+        live_events = []
+        for frame in frames:
+            live_events.extend(analyzer.feed(frame))
+        result = analyzer.finalize()
+
+        def roaming_key(events):
+            return [(e.timestamp, e.from_lane, e.to_lane, e.level, e.vision_score)
+                    for e in events]
+
+        assert roaming_key(result['roaming']) == roaming_key(expected['roaming'])
+        assert roaming_key(live_events) == roaming_key(expected['roaming'])
+        for section in ('positioning', 'cs_patterns'):
+            for key, value in expected[section].items():
+                assert np.isclose(result[section][key], value), (seed, section, key)
+        assert result['objectives'] == expected['objectives']
+
+        # 링 버퍼 외에는 프레임을 보관하지 않음
+        roaming = analyzer._accumulators[0]
+        assert all(len(recent) <= analyzer.ROAMING_WINDOW
+                   for recent in roaming.recent_zones.values())
+        print(f"✓ seed {seed}: 로밍 {len(result['roaming'])}회 일치")
+
+    print("\n✓ 모든 테스트 통과!")
+
+
+def test_pattern_store():
+    """패턴 저장소 누적/저장/조회 테스트"""
+    print("\n" + "=" * 60)
+    print("패턴 저장소 테스트")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'patterns.jsonl')
+        store = PatternStore(path)
+        analyzer = ReplayAnalyzer(pattern_store=store)
+
+        # 직접 모은 표본과 비교
+        safety_values = []
+        roam_total = 0
+        for seed in range(8):
+            timeline = make_timeline(40, seed)
+            result = analyzer.analyze_match_timeline(timeline)
+            roam_total += len(result['roaming'])
+
+            columns = TimelineColumns.from_timeline(timeline)
+            minutes = columns.timestamps // 60000
+            zones = analyzer._classify_zones(columns.x, columns.y)
+            scores = AnalysisContext(analyzer, columns).safety_scores
+            mid = (minutes == 10)[:, None] & (zones == analyzer.zone_names.index('mid'))
+            safety_values.extend(scores[mid & columns.present])
+
+        stats = store.get(ALL_CHAMPIONS, 10, 'mid')
+        assert stats.samples == len(safety_values)
+        assert np.isclose(stats.metrics['safety'].mean, np.mean(safety_values))
+        assert np.isclose(stats.metrics['safety'].variance, np.var(safety_values, ddof=1))
+        assert sum(stats.metrics['safety'].histogram) == len(safety_values)
+        assert store.match_count == 8
+        print(f"✓ 10분 mid 표본 {stats.samples}개, 안전도 평균 {stats.metrics['safety'].mean:.2f}")
+
+        def snapshot(s):
+            return {key: (v.samples, dict(v.roams), v.metrics['safety'].count,
+                          round(v.metrics['safety'].mean, 9),
+                          round(v.metrics['cs_per_min'].m2, 6))
+                    for key, v in s._stats.items()}
+
+        assert sum(v.roam_count for (c, _, _), v in store._stats.items()
+                   if c == ALL_CHAMPIONS) == roam_total
+
+        # 로그를 다시 읽은 결과와 스냅샷으로 줄인 결과가 같아야 함
+        reloaded = PatternStore(path)
+        assert reloaded.match_count == 8 and snapshot(reloaded) == snapshot(store)
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write('{"matches": 1, "entr')  # 중단된 쓰기
+        store.compact()
+        with open(path, encoding='utf-8') as f:
+            assert len(f.readlines()) == 1
+        compacted = PatternStore(path)
+        assert compacted.match_count == 8 and snapshot(compacted) == snapshot(store)
+        print(f"✓ 키 {len(store)}개 저장/복원")
+
+        # 같은 매치를 다시 분석해도 통계와 로그가 늘지 않음
+        before = snapshot(store)
+        analyzer.analyze_match_timeline(make_timeline(40, 3))
+        assert store.match_count == 8 and snapshot(store) == before
+        assert 'KR_3' in store and 'KR_8' not in store
+        with open(path, encoding='utf-8') as f:
+            assert len(f.readlines()) == 1
+        duplicate = PatternStore(os.path.join(tmp, 'duplicate.jsonl'))
+        ReplayAnalyzer(pattern_store=duplicate).analyze_match_timeline(make_timeline(40, 3))
+        with open(duplicate.path, encoding='utf-8') as f:
+            line = f.readline()
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(line)  # 다른 프로세스가 같은 매치를 덧붙인 경우
+        assert PatternStore(path).match_count == 8
+        print("✓ 같은 매치 중복 제외")
+
+        # 스냅샷 이후 로그가 compact_every 줄을 넘으면 자동으로 줄임
+        auto = PatternStore(os.path.join(tmp, 'auto.jsonl'), compact_every=3)
+        auto_analyzer = ReplayAnalyzer(pattern_store=auto)
+        for seed in range(8):
+            auto_analyzer.analyze_match_timeline(make_timeline(40, seed))
+        with open(auto.path, encoding='utf-8') as f:
+            assert len(f.readlines()) <= 3
+        reloaded = PatternStore(auto.path)
+        assert reloaded.match_count == 8 and snapshot(reloaded) == snapshot(store)
+        print("✓ 자동 compact")
+
+        # 같은 로그를 쓰는 두 저장소: 한쪽의 compact가 다른 쪽이 덧붙인 줄을 지우지 않음
+        shared_path = os.path.join(tmp, 'shared.jsonl')
+        first = PatternStore(shared_path, compact_every=3)
+        second = PatternStore(shared_path, compact_every=3)
+        first_analyzer = ReplayAnalyzer(pattern_store=first)
+        second_analyzer = ReplayAnalyzer(pattern_store=second)
+        for seed in range(4):
+            first_analyzer.analyze_match_timeline(make_timeline(40, seed))
+            second_analyzer.analyze_match_timeline(make_timeline(40, seed + 4))
+        first.compact()
+        def same_stats(a, b):
+            # 합치는 순서가 달라 부동소수점 오차가 생길 수 있음
+            if a.keys() != b.keys():
+                return False
+            return all(x[:3] == y[:3] and np.allclose(x[3:], y[3:]) for x, y in
+                       ((a[key], b[key]) for key in a))
+
+        reloaded = PatternStore(shared_path)
+        assert reloaded.match_count == 8 and same_stats(snapshot(reloaded), snapshot(store))
+        assert first.match_count == 8 and same_stats(snapshot(first), snapshot(store))
+        print("✓ 두 저장소가 같은 로그 공유")
+
+        # 표본이 충분한 키 중 로밍이 가장 많았던 (분, 존)으로 추천 조회
+        (_, minute, zone), best = max(
+            ((key, v) for key, v in store._stats.items()
+             if key[0] == ALL_CHAMPIONS and v.samples >= analyzer.MIN_PATTERN_SAMPLES),
+            key=lambda item: item[1].roam_count
+        )
+        recommendations = analyzer.get_roaming_recommendations({
+            'champion': 'Ahri', 'timestamp': minute * 60, 'zone': zone
+        })
+        assert any(best.top_destination in rec and '챌린저' in rec for rec in recommendations)
+        print(f"✓ 추천: {recommendations[-1]}")
+
+    print("\n✓ 모든 테스트 통과!")
+
+
+class KillCountAccumulator(Accumulator):
+    """테스트용 누적기: 챔피언 킬 수와 호출 횟수"""
+
+    name = 'kills'
+
+    def __init__(self, analyzer):
+        super().__init__(analyzer)
+        self.kills = 0
+        self.updates = 0
+
+    def update(self, context):
+        self.updates += 1
+        kill = context.columns.events['type'] == event_type_code('CHAMPION_KILL')
+        self.kills += int(kill.sum())
+
+    def result(self):
+        return {'kills': self.kills, 'updates': self.updates}
+
+
+def test_registered_accumulator():
+    """누적기 등록 테스트"""
+    print("\n" + "=" * 60)
+    print("누적기 등록 테스트")
+    print("=" * 60)
+
+    timeline = make_timeline(30, 3)
+    frames = timeline['info']['frames']
+    kills = sum(1 for frame in frames for event in frame['events']
+                if event['type'] == 'CHAMPION_KILL')
+
+    analyzer = ReplayAnalyzer()
+    analyzer.register_accumulator(KillCountAccumulator)
+    result = analyzer.analyze_match_timeline(timeline)
+    assert list(result) == ['roaming', 'positioning', 'cs_patterns', 'objectives', 'kills']
+    # 게임 전체를 한 묶음으로 한 번만 처리
+    assert result['kills'] == {'kills': kills, 'updates': 1}
+    print(f"✓ 일괄 분석: 킬 {kills}개, 갱신 1회")
+
+    streaming = StreamingReplayAnalyzer()
+    streaming.register_accumulator(KillCountAccumulator)
+    streaming.reset()
+    for frame in frames:
+        streaming.feed(frame)
+    assert streaming.finalize()['kills'] == {'kills': kills, 'updates': len(frames)}
+    print(f"✓ 스트리밍 분석: 프레임 {len(frames)}개")
+
+    print("\n✓ 모든 테스트 통과!")
+
+
+def test_participant_index():
+    """매치 상세 정보 기반 참가자 인덱스 테스트"""
+    print("\n" + "=" * 60)
+    print("참가자 인덱스 테스트")
+    print("=" * 60)
+
+    teams = {str(pid): 100 if pid % 2 else 200 for pid in range(1, 11)}
+    champions = {str(pid): f'Champ{pid}' for pid in range(1, 11)}
+    match_details = make_match_details(teams, champions)
+
+    index = ParticipantIndex.from_match_details(match_details)
+    assert len(index) == 10
+    info = index.get(3)
+    assert (info.team_id, info.champion, info.role, info.puuid) == \
+        (100, 'Champ3', 'MID', 'puuid-3')
+    assert index.find_by_puuid('puuid-8').participant_id == '8'
+
+    # 아군/적군 마스크: 자기 자신과 팀을 모르는 참가자('11')는 제외
+    allies, enemies = index.team_masks(['1', '2', '3', '11'])
+    assert allies.tolist() == [[False, False, True, False], [False] * 4,
+                               [True, False, False, False], [False] * 4]
+    assert enemies.tolist() == [[False, True, False, False], [True, False, True, False],
+                                [False, True, False, False], [False] * 4]
+
+    # 매치 정보 없이 ID로 추정
+    fallback = ParticipantIndex.from_participant_ids(['1', '5', '6'])
+    assert fallback.team_ids(['1', '5', '6']).tolist() == [100, 100, 200]
+    print("✓ 팀/챔피언/포지션 조회")
+
+    # 로밍 이벤트에 챔피언 이름이 들어가야 함
+    timeline = make_timeline(40, 1)
+    result = ReplayAnalyzer().analyze_match_timeline(timeline, match_details)
+    assert result['roaming']
+    assert all(event.champion.startswith('Champ') for event in result['roaming'])
+    assert all(event.champion == 'Unknown'
+               for event in ReplayAnalyzer().analyze_match_timeline(timeline)['roaming'])
+
+    batch = BatchAnalyzer(workers=1).analyze([(timeline, match_details)])
+    assert [e.champion for e in batch['matches'][0]['roaming']] == \
+        [e.champion for e in result['roaming']]
+
+    streaming = StreamingReplayAnalyzer(participants=index)
+    for frame in timeline['info']['frames']:
+        streaming.feed(frame)
+    streamed = streaming.finalize()
+    assert [e.champion for e in streamed['roaming']] == [e.champion for e in result['roaming']]
+    for phase, score in result['positioning'].items():
+        assert np.isclose(streamed['positioning'][phase], score)
+    print(f"✓ 로밍 {len(result['roaming'])}회 챔피언 표시")
+
+    print("\n✓ 모든 테스트 통과!")
+
+
+def test_event_index():
+    """이벤트 인덱스 구간 질의와 로밍 성공 판정 테스트"""
+    print("\n" + "=" * 60)
+    print("이벤트 인덱스 테스트")
+    print("=" * 60)
+
+    timeline = make_timeline(40, 4)
+    frames = timeline['info']['frames']
+    columns = TimelineColumns.from_timeline(timeline)
+    index = EventIndex.from_columns(columns)
+    kills = [event for frame in frames for event in frame['events']
+             if event['type'] == 'CHAMPION_KILL']
+
+    # 이진 탐색 결과가 전체 이벤트를 훑은 결과와 같아야 함
+    for pid in range(1, 11):
+        for center in range(0, 40 * 60000, 45000):
+            expected = sorted(
+                event['timestamp'] for event in kills
+                if abs(event['timestamp'] - center) <= 20000 and
+                pid in [event['killerId'], event['victimId']] + event['assistingParticipantIds']
+            )
+            rows = index.kills_involving(pid, center, 20000)
+            assert sorted(index.events['timestamp'][rows].tolist()) == expected, (pid, center)
+
+    dragons = index.in_window('ELITE_MONSTER_KILL', 5 * 60000, 19 * 60000, 'DRAGON')
+    assert (index.events['timestamp'][dragons] // 60000).tolist() == [5, 11, 17]
+    assert len(index.in_window('BUILDING_KILL', 0, 10 * 60000)) == 0
+    print(f"✓ 킬 {len(kills)}개 구간 질의")
+
+    # 로밍 10초 뒤(다음 프레임)에 킬을 추가해 성공으로 판정되는지 확인
+    teams = {str(pid): 100 if pid <= 5 else 200 for pid in range(1, 11)}
+    champions = {str(pid): f'Champ{pid}' for pid in range(1, 11)}
+    match_details = make_match_details(teams, champions)
+    roams = ReplayAnalyzer().analyze_match_timeline(timeline, match_details)['roaming']
+    for event in roams[::2]:
+        frame = event.timestamp // 60 + 1
+        if frame < len(frames):
+            frames[frame]['events'].append({
+                'type': 'CHAMPION_KILL', 'timestamp': event.timestamp * 1000 + 10000,
+                'killerId': int(event.champion[5:]), 'victimId': 1,
+                'assistingParticipantIds': [], 'position': {'x': 7000, 'y': 7000}
+            })
+    kills = [event for frame in frames for event in frame['events']
+             if event['type'] == 'CHAMPION_KILL']
+
+    result = ReplayAnalyzer().analyze_match_timeline(timeline, match_details)
+    for event in result['roaming']:
+        pid = int(event.champion[5:])
+        expected = any(
+            abs(kill['timestamp'] - event.timestamp * 1000) <= 20000 and
+            pid in [kill['killerId']] + kill['assistingParticipantIds']
+            for kill in kills
+        )
+        assert event.success == expected, event
+    successes = sum(event.success for event in result['roaming'])
+    assert successes > 0
+
+    # 스트리밍에서도 다음 프레임의 킬로 성공 여부가 갱신되어야 함
+    streaming = StreamingReplayAnalyzer(participants=ParticipantIndex.from_match_details(
+        match_details))
+    for frame in frames:
+        streaming.feed(frame)
+    streamed = streaming.finalize()
+    assert streamed['roaming'] == result['roaming']
+    assert streamed['objectives'] == result['objectives']
+    print(f"✓ 로밍 {len(result['roaming'])}회 중 {successes}회 성공")
+
+    print("\n✓ 모든 테스트 통과!")
+
+
+def test_roaming_event_table():
+    """구조화 배열 기반 로밍 이벤트 테이블 테스트"""
+    print("\n" + "=" * 60)
+    print("로밍 이벤트 테이블 테스트")
+    print("=" * 60)
+
+    champions = {str(pid): f'Champ{pid}' for pid in range(1, 11)}
+    match_details = make_match_details({str(pid): 100 if pid <= 5 else 200
+                                        for pid in range(1, 11)}, champions)
+    analyzer = ReplayAnalyzer()
+    matches = [analyzer.analyze_match_timeline(make_timeline(40, seed), match_details)['roaming']
+               for seed in range(3)]
+    events = [event for roaming in matches for event in roaming]
+
+    assert not hasattr(events[0], '__dict__')
+    table = RoamingEventTable.from_events(events)
+    assert len(table) == len(events)
+    assert table.to_events() == events
+    assert table.records.itemsize == 20
+    print(f"✓ 이벤트 {len(table)}개 저장 ({table.records.nbytes} bytes)")
+
+    # 필터링 결과가 이벤트 목록을 직접 거른 것과 같아야 함
+    champ2 = table.filter(champion='Champ2', minute=range(5, 20))
+    assert champ2.to_events() == [e for e in events
+                                if e.champion == 'Champ2' and 5 <= e.timestamp // 60 < 20]
+    assert len(table.filter(champion='Nobody')) == 0
+    assert len(table.filter(success=True)) == sum(e.success for e in events)
+
+    routes = table.counts('from_lane', 'to_lane')
+    assert routes == dict(Counter((e.from_lane, e.to_lane) for e in events))
+    for (champion, minute), group in table.group_by('champion', 'minute').items():
+        assert group.to_events() == [e for e in events
+                                     if e.champion == champion and e.timestamp // 60 == minute]
+    print(f"✓ 경로 {len(routes)}종, 필터/그룹화 일치")
+
+    # 따로 만든 테이블을 합쳐도 문자열 코드가 맞아야 함
+    parts = [RoamingEventTable.from_events(reversed(roaming)) for roaming in matches]
+    merged = RoamingEventTable.concat(parts)
+    assert merged.to_events() == [e for roaming in matches for e in reversed(roaming)]
+    assert merged.counts('to_lane') == table.counts('to_lane')
+
+    batch = BatchAnalyzer(workers=1).analyze([(make_timeline(40, seed), match_details)
+                                              for seed in range(3)])
+    assert batch['aggregate']['roaming'].to_events() == events
+    assert batch['aggregate']['roaming_routes'] == routes
+    print("✓ 테이블 병합")
+
+    print("\n✓ 모든 테스트 통과!")
+
+
+if __name__ == '__main__':
+    test_streaming_analysis()
+    test_timeline_columns()
+    test_roaming_detection()
+    test_positioning()
+    test_zone_grid()
+    test_batch_analysis()
+    test_incremental_analysis()
+    test_pattern_store()
+    test_registered_accumulator()
+    test_participant_index()
+    test_event_index()
+    test_roaming_event_table()
@@ -0,0 +1,547 @@
+"""
+Riot API 클라이언트 테스트
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import asyncio
+import json
+import tempfile
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from aiohttp import web
+
+from src.api.async_client import AsyncRiotClient
+from src.api.cache import TTLCache
+from src.api.match_store import MatchStore
+from src.api.riot_client import RiotAPIClient
+from src.api.rate_limiter import RateLimiter, parse_rate_limit_header
+from src.api.retry import RetryPolicy
+from src.api.singleflight import AsyncSingleFlight
+from src.api.timeline_stream import TimelineTruncatedError
+
+
+class FakeClock:
+    """테스트용 가짜 시계"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def test_rate_limiter():
+    """레이트 리밋 스케줄러 테스트"""
+    print("=" * 60)
+    print("레이트 리밋 스케줄러 테스트")
+    print("=" * 60)
+
+    print("\n1. 헤더 파싱")
+    assert parse_rate_limit_header("20:1,100:120") == [(20, 1), (100, 120)]
+    assert parse_rate_limit_header(None) == []
+    print("✓ 20:1,100:120 파싱")
+
+    print("\n2. 버킷이 빌 때까지는 대기하지 않음")
+    clock = FakeClock()
+    limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+    for _ in range(20):
+        limiter.acquire('kr', 'summoner-v4.by-puuid')
+    assert clock.now == 0.0
+    print(f"  20회 요청 후 경과 시간: {clock.now:.1f}초")
+
+    print("\n3. 초당 제한 초과 시 창이 끝날 때까지 대기")
+    limiter.acquire('kr', 'summoner-v4.by-puuid')
+    assert clock.now == 1.0
+    print(f"  21번째 요청 경과 시간: {clock.now:.1f}초")
+
+    print("\n4. 라우팅 호스트별 독립 버킷")
+    limiter.acquire('asia', 'match-v5.match')
+    assert clock.now == 1.0
+    print("✓ asia 호스트는 kr 사용량과 무관")
+
+    print("\n5. 메서드 제한 헤더 반영")
+    limiter.update_from_headers('asia', 'match-v5.timeline', {
+        'X-App-Rate-Limit': '20:1,100:120',
+        'X-Method-Rate-Limit': '2:10',
+        'X-Method-Rate-Limit-Count': '2:10',
+    })
+    limiter.acquire('asia', 'match-v5.timeline')
+    assert clock.now == 11.0
+    print(f"  메서드 버킷 소진 후 경과 시간: {clock.now:.1f}초")
+
+    print("\n6. 2분 제한 (100:120)")
+    clock = FakeClock()
+    limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+    for _ in range(101):
+        limiter.acquire('kr', 'league-v4.challenger')
+    assert clock.now == 120.0
+    print(f"  101번째 요청 경과 시간: {clock.now:.1f}초")
+
+    print("\n7. 메서드만 막기")
+    clock = FakeClock()
+    limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+    limiter.block('asia', 5, method='match-v5.timeline')
+    assert limiter.reserve('asia', 'match-v5.timeline') == 5
+    assert limiter.reserve('asia', 'match-v5.match') == 0
+    assert limiter.reserve('kr', 'match-v5.timeline') == 0
+    print("✓ 같은 호스트의 다른 메서드는 막히지 않음")
+
+    print("\n✓ 모든 테스트 통과!")
+
+
+async def _run_async_client():
+    state = {'active': 0, 'peak': 0}
+
+    async def handle_timeline(request):
+        state['active'] += 1
+        state['peak'] = max(state['peak'], state['active'])
+        await asyncio.sleep(0.05)
+        state['active'] -= 1
+        match_id = request.match_info['match_id']
+        if match_id == 'KR_14':
+            return web.Response(text='{"metadata": ', content_type='application/json')
+        if match_id == 'KR_15':
+            return web.Response(text='<html></html>', content_type='text/html')
+        return web.json_response({'metadata': {'matchId': match_id}})
+
+    app = web.Application()
+    app.router.add_get('/lol/match/v5/matches/{match_id}/timeline', handle_timeline)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    try:
+        async with AsyncRiotClient(api_key='test', max_concurrency=8,
+                                   use_match_store=False) as client:
+            client.BASE_URLS = {'kr': f'http://127.0.0.1:{port}',
+                                'asia': f'http://127.0.0.1:{port}'}
+            match_ids = [f'KR_{i}' for i in range(16)]
+            timelines = await client.get_timelines(match_ids)
+            failures = client.get_request_stats('match-v5.timeline')['failures']
+    finally:
+        await runner.cleanup()
+
+    return timelines, state['peak'], failures
+
+
+async def _run_blocked_host():
+    async def handle(request):
+        return web.json_response({'path': request.path})
+
+    app = web.Application()
+    app.router.add_get('/{tail:.*}', handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    try:
+        async with AsyncRiotClient(api_key='test', max_concurrency=2,
+                                   use_match_store=False) as client:
+            client.BASE_URLS = {'kr': f'http://127.0.0.1:{port}',
+                                'asia': f'http://127.0.0.1:{port}'}
+            client.rate_limiter.block('kr', 0.5)
+            blocked = [asyncio.ensure_future(client.get_summoner_by_puuid(f'puuid-{i}'))
+                       for i in range(4)]
+            await asyncio.sleep(0)
+            start = time.monotonic()
+            await client.get_match_details('KR_1')
+            elapsed = time.monotonic() - start
+            await asyncio.gather(*blocked)
+    finally:
+        await runner.cleanup()
+
+    return elapsed
+
+
+def test_async_client():
+    """비동기 클라이언트 동시 다운로드 테스트"""
+    print("\n" + "=" * 60)
+    print("비동기 클라이언트 테스트")
+    print("=" * 60)
+
+    timelines, peak, failures = asyncio.run(_run_async_client())
+
+    assert len(timelines) == 16
+    assert timelines['KR_3']['metadata']['matchId'] == 'KR_3'
+    # 해석할 수 없는 응답은 예외 대신 빈 결과
+    assert timelines['KR_14'] == {} and timelines['KR_15'] == {}
+    assert failures == 2
+    assert 1 < peak <= 8
+    print(f"✓ 타임라인 {len(timelines)}개 다운로드, 최대 동시 요청 {peak}개")
+
+    # 막힌 호스트를 기다리는 요청이 다른 호스트 요청의 자리를 차지하지 않음
+    elapsed = asyncio.run(_run_blocked_host())
+    assert elapsed < 0.3, elapsed
+    print(f"✓ kr 호스트가 막힌 동안 asia 요청 {elapsed * 1000:.0f}ms")
+
+    print("\n✓ 모든 테스트 통과!")
+
+
+class FakeRiotHandler(BaseHTTPRequestHandler):
+    """keep-alive를 지원하는 가짜 Riot API 핸들러"""
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.server.client_ports.add(self.client_address[1])
+        self.server.paths.append(self.path)
+        result = self.server.responder(self.path)
+        status, data, headers = result if isinstance(result, tuple) else (200, result, {})
+        body = data if isinstance(data, bytes) else json.dumps(data).encode()
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_fake_server(responder=None):
+    """가짜 서버를 띄우고 (server, base_url)을 반환합니다."""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FakeRiotHandler)
+    server.client_ports = set()
+    server.paths = []
+    server.responder = responder or (lambda path: {'path': path})
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f'http://127.0.0.1:{server.server_address[1]}'
+
+
+def make_test_client(base_url, **kwargs):
+    """가짜 서버를 바라보는 RiotAPIClient를 만듭니다."""
+    kwargs.setdefault('use_match_store', False)
+    client = RiotAPIClient(api_key='test', **kwargs)
+    client.BASE_URLS = {'kr': base_url, 'asia': base_url}
+    return client
+
+
+def test_connection_pooling():
+    """커넥션 재사용 테스트"""
+    print("\n" + "=" * 60)
+    print("커넥션 풀링 테스트")
+    print("=" * 60)
+
+    server, base_url = start_fake_server()
+    try:
+        with make_test_client(base_url) as client:
+            for i in range(10):
+                client.get_match_details(f'KR_{i}')
+        pooled = len(server.client_ports)
+
+        server.client_ports.clear()
+        with make_test_client(base_url, keep_alive=False) as client:
+            for i in range(10):
+                client.get_match_details(f'KR_{i}')
+        unpooled = len(server.client_ports)
+    finally:
+        server.shutdown()
+
+    assert pooled == 1
+    assert unpooled == 10
+    print(f"✓ keep-alive: 연결 {pooled}개, keep-alive 끔: 연결 {unpooled}개")
+
+    print("\n✓ 모든 테스트 통과!")
+
+
+def test_match_store():
+    """로컬 매치 저장소 테스트"""
+    print("\n" + "=" * 60)
+    print("로컬 매치 저장소 테스트")
+    print("=" * 60)
+
+    server, base_url = start_fake_server()
+    try:
+        with tempfile.TemporaryDirectory() as root:
+            store = MatchStore(root)
+            client = make_test_client(base_url, match_store=store,
+                                      use_match_store=True)
+
+            print("\n1. 첫 분석: 네트워크에서 받아 저장")
+            for i in range(3):
+                client.get_match_details(f'KR_{i}')
+                client.get_match_timeline(f'KR_{i}')
+            first_calls = len(server.paths)
+            assert first_calls == 6
+            assert os.path.exists(store.path_for('KR_0', 'timeline'))
+            print(f"  API 호출 {first_calls}회, 통계: {client.get_cache_stats()}")
+
+            print("\n2. 같은 매치 재분석: API 호출 없음")
+            timeline = client.get_match_timeline('KR_1')
+            client.get_match_details('KR_1')
+            assert len(server.paths) == first_calls
+            assert timeline['path'].endswith('/KR_1/timeline')
+            stats = client.get_cache_stats()
+            assert stats == {'hits': 2, 'misses': 6, 'writes': 6}
+            print(f"  API 호출 {len(server.paths) - first_calls}회, 통계: {stats}")
+            client.close()
+    finally:
+        server.shutdown()
+
+    print("\n✓ 모든 테스트 통과!")
+
+
+def test_response_cache():
+    """메모리 응답 캐시 테스트"""
+    print("\n" + "=" * 60)
+    print("메모리 응답 캐시 테스트")
+    print("=" * 60)
+
+    print("\n1. TTL 만료와 LRU 제거")
+    clock = FakeClock()
+    cache = TTLCache(maxsize=2, clock=clock)
+    cache.set('a', 1, ttl=10)
+    cache.set('b', 2, ttl=100)
+    assert cache.get('a') == 1
+    cache.set('c', 3, ttl=100)  # 가장 오래 안 쓴 b 제거
+    assert cache.get('b') is None
+    clock.sleep(10)
+    assert cache.get('a') is None
+    assert cache.get('c') == 3
+    print(f"✓ 통계: {cache.get_stats()}")
+
+    print("\n2. 클라이언트 반복 조회는 네트워크를 타지 않음")
+    server, base_url = start_fake_server()
+    try:
+        with make_test_client(base_url) as client:
+            for _ in range(5):
+                client.get_summoner_by_puuid('puuid-1')
+                client.get_match_history('puuid-1', count=5)
+            assert len(server.paths) == 2
+
+            client.get_match_history('puuid-1', count=10)
+            assert len(server.paths) == 3
+
+            removed = client.invalidate_cache(method='match-v5.ids')
+            assert removed == 2
+            client.get_match_history('puuid-1', count=5)
+            client.get_summoner_by_puuid('puuid-1')
+            assert len(server.paths) == 4
+            print(f"  API 호출 {len(server.paths)}회, "
+                  f"통계: {client.get_response_cache_stats()}")
+    finally:
+        server.shutdown()
+
+    print("\n✓ 모든 테스트 통과!")
+
+
+def test_retry_policy():
+    """429/5xx 재시도 테스트"""
+    print("\n" + "=" * 60)
+    print("재시도 정책 테스트")
+    print("=" * 60)
+
+    print("\n1. 백오프 계산")
+    policy = RetryPolicy(backoff_base=0.5, jitter=0)
+    assert policy.get_delay(0) == 0.5
+    assert policy.get_delay(3) == 4.0
+    assert policy.get_delay(0, retry_after='7') == 7.0
+    assert policy.get_delay(3, status=429) == policy.default_retry_after
+    assert policy.get_delay(3, status=503) == 4.0
+    assert 25 < policy.get_delay(0, formatdate(time.time() + 30, usegmt=True), 429) <= 30
+    assert policy.get_delay(0, formatdate(time.time() - 30, usegmt=True), 429) == 0.0
+    assert policy.get_delay(0, 'soon', 429) == policy.default_retry_after
+    assert not policy.should_retry(404, 0)
+    assert not policy.should_retry(503, policy.max_retries)
+    print("✓ 지수 백오프, Retry-After(초/HTTP 날짜/없음), 재시도 한도")
+
+    print("\n2. X-Rate-Limit-Type별 429 처리 범위")
+    clock = FakeClock()
+    client = make_test_client('http://127.0.0.1:1',
+                              rate_limiter=RateLimiter(clock=clock, sleep=clock.sleep),
+                              retry_policy=policy)
+    limiter = client.rate_limiter
+    assert client._retry_delay('asia', 'match-v5.timeline', 429, 0, '', '5', 'service') == 5
+    assert client._retry_delay('asia', 'match-v5.timeline', 429, 0, '', '5', None) == 5
+    assert limiter.reserve('asia', 'match-v5.timeline') == 0
+    assert client._retry_delay('asia', 'match-v5.timeline', 429, 0, '', '5', 'method') == 0
+    assert limiter.reserve('asia', 'match-v5.timeline') == 5
+    assert limiter.reserve('asia', 'match-v5.match') == 0
+    assert client._retry_delay('asia', 'match-v5.timeline', 429, 0, '', '5', 'application') == 0
+    assert limiter.reserve('asia', 'match-v5.match') == 5
+    assert limiter.reserve('kr', 'summoner-v4.by-puuid') == 0
+    client.close()
+    print("✓ service: 이 요청만, method: 메서드만, application: 호스트 전체")
+
+    print("\n3. 429와 503 이후 데이터를 잃지 않음")
+    responses = [
+        (429, {}, {'Retry-After': '0'}),
+        (503, {}, {}),
+        (200, {'metadata': {'matchId': 'KR_1'}}, {}),
+    ]
+    server, base_url = start_fake_server(lambda path: responses.pop(0))
+    fast = RetryPolicy(backoff_base=0.001, jitter=0)
+    try:
+        with make_test_client(base_url, retry_policy=fast) as client:
+            match = client.get_match_details('KR_1')
+            stats = client.get_request_stats('match-v5.match')
+    finally:
+        server.shutdown()
+
+    assert match['metadata']['matchId'] == 'KR_1'
+    assert stats['requests'] == 3
+    assert stats['retries'] == 2
+    assert stats['throttled'] == 1
+    assert stats['server_errors'] == 1
+    assert stats['failures'] == 0
+    print(f"  통계: {stats}")
+
+    print("\n4. 404는 재시도하지 않음")
+    server, base_url = start_fake_server(lambda path: (404, {}, {}))
+    try:
+        with make_test_client(base_url, retry_policy=fast) as client:
+            assert client.get_match_details('KR_404') == {}
+            stats = client.get_request_stats('match-v5.match')
+    finally:
+        server.shutdown()
+    assert stats['requests'] == 1 and stats['failures'] == 1
+    print(f"  통계: {stats}")
+
+    print("\n✓ 모든 테스트 통과!")
+
+
+async def _run_cancelled_leader():
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(True)
+        await asyncio.sleep(0.05)
+        return 'data'
+
+    leader = asyncio.ensure_future(flight.do('KR_1', fetch))
+    await asyncio.sleep(0)
+    followers = [asyncio.ensure_future(flight.do('KR_1', fetch)) for _ in range(2)]
+    await asyncio.sleep(0)
+    leader.cancel()
+    results = await asyncio.gather(*followers, return_exceptions=True)
+    assert leader.cancelled()
+    return results, len(calls)
+
+
+def test_request_coalescing():
+    """동시 요청 병합 테스트"""
+    print("\n" + "=" * 60)
+    print("동시 요청 병합 테스트")
+    print("=" * 60)
+
+    def slow_responder(path):
+        time.sleep(0.2)
+        return {'path': path}
+
+    server, base_url = start_fake_server(slow_responder)
+    try:
+        with make_test_client(base_url) as client:
+            results = []
+            threads = [
+                threading.Thread(
+                    target=lambda: results.append(client.get_match_details('KR_1'))
+                )
+                for _ in range(8)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            stats = client.get_request_stats('match-v5.match')
+    finally:
+        server.shutdown()
+
+    assert len(server.paths) == 1
+    assert len(results) == 8
+    assert all(result is results[0] for result in results)
+    assert stats['requests'] == 1 and stats['coalesced'] == 7
+    print(f"✓ 동시 호출 8개 → 실제 요청 {len(server.paths)}개, 통계: {stats}")
+
+    print("\n2. 비동기: 처음 호출한 쪽이 취소되어도 나머지는 결과를 받음")
+    results, calls = asyncio.run(_run_cancelled_leader())
+    assert results == ['data', 'data'] and calls == 1
+    print(f"✓ 실제 요청 {calls}개, 결과: {results}")
+
+    print("\n✓ 모든 테스트 통과!")
+
+
+def test_timeline_streaming():
+    """타임라인 스트리밍 다운로드 테스트"""
+    print("\n" + "=" * 60)
+    print("타임라인 스트리밍 테스트")
+    print("=" * 60)
+
+    frames = [
+        {'timestamp': i * 60000, 'participantFrames': {'1': {'level': i}}, 'events': []}
+        for i in range(30)
+    ]
+    timeline = {'metadata': {'matchId': 'KR_1'},
+                'info': {'frameInterval': 60000, 'frames': frames, 'gameId': 1}}
+
+    server, base_url = start_fake_server(lambda path: timeline)
+    try:
+        with tempfile.TemporaryDirectory() as root:
+            store = MatchStore(root)
+            client = make_test_client(base_url, match_store=store,
+                                      use_match_store=True)
+
+            print("\n1. 네트워크에서 프레임 단위로 파싱하며 저장")
+            streamed = list(client.iter_match_timeline_frames('KR_1'))
+            assert streamed == frames
+            assert store.get('KR_1', 'timeline') == timeline
+            print(f"✓ 프레임 {len(streamed)}개, 저장소 기록 완료")
+
+            print("\n2. 두 번째는 저장소에서 스트리밍")
+            assert list(client.iter_match_timeline_frames('KR_1')) == frames
+            assert len(server.paths) == 1
+            print(f"✓ API 호출 {len(server.paths)}회")
+            client.close()
+    finally:
+        server.shutdown()
+
+    print("\n3. 프레임 도중 끊긴 스트림은 예외로 알림")
+    body = json.dumps(timeline).encode()
+    truncated = body[:body.index(b'{"timestamp": 180000')]
+    server, base_url = start_fake_server(lambda path: truncated)
+    try:
+        with tempfile.TemporaryDirectory() as root:
+            store = MatchStore(root)
+            client = make_test_client(base_url, match_store=store,
+                                      use_match_store=True)
+            streamed = []
+            try:
+                for frame in client.iter_match_timeline_frames('KR_2'):
+                    streamed.append(frame)
+                raise AssertionError("끊긴 타임라인이 정상 종료됨")
+            except TimelineTruncatedError:
+                pass
+            assert streamed == frames[:3]
+            assert store.get('KR_2', 'timeline') is None
+            assert client.get_request_stats('match-v5.timeline')['failures'] == 1
+            print(f"✓ 프레임 {len(streamed)}개 이후 TimelineTruncatedError, 저장소 기록 안 함")
+            client.close()
+    finally:
+        server.shutdown()
+
+    print("\n✓ 모든 테스트 통과!")
+
+
+if __name__ == '__main__':
+    test_rate_limiter()
+    test_async_client()
+    test_connection_pooling()
+    test_match_store()
+    test_response_cache()
+    test_retry_policy()
+    test_request_coalescing()
+    test_timeline_streaming()